@@ -0,0 +1,75 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+
+"""Compares the hit ratio of the LRU cache and the W-TinyLFU cache on synthetic traces.
+
+The zipf trace looks up 100000 keys with a skewed popularity. The zipf with scans trace interleaves it with batch jobs
+that walk through 5000 ids looked up once, after every 10000 lookups. The shifting trace moves the popular keys halfway.
+
+Run with: python benchmarks/bench_cache_hit_ratio.py
+"""
+
+import itertools
+import random
+import time
+from typing import Callable
+
+from meatie import INF, Cache, TinyLfuCache
+
+LOOKUPS = 200_000
+KEYS = 100_000
+
+
+def zipf(count: int, seed: int, offset: int = 0) -> list[str]:
+    """Returns keys drawn from the Zipf distribution with the exponent of 0.9."""
+    weights = list(itertools.accumulate(1 / rank**0.9 for rank in range(1, KEYS + 1)))
+    ranks = random.Random(seed).choices(range(KEYS), cum_weights=weights, k=count)
+    return [f"item{rank + offset}" for rank in ranks]
+
+
+def zipf_with_scans() -> list[str]:
+    """Returns the zipf trace interleaved with batch jobs that look up one-off ids."""
+    trace: list[str] = []
+    for index, key in enumerate(zipf(LOOKUPS, seed=1)):
+        if index % 10_000 == 0:
+            trace.extend(f"batch{index}-{item}" for item in range(5_000))
+        trace.append(key)
+    return trace
+
+
+def shifting() -> list[str]:
+    """Returns the zipf trace whose popular keys change halfway."""
+    return zipf(LOOKUPS // 2, seed=1) + zipf(LOOKUPS // 2, seed=2, offset=KEYS // 2)
+
+
+def replay(cache: Cache, trace: list[str]) -> float:
+    """Returns the hit ratio of the cache, which stores every key that was not found."""
+    hits = 0
+    for key in trace:
+        if cache.load(key) is None:
+            cache.store(key, True, ttl=INF)
+        else:
+            hits += 1
+    return hits / len(trace)
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    traces: dict[str, Callable[[], list[str]]] = {
+        "zipf": lambda: zipf(LOOKUPS, seed=1),
+        "zipf with scans": zipf_with_scans,
+        "shifting": shifting,
+    }
+    for trace_name, create_trace in traces.items():
+        trace = create_trace()
+        print(f"{trace_name} ({len(trace)} lookups):")
+        for size in (1_000, 10_000):
+            for name, cache_type in (("lru", Cache), ("w-tinylfu", TinyLfuCache)):
+                started = time.perf_counter()
+                hit_ratio = replay(cache_type(max_size=size), trace)
+                elapsed = (time.perf_counter() - started) / len(trace)
+                print(f"  {name:<9} {size:>6} entries: hit ratio {hit_ratio:6.1%}, {elapsed * 1e6:.1f} us per lookup")
+
+
+if __name__ == "__main__":
+    main()
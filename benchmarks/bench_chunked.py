@@ -0,0 +1,118 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+
+"""Measures how long decoding a large list[Model] response blocks the event loop with and without the chunked option.
+
+A ticker task records the delay of waking up from a 1 ms sleep while the response is decoded. The maximum delay is the
+latency that concurrent requests would observe. With the chunked option, the remaining delays are dominated by full
+garbage collections, which take longer as more decoded objects are alive.
+
+Run with: python benchmarks/bench_chunked.py
+"""
+
+import asyncio
+import json
+import time
+from typing import Any, Optional
+
+import pydantic
+
+from meatie.internal.adapter import ChunkedJsonAdapter, TypeAdapter, get_adapter
+
+SIZES = (10_000, 100_000)
+CHUNK_SIZES = (16_384, 65_536, 262_144)
+
+
+class Owner(pydantic.BaseModel):
+    """Owner of an item."""
+
+    id: int
+    email: str
+
+
+class Item(pydantic.BaseModel):
+    """Item returned by the API."""
+
+    id: int
+    name: str
+    active: bool
+    price: float
+    tags: list[str]
+    owner: Optional[Owner]
+
+
+class StubAsyncResponse:
+    """Response holding the body in memory."""
+
+    def __init__(self, content: bytes) -> None:
+        """Creates a response with the given body."""
+        self.content = content
+
+    async def read(self) -> bytes:
+        """Returns the body."""
+        return self.content
+
+    async def text(self) -> str:
+        """Returns the body as text."""
+        return self.content.decode()
+
+    async def json(self) -> Any:
+        """Returns the body decoded from JSON."""
+        return json.loads(self.content)
+
+
+def create_content(size: int) -> bytes:
+    """Returns a JSON array of items."""
+    records = [
+        {
+            "id": index,
+            "name": f"item {index}",
+            "active": index % 2 == 0,
+            "price": index / 100,
+            "tags": ["a", "b", "c"],
+            "owner": {"id": index % 100, "email": f"user{index % 100}@example.com"},
+        }
+        for index in range(size)
+    ]
+    return json.dumps(records).encode()
+
+
+async def measure(adapter: TypeAdapter[Any], content: bytes) -> tuple[float, float]:
+    """Returns the time of decoding the response and the maximum delay of the ticker task."""
+    delays = []
+
+    async def tick() -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            delays.append(time.perf_counter() - start - 0.001)
+
+    ticker = asyncio.ensure_future(tick())
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    await adapter.from_async_response(StubAsyncResponse(content))  # type: ignore[arg-type]
+    elapsed = time.perf_counter() - start
+    await asyncio.sleep(0.01)
+    ticker.cancel()
+    return elapsed, max(delays)
+
+
+async def main() -> None:
+    """Runs the benchmark."""
+    adapter = get_adapter(list[Item])
+    for size in SIZES:
+        content = create_content(size)
+        print(f"list[Item] with {size} items ({len(content) / 1e6:.1f} MB):")
+        elapsed, delay = await measure(adapter, content)
+        print(f"  single call:    decoding {elapsed * 1e3:7.1f} ms, max event loop delay {delay * 1e3:7.1f} ms")
+        for chunk_size in CHUNK_SIZES:
+            chunked = ChunkedJsonAdapter(adapter, threshold=0, chunk_size=chunk_size)  # type: ignore[arg-type]
+            elapsed, delay = await measure(chunked, content)
+            print(
+                f"  {chunk_size // 1024:>4} KiB chunks: decoding {elapsed * 1e3:7.1f} ms,"
+                f" max event loop delay {delay * 1e3:7.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,99 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+
+"""Compares the import time of a synthetic client with many eager and lazy endpoints.
+
+Each measurement imports the generated module in a fresh interpreter. The baseline module declares the same models
+without the client, so the difference is the time spent on creating the endpoints.
+
+Run with: python benchmarks/bench_import_time.py
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ENDPOINTS = 600
+MODELS = 100
+REPEAT = 5
+
+
+def generate_module(lazy: bool, client: bool = True) -> str:
+    """Returns the source code of a module with models and, optionally, a client."""
+    lines = [
+        "from typing import Annotated, Optional",
+        "",
+        "import pydantic",
+        "from requests import Session",
+        "",
+        "from meatie import api_ref, endpoint",
+        "from meatie_requests import Client",
+        "",
+    ]
+    for index in range(MODELS):
+        lines.extend(
+            [
+                "",
+                f"class Model{index}(pydantic.BaseModel):",
+                "    id: int",
+                "    name: str",
+                "    tags: list[str] = []",
+                "    parent: Optional[int] = None",
+                "",
+            ]
+        )
+
+    if not client:
+        return "\n".join(lines)
+
+    lines.extend(["", "class SyntheticClient(Client):"])
+    for index in range(ENDPOINTS):
+        model = f"Model{index % MODELS}"
+        if index % 2 == 0:
+            lines.append(f'    @endpoint("/api/v1/resource{index}", lazy={lazy})')
+            lines.append(f"    def get_resource{index}(self, limit: int = 100) -> list[{model}]: ...")
+        else:
+            lines.append(f'    @endpoint("/api/v1/resource{index}/{{resource_id}}", lazy={lazy})')
+            lines.append(
+                f"    def put_resource{index}(self, resource_id: int,"
+                f' body: Annotated[{model}, api_ref("body")]) -> {model}: ...'
+            )
+        lines.append("")
+    return "\n".join(lines)
+
+
+def measure(statement: str, path: Path) -> float:
+    """Returns the median time of running the statement in a fresh interpreter."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(path), *sys.path])}
+    code = f"import time; start = time.perf_counter(); {statement}; print(time.perf_counter() - start)"
+    samples = []
+    for _ in range(REPEAT):
+        output = subprocess.run([sys.executable, "-c", code], env=env, check=True, capture_output=True, text=True)
+        samples.append(float(output.stdout))
+    return statistics.median(samples)
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory)
+        (path / "eager_client.py").write_text(generate_module(lazy=False))
+        (path / "lazy_client.py").write_text(generate_module(lazy=True))
+        (path / "models.py").write_text(generate_module(lazy=False, client=False))
+
+        baseline = measure("import models", path)
+        eager = measure("import eager_client", path)
+        lazy = measure("import lazy_client", path)
+
+    print(f"{ENDPOINTS} endpoints, {MODELS} models")
+    print(f"  baseline: {baseline * 1e3:7.1f} ms")
+    print(f"     eager: {eager * 1e3:7.1f} ms")
+    print(f"      lazy: {lazy * 1e3:7.1f} ms")
+    print(f"  endpoint construction: {(eager - baseline) / (lazy - baseline):.1f}x less time with lazy endpoints")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+
+"""Compares peak memory and time of decoding a large JSON array as a list and as a stream of items.
+
+Run with: python benchmarks/bench_json_array.py
+"""
+
+import json
+import time
+import tracemalloc
+from collections.abc import Generator, Iterator
+from typing import Any, Callable
+
+from meatie.internal.adapter import get_adapter
+
+ITEMS = 100_000
+CHUNK_SIZE = 64 * 1024
+
+
+class BenchResponse:
+    """Response that serves the body from memory in chunks."""
+
+    def __init__(self, content: bytes) -> None:
+        """Creates the response."""
+        self.content = content
+
+    def read(self) -> bytes:
+        """Returns the whole body."""
+        return self.content
+
+    def json(self) -> Any:
+        """Decodes the whole body."""
+        return json.loads(self.content)
+
+    def iter_bytes(self) -> Generator[bytes, None, None]:
+        """Returns the body in chunks."""
+        for start in range(0, len(self.content), CHUNK_SIZE):
+            yield self.content[start : start + CHUNK_SIZE]
+
+
+def measure(label: str, func: Callable[[], int]) -> None:
+    """Prints the time taken by the function and the peak memory it allocated, measured in separate runs."""
+    started_at = time.perf_counter()
+    count = func()
+    elapsed = time.perf_counter() - started_at
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:>8}: {count} items, {elapsed:6.2f} s, peak {peak / 2**20:7.1f} MiB")
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    items = [{"id": index, "name": f"item {index}", "tags": ["a", "b"], "price": index / 100} for index in range(ITEMS)]
+    content = json.dumps(items).encode()
+    del items
+    print(f"body: {len(content) / 2**20:.1f} MiB")
+
+    list_adapter = get_adapter(list[dict[str, Any]])
+    stream_adapter = get_adapter(Iterator[dict[str, Any]])
+    measure("list", lambda: len(list_adapter.from_response(BenchResponse(content))))  # type: ignore[arg-type]
+    measure("stream", lambda: sum(1 for _ in stream_adapter.from_response(BenchResponse(content))))  # type: ignore[arg-type]
+
+
+if __name__ == "__main__":
+    main()
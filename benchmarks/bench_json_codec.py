@@ -0,0 +1,70 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+
+"""Compares the JSON codecs on payload shapes typical for REST APIs.
+
+Codecs whose packages are not installed are skipped.
+
+Run with: python benchmarks/bench_json_codec.py
+"""
+
+import timeit
+from typing import Any, Callable
+
+from meatie import JsonCodec, MsgspecJsonCodec, OrjsonCodec, StdJsonCodec
+
+NUMBER = 20
+
+
+def create_payloads() -> dict[str, Any]:
+    """Returns payloads used in the benchmark."""
+    records = [
+        {
+            "id": index,
+            "name": f"item {index}",
+            "active": index % 2 == 0,
+            "price": index / 100,
+            "tags": ["a", "b", "c"],
+            "owner": {"id": index % 100, "email": f"user{index % 100}@example.com"},
+        }
+        for index in range(10_000)
+    ]
+    return {
+        "small object": records[0],
+        "page of 100 records": {"items": records[:100], "next": "cursor"},
+        "10k records": records,
+        "10k numbers": list(range(10_000)),
+    }
+
+
+def create_codecs() -> dict[str, JsonCodec]:
+    """Returns codecs available in the environment."""
+    factories: dict[str, Callable[[], JsonCodec]] = {
+        "json": StdJsonCodec,
+        "orjson": OrjsonCodec,
+        "msgspec": MsgspecJsonCodec,
+    }
+    codecs = {}
+    for name, factory in factories.items():
+        try:
+            codecs[name] = factory()
+        except ImportError:
+            print(f"{name}: not installed, skipped")
+    return codecs
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    codecs = create_codecs()
+    for payload_name, payload in create_payloads().items():
+        content = StdJsonCodec().dumps(payload)
+        number = NUMBER * max(1, 100_000 // len(content))
+        print(f"{payload_name} ({len(content)} bytes):")
+        for codec_name, codec in codecs.items():
+            loads = timeit.timeit(lambda: codec.loads(content), number=number) / number  # noqa: B023
+            dumps = timeit.timeit(lambda: codec.dumps(payload), number=number) / number  # noqa: B023
+            print(f"  {codec_name:>8}: loads {loads * 1e6:9.1f} us, dumps {dumps * 1e6:9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
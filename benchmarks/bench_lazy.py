@@ -0,0 +1,134 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+
+"""Compares decoding a large model eagerly with accessing a few fields of a Lazy proxy.
+
+The time includes creating the proxy and accessing the fields. The memory is the peak of the allocations made while
+decoding, measured with tracemalloc. The proxy splits the response body into members with msgspec if it is installed,
+otherwise it scans the body in Python up to the accessed member.
+
+Run with: python benchmarks/bench_lazy.py
+"""
+
+import json
+import timeit
+import tracemalloc
+from typing import Any, Callable, Optional
+
+import pydantic
+
+from meatie import Lazy
+from meatie.internal.adapter import get_adapter, lazy_
+
+NUMBER = 20
+
+
+class Owner(pydantic.BaseModel):
+    """Owner of an item."""
+
+    id: int
+    email: str
+
+
+class Item(pydantic.BaseModel):
+    """Item of an order."""
+
+    id: int
+    name: str
+    active: bool
+    price: float
+    tags: list[str]
+    owner: Optional[Owner]
+
+
+class Order(pydantic.BaseModel):
+    """Order returned by the API."""
+
+    id: int
+    status: str
+    items: list[Item]
+    total: float
+
+
+class StubResponse:
+    """Response holding the body in memory."""
+
+    def __init__(self, content: bytes) -> None:
+        """Creates a response with the given body."""
+        self.content = content
+
+    def read(self) -> bytes:
+        """Returns the body."""
+        return self.content
+
+    def text(self) -> str:
+        """Returns the body as text."""
+        return self.content.decode()
+
+    def json(self) -> Any:
+        """Returns the body decoded from JSON."""
+        return json.loads(self.content)
+
+
+def create_content(size: int) -> bytes:
+    """Returns an order with items, the total follows the items so the proxy has to scan past them."""
+    items = [
+        {
+            "id": index,
+            "name": f"item {index}",
+            "active": index % 2 == 0,
+            "price": index / 100,
+            "tags": ["a", "b", "c"],
+            "owner": {"id": index % 100, "email": f"user{index % 100}@example.com"},
+        }
+        for index in range(size)
+    ]
+    return json.dumps({"id": 1, "status": "shipped", "items": items, "total": 123.45}).encode()
+
+
+def measure_memory(decode: Callable[[], Any]) -> int:
+    """Returns the peak memory allocated while decoding."""
+    tracemalloc.start()
+    try:
+        result = decode()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    eager = get_adapter(Order)
+    lazy = get_adapter(Lazy[Order])
+
+    def decode_eager(response: StubResponse) -> Any:
+        order = eager.from_response(response)  # type: ignore[arg-type]
+        return order, order.id, order.status, order.total
+
+    def decode_lazy(response: StubResponse) -> Any:
+        order = lazy.from_response(response)  # type: ignore[arg-type]
+        return order, order.id, order.status, order.total
+
+    create_object_index = lazy_.create_object_index
+
+    def decode_lazy_scan(response: StubResponse) -> Any:
+        lazy_.create_object_index = lazy_.JsonObjectIndex
+        try:
+            return decode_lazy(response)
+        finally:
+            lazy_.create_object_index = create_object_index
+
+    for size in (10, 1_000, 100_000):
+        response = StubResponse(create_content(size))
+        number = NUMBER * max(1, 10_000 // size)
+        print(f"Order with {size} items ({len(response.content) / 1e3:.1f} KB), accessing 3 scalar fields:")
+        for name, decode in (("eager", decode_eager), ("lazy", decode_lazy), ("lazy, scan", decode_lazy_scan)):
+            elapsed = timeit.timeit(lambda: decode(response), number=number) / number  # noqa: B023
+            peak = measure_memory(lambda: decode(response))  # noqa: B023
+            print(f"  {name:<10}: {elapsed * 1e6:10.1f} us, peak memory {peak / 1e3:10.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+
+"""Compares decoding a response into msgspec structs from the raw body and from the JSON object graph.
+
+Run with: python benchmarks/bench_msgspec.py
+"""
+
+import json
+import timeit
+from typing import Any
+
+import msgspec
+
+from meatie.internal.adapter import get_adapter
+
+NUMBER = 20
+ITEMS = 10_000
+
+
+class Item(msgspec.Struct):
+    """Struct used in the benchmark."""
+
+    id: int
+    name: str
+    tags: list[str]
+    price: float
+
+
+class BenchResponse:
+    """Response that serves the body from memory."""
+
+    def __init__(self, content: bytes) -> None:
+        """Creates the response."""
+        self.content = content
+
+    def read(self) -> bytes:
+        """Returns the body."""
+        return self.content
+
+    def text(self) -> str:
+        """Returns the body as text."""
+        return self.content.decode()
+
+    def json(self) -> Any:
+        """Decodes the body."""
+        return json.loads(self.content)
+
+
+class JsonOnlyResponse(BenchResponse):
+    """Response that can only be decoded from JSON, as when the JSON decoder is customized."""
+
+    def __init__(self, content: bytes) -> None:
+        """Creates the response."""
+        super().__init__(content)
+        self.get_json = json.loads
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    items = [{"id": index, "name": f"item {index}", "tags": ["a", "b"], "price": index / 100} for index in range(ITEMS)]
+    content = json.dumps(items).encode()
+    adapter = get_adapter(list[Item])
+
+    from_json = timeit.timeit(lambda: adapter.from_response(JsonOnlyResponse(content)), number=NUMBER)  # type: ignore[arg-type]
+    from_bytes = timeit.timeit(lambda: adapter.from_response(BenchResponse(content)), number=NUMBER)  # type: ignore[arg-type]
+    print(
+        f"{ITEMS} items: json + convert {from_json / NUMBER * 1e3:.1f} ms/call,"
+        f" decode {from_bytes / NUMBER * 1e3:.1f} ms/call, speedup {from_json / from_bytes:.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
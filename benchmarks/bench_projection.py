@@ -0,0 +1,105 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+
+"""Compares decoding 5 fields of wide JSON objects with and without the projection marker.
+
+Each object has 200 fields, a third of which are nested objects. The full model declares all fields, the small model
+declares 5 of them. Requires the msgspec package.
+
+Run with: python benchmarks/bench_projection.py
+"""
+
+import json
+import timeit
+from typing import Annotated, Any
+
+import pydantic
+
+from meatie import projection
+from meatie.internal.adapter import get_adapter
+
+NUMBER = 20
+FIELD_COUNT = 200
+
+
+class Detail(pydantic.BaseModel):
+    """Nested object of a record."""
+
+    text: str
+    values: list[int]
+
+
+class Record(pydantic.BaseModel):
+    """Record with the fields the application needs."""
+
+    f1: str
+    f2: int
+    f3: Detail
+    f4: str
+    f5: int
+
+
+FullRecord: Any = pydantic.create_model(  # type: ignore[call-overload]
+    "FullRecord",
+    **{
+        f"f{index}": ((Detail, ...) if index % 3 == 0 else (str, ...) if index % 3 == 1 else (int, ...))
+        for index in range(FIELD_COUNT)
+    },
+)
+
+
+class StubResponse:
+    """Response holding the body in memory."""
+
+    def __init__(self, content: bytes) -> None:
+        """Creates a response with the given body."""
+        self.content = content
+
+    def read(self) -> bytes:
+        """Returns the body."""
+        return self.content
+
+    def text(self) -> str:
+        """Returns the body as text."""
+        return self.content.decode()
+
+    def json(self) -> Any:
+        """Returns the body decoded from JSON."""
+        return json.loads(self.content)
+
+
+def create_content(size: int) -> bytes:
+    """Returns a JSON array of records."""
+    record = {
+        f"f{index}": (
+            {"text": "x" * 50, "values": list(range(20))}
+            if index % 3 == 0
+            else f"value {index}"
+            if index % 3 == 1
+            else index
+        )
+        for index in range(FIELD_COUNT)
+    }
+    return json.dumps([record] * size).encode()
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    adapters = {
+        "full model": get_adapter(list[FullRecord]),
+        "small model": get_adapter(list[Record]),
+        "small model, projection": get_adapter(Annotated[list[Record], projection()]),
+    }
+    for size in (1, 100, 1_000):
+        response = StubResponse(create_content(size))
+        number = NUMBER * max(1, 1_000 // size)
+        print(f"list[Record] with {size} records ({len(response.content) / 1e3:.1f} KB):")
+        baseline = None
+        for name, adapter in adapters.items():
+            elapsed = timeit.timeit(lambda: adapter.from_response(response), number=number) / number  # type: ignore[arg-type] # noqa: B023
+            baseline = baseline or elapsed
+            print(f"  {name:<23}: {elapsed * 1e6:10.1f} us ({baseline / elapsed:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
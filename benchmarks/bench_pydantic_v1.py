@@ -0,0 +1,99 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+
+"""Compares parsing list[Model] responses with pydantic.parse_obj_as and the pydantic v1 adapter.
+
+Requires pydantic 1.x.
+
+Run with: python benchmarks/bench_pydantic_v1.py
+"""
+
+import json
+import sys
+import timeit
+from typing import Any, Optional
+
+import pydantic
+
+NUMBER = 20
+
+
+class Owner(pydantic.BaseModel):
+    """Owner of an item."""
+
+    id: int
+    email: str
+
+
+class Item(pydantic.BaseModel):
+    """Item returned by the API."""
+
+    id: int
+    name: str
+    active: bool
+    price: float
+    tags: list[str]
+    owner: Optional[Owner]
+
+
+class StubResponse:
+    """Response holding the body in memory."""
+
+    def __init__(self, content: bytes) -> None:
+        """Creates a response with the given body."""
+        self.content = content
+
+    def read(self) -> bytes:
+        """Returns the body."""
+        return self.content
+
+    def json(self) -> Any:
+        """Returns the body decoded from JSON."""
+        return json.loads(self.content)
+
+
+def parse_obj_as(response: StubResponse) -> list[Item]:
+    """Parses the response as the adapter did before the parsing model was cached."""
+    return pydantic.parse_obj_as(list[Item], response.json())
+
+
+def create_content(size: int) -> bytes:
+    """Returns a JSON array of items."""
+    records = [
+        {
+            "id": index,
+            "name": f"item {index}",
+            "active": index % 2 == 0,
+            "price": index / 100,
+            "tags": ["a", "b", "c"],
+            "owner": {"id": index % 100, "email": f"user{index % 100}@example.com"},
+        }
+        for index in range(size)
+    ]
+    return json.dumps(records).encode()
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    if not pydantic.VERSION.startswith("1."):
+        print(f"pydantic {pydantic.VERSION} is installed, the benchmark requires pydantic 1.x")
+        sys.exit(1)
+
+    from meatie.internal.adapter.pydantic_v1 import PydanticV1TypeAdapter
+
+    adapter = PydanticV1TypeAdapter(list[Item])
+    for size in (1, 100, 10_000):
+        content = create_content(size)
+        response = StubResponse(content)
+        number = NUMBER * max(1, 10_000 // size)
+
+        baseline = timeit.timeit(lambda: parse_obj_as(response), number=number)  # noqa: B023
+        from_response = timeit.timeit(lambda: adapter.from_response(response), number=number)  # type: ignore[arg-type] # noqa: B023
+
+        print(f"list[Item] with {size} items ({len(content)} bytes):")
+        print(f"  parse_obj_as:  {baseline / number * 1e6:9.1f} us")
+        print(f"  from_response: {from_response / number * 1e6:9.1f} us ({baseline / from_response:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
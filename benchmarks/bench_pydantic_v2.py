@@ -0,0 +1,73 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+
+"""Compares decoding a response with Pydantic v2 from the raw body and from the JSON object graph.
+
+Run with: python benchmarks/bench_pydantic_v2.py
+"""
+
+import json
+import timeit
+from typing import Any
+
+import pydantic
+
+from meatie.internal.adapter import get_adapter
+
+NUMBER = 20
+ITEMS = 10_000
+
+
+class Item(pydantic.BaseModel):
+    """Model used in the benchmark."""
+
+    id: int
+    name: str
+    tags: list[str]
+    price: float
+
+
+class BenchResponse:
+    """Response that serves the body from memory."""
+
+    def __init__(self, content: bytes) -> None:
+        """Creates the response."""
+        self.content = content
+
+    def read(self) -> bytes:
+        """Returns the body."""
+        return self.content
+
+    def text(self) -> str:
+        """Returns the body as text."""
+        return self.content.decode()
+
+    def json(self) -> Any:
+        """Decodes the body."""
+        return json.loads(self.content)
+
+
+class JsonOnlyResponse(BenchResponse):
+    """Response that can only be decoded from JSON, as before the raw body fast path."""
+
+    def read(self) -> Any:
+        """Pretends the raw body is not available."""
+        return None
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    items = [{"id": index, "name": f"item {index}", "tags": ["a", "b"], "price": index / 100} for index in range(ITEMS)]
+    content = json.dumps(items).encode()
+    adapter = get_adapter(list[Item])
+
+    from_json = timeit.timeit(lambda: adapter.from_response(JsonOnlyResponse(content)), number=NUMBER)  # type: ignore[arg-type]
+    from_bytes = timeit.timeit(lambda: adapter.from_response(BenchResponse(content)), number=NUMBER)  # type: ignore[arg-type]
+    print(
+        f"{ITEMS} items: json + validate_python {from_json / NUMBER * 1e3:.1f} ms/call,"
+        f" validate_json {from_bytes / NUMBER * 1e3:.1f} ms/call, speedup {from_json / from_bytes:.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+
+"""Compares the compiled request builder with the generic implementation.
+
+Run with: python benchmarks/bench_request_template.py
+"""
+
+import timeit
+from typing import Annotated, Any, Optional
+
+from meatie import api_ref
+from meatie.internal.template import PathTemplate, RequestTemplate
+
+NUMBER = 200_000
+
+
+def get_positions(
+    order_id: int,
+    sort_by: Annotated[Optional[str], api_ref("orderBy")] = None,
+    limit: int = 100,
+    offset: Optional[int] = None,
+) -> list[Any]:
+    """Endpoint signature used in the benchmark."""
+    return []
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    template: RequestTemplate[Any] = RequestTemplate.from_callable(
+        get_positions, PathTemplate.from_string("/api/v1/orders/{order_id}/positions"), "GET"
+    )
+
+    for label, args, kwargs in [
+        ("positional", (1, "price"), {}),
+        ("keyword", (), {"order_id": 1, "sort_by": "price", "offset": 20}),
+    ]:
+        generic = timeit.timeit(lambda: template.build_generic_request(*args, **kwargs), number=NUMBER)
+        compiled = timeit.timeit(lambda: template.build_request(*args, **kwargs), number=NUMBER)
+        print(
+            f"{label:>10}: generic {generic / NUMBER * 1e6:.2f} us/call,"
+            f" compiled {compiled / NUMBER * 1e6:.2f} us/call,"
+            f" speedup {generic / compiled:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+
+"""Compares decoding list[Model] responses with and without validation.
+
+Requires pydantic 1.x. Pydantic 2 validates JSON faster than models can be constructed in Python, so endpoints do not
+skip validation of pydantic 2 models.
+
+Run with: python benchmarks/bench_trusted.py
+"""
+
+import json
+import sys
+import timeit
+from typing import Any, Optional
+
+import pydantic
+
+from meatie.internal.adapter import TrustedTypeAdapter, get_adapter, trust_adapter
+
+NUMBER = 20
+
+
+class Owner(pydantic.BaseModel):
+    """Owner of an item."""
+
+    id: int
+    email: str
+
+
+class Item(pydantic.BaseModel):
+    """Item returned by the API."""
+
+    id: int
+    name: str
+    active: bool
+    price: float
+    tags: list[str]
+    owner: Optional[Owner]
+
+
+class StubResponse:
+    """Response holding the decoded body in memory."""
+
+    def __init__(self, content: bytes) -> None:
+        """Creates a response with the given body."""
+        self.content = content
+        self.value = json.loads(content)
+
+    def read(self) -> bytes:
+        """Returns the body."""
+        return self.content
+
+    def json(self) -> Any:
+        """Returns the decoded body."""
+        return self.value
+
+
+def create_content(size: int) -> bytes:
+    """Returns a JSON array of items."""
+    records = [
+        {
+            "id": index,
+            "name": f"item {index}",
+            "active": index % 2 == 0,
+            "price": index / 100,
+            "tags": ["a", "b", "c"],
+            "owner": {"id": index % 100, "email": f"user{index % 100}@example.com"},
+        }
+        for index in range(size)
+    ]
+    return json.dumps(records).encode()
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    if not pydantic.VERSION.startswith("1."):
+        print(f"pydantic {pydantic.VERSION} is installed, the benchmark requires pydantic 1.x")
+        sys.exit(1)
+
+    adapter = get_adapter(list[Item])
+    trusted = trust_adapter(adapter, validation_ratio=0.0)
+    sampled = trust_adapter(adapter, validation_ratio=0.01)
+    assert isinstance(trusted, TrustedTypeAdapter)
+
+    for size in (1, 100, 10_000):
+        response = StubResponse(create_content(size))
+        number = NUMBER * max(1, 10_000 // size)
+        print(f"list[Item] with {size} items:")
+        validated = timeit.timeit(lambda: adapter.from_response(response), number=number)  # type: ignore[arg-type] # noqa: B023
+        print(f"  validated:        {validated / number * 1e6:9.1f} us")
+        for name, candidate in (("trusted", trusted), ("trusted, 1% vld.", sampled)):
+            elapsed = timeit.timeit(lambda: candidate.from_response(response), number=number)  # type: ignore[arg-type] # noqa: B023
+            print(f"  {name:<16}: {elapsed / number * 1e6:9.1f} us ({validated / elapsed:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
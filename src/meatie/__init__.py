@@ -6,8 +6,9 @@
 from .aio import AsyncContext, AsyncEndpointDescriptor, BaseAsyncClient
 from .api_reference import api_ref
 from .client import BaseClient
+from .codec import JsonCodec, MsgspecJsonCodec, OrjsonCodec, StdJsonCodec
 from .descriptor import Context, EndpointDescriptor
-from .endpoint import endpoint
+from .endpoint import endpoint, validate
 from .error import (
     HttpStatusError,
     MeatieError,
@@ -21,7 +22,7 @@ from .error import (
     Timeout,
     TransportError,
 )
-from .internal.cache import Cache
+from .internal.cache import Cache, CacheStats, TinyLfuCache
 from .internal.limit import Limiter, Rate
 from .internal.retry import (
     BaseCondition,
@@ -40,13 +41,18 @@ from .internal.retry import (
     uniform,
     zero,
 )
+from .lazy import Lazy
 from .option import (
     body,
     cache,
+    chunked,
+    coalesce,
     limit,
     private,
     retry,
+    trusted,
 )
+from .projection import projection
 from .types import (
     DAY,
     HOUR,
@@ -99,9 +105,15 @@ __all__ = [
     "has_exception_type",
     "has_exception_cause_type",
     "Cache",
+    "CacheStats",
+    "TinyLfuCache",
     "Limiter",
     "Rate",
     "BaseClient",
+    "JsonCodec",
+    "StdJsonCodec",
+    "OrjsonCodec",
+    "MsgspecJsonCodec",
     "Context",
     "EndpointDescriptor",
     "BaseAsyncClient",
@@ -110,7 +122,13 @@ __all__ = [
     "retry",
     "limit",
     "cache",
+    "coalesce",
     "private",
     "body",
+    "trusted",
+    "chunked",
     "endpoint",
+    "validate",
+    "Lazy",
+    "projection",
 ]
@@ -1,21 +1,31 @@
 #  Copyright 2024 The Meatie Authors. All rights reserved.
 #  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+import asyncio
+import weakref
+from collections import deque
+from functools import partial
+from http import HTTPStatus
 from typing import (
     Any,
+    AsyncIterator,
     Awaitable,
     Callable,
     Generic,
     Iterable,
     Optional,
+    Protocol,
     Union,
+    cast,
     overload,
+    runtime_checkable,
 )
 
-from typing_extensions import Self
+from typing_extensions import Literal, Self
 
-from meatie.internal.adapter import TypeAdapter
-from meatie.internal.template import RequestTemplate, get_method
-from meatie.internal.types import PT, ResponseBodyType
+from meatie.internal.adapter import TypeAdapter, chunk_adapter, trust_adapter
+from meatie.internal.cache import NOT_MODIFIED
+from meatie.internal.template import EndpointLoader, RequestTemplate, get_method
+from meatie.internal.types import PT, ResponseBodyType, T
 from meatie.types import AsyncResponse, Request
 
 from .client import BaseAsyncClient
@@ -23,6 +33,72 @@ from .client import BaseAsyncClient
 AsyncOperator = Callable[["AsyncContext[ResponseBodyType]"], Awaitable[ResponseBodyType]]
 
 
+@runtime_checkable
+class ComposableAsyncOperator(Protocol[T]):
+    """Asynchronous operator that can be composed with the next step ahead of time.
+
+    Built-in operators implement this interface, so Meatie chains them together once per endpoint instead of dispatching each step through `AsyncContext.proceed`.
+    """
+
+    async def __call__(self, ctx: "AsyncContext[T]") -> T:
+        """Applies the operator on the HTTP request using `AsyncContext.proceed` to call the next step."""
+        ...
+
+    async def apply(self, call_next: AsyncOperator[T], ctx: "AsyncContext[T]") -> T:
+        """Applies the operator on the HTTP request.
+
+        Args:
+            call_next: the next step in the chain.
+            ctx: the context of the HTTP request.
+
+        Returns:
+            the result of the endpoint call.
+        """
+        ...
+
+
+def proceed(ctx: "AsyncContext[T]") -> Awaitable[T]:
+    """Applies the next operator using the context. Passed as `call_next` to operators that are not pre-composed."""
+    return ctx.proceed()
+
+
+def compose_operators(operators: Iterable[AsyncOperator[T]], terminal: AsyncOperator[T]) -> list[AsyncOperator[T]]:
+    """Composes consecutive built-in operators into single steps.
+
+    Each run of composable operators is folded into one callable that awaits the next operator directly. Custom operators are kept as separate steps, so they still reach the next step through `AsyncContext.proceed`.
+
+    Args:
+        operators: operators ordered by priority.
+        terminal: the step that sends the HTTP request.
+
+    Returns:
+        Steps to be executed by the context.
+    """
+    steps: list[AsyncOperator[T]] = []
+    run: list[ComposableAsyncOperator[T]] = []
+    for operator in operators:
+        if isinstance(operator, ComposableAsyncOperator):
+            run.append(operator)
+            continue
+
+        if run:
+            steps.append(_compose(run, proceed))
+            run = []
+        steps.append(operator)
+
+    if run:
+        steps.append(_compose(run, terminal))
+    else:
+        steps.append(terminal)
+    return steps
+
+
+def _compose(run: list[ComposableAsyncOperator[T]], call_next: AsyncOperator[T]) -> AsyncOperator[T]:
+    for operator in reversed(run):
+        call_next = partial(operator.apply, call_next)
+    return call_next
+
+
 class AsyncContext(Generic[ResponseBodyType]):
     """Stores context for processing an asynchronous HTTP request."""
 
@@ -45,6 +121,8 @@ class AsyncContext(Generic[ResponseBodyType]):
 
         self.request = request
         self.response: Optional[AsyncResponse] = None
+        # set by the cache operator when the request carries the validators of a cached response
+        self.conditional = False
 
     async def proceed(self) -> ResponseBodyType:
         """One method call will apply one operator on the HTTP request.
@@ -68,27 +146,108 @@ class AsyncEndpointDescriptor(Generic[PT, ResponseBodyType]):
 
     def __init__(
         self,
-        template: RequestTemplate[Any],
-        response_decoder: TypeAdapter[ResponseBodyType],
+        template: Optional[RequestTemplate[Any]],
+        response_decoder: Optional[TypeAdapter[ResponseBodyType]],
+        loader: Optional[EndpointLoader[ResponseBodyType]] = None,
     ) -> None:
         """Creates an asynchronous endpoint descriptor.
 
         Args:
-            template: the template for building HTTP requests to send to the given endpoint.
-            response_decoder: the adapter for decoding the HTTP responses returned from the endpoint.
+            template: the template for building HTTP requests to send to the given endpoint. None if the endpoint is lazy.
+            response_decoder: the adapter for decoding the HTTP responses returned from the endpoint. None if the endpoint is lazy.
+            loader: the function that creates the template and the response decoder when the endpoint is used for the first time. Required if the endpoint is lazy.
         """
-        self.template = template
-        self.response_decoder = response_decoder
+        if (template is None or response_decoder is None) and loader is None:
+            raise ValueError("'loader' is required if 'template' or 'response_decoder' is None")
+
+        self.__template = template
+        self.__response_decoder = response_decoder
+        self.__loader = loader
         self.get_json: Optional[Callable[[Any], Awaitable[Any]]] = None
         self.get_text: Optional[Callable[[Any], Awaitable[str]]] = None
         self.get_error: Optional[Callable[[AsyncResponse], Awaitable[Optional[Exception]]]] = None
+        self.__validation_ratio = 1.0
+        self.__chunk_threshold: Optional[int] = None
+        self.__chunk_size = 65536
         self.__operator_by_priority: dict[int, AsyncOperator[ResponseBodyType]] = {}
+        self.__operators: tuple[AsyncOperator[ResponseBodyType], ...] = ()
+        # The template, the response decoder and the composed steps shared by all client instances. Created on the
+        # first call and reset when an operator is registered or the decoding settings are changed.
+        self.__prepared: Optional[_PreparedEndpoint[ResponseBodyType]] = None
+        self.__name: Optional[str] = None
 
     def __set_name__(self, owner: type[object], name: str) -> None:
-        if self.template.method is not None:
+        self.__name = name
+        if self.__template is None or self.__template.method is not None:
             return
 
-        self.template.method = get_method(name)
+        self.__template.method = get_method(name)
+
+    @property
+    def template(self) -> RequestTemplate[Any]:
+        """The template for building HTTP requests. Created when the endpoint is used for the first time if the endpoint is lazy."""
+        template = self.__template
+        if template is None:
+            template, _ = self.__load()
+        return template
+
+    @property
+    def validation_ratio(self) -> float:
+        """The fraction of HTTP responses validated against the return type, set by the trusted option."""
+        return self.__validation_ratio
+
+    @validation_ratio.setter
+    def validation_ratio(self, value: float) -> None:
+        self.__validation_ratio = value
+        self.__prepared = None
+
+    @property
+    def chunk_threshold(self) -> Optional[int]:
+        """The minimum size of the HTTP response body in bytes to decode in chunks, set by the chunked option."""
+        return self.__chunk_threshold
+
+    @chunk_threshold.setter
+    def chunk_threshold(self, value: Optional[int]) -> None:
+        self.__chunk_threshold = value
+        self.__prepared = None
+
+    @property
+    def chunk_size(self) -> int:
+        """The size of a chunk in bytes, set by the chunked option."""
+        return self.__chunk_size
+
+    @chunk_size.setter
+    def chunk_size(self, value: int) -> None:
+        self.__chunk_size = value
+        self.__prepared = None
+
+    @property
+    def response_decoder(self) -> TypeAdapter[ResponseBodyType]:
+        """The adapter for decoding HTTP responses. Created when the endpoint is used for the first time if the endpoint is lazy."""
+        response_decoder = self.__response_decoder
+        if response_decoder is None:
+            _, response_decoder = self.__load()
+        return response_decoder
+
+    def validate(self) -> None:
+        """Creates the template and the response decoder of a lazy endpoint, so errors in the endpoint definition are reported immediately.
+
+        Does nothing if the endpoint is not lazy or was already used.
+        """
+        self.__load()
+
+    def __load(self) -> tuple[RequestTemplate[Any], TypeAdapter[ResponseBodyType]]:
+        if self.__template is not None and self.__response_decoder is not None:
+            return self.__template, self.__response_decoder
+
+        if self.__loader is None:  # pragma: no cover
+            raise RuntimeError("'loader' is None")
+
+        template, response_decoder = self.__loader()
+        if template.method is None and self.__name is not None:
+            template.method = get_method(self.__name)
+        self.__template, self.__response_decoder = template, response_decoder
+        return template, response_decoder
 
     def register_operator(self, priority: int, operator: AsyncOperator[ResponseBodyType]) -> None:
         """Registers an operator to apply on an HTTP request or response.
@@ -104,6 +263,8 @@ class AsyncEndpointDescriptor(Generic[PT, ResponseBodyType]):
             operator: the operator to apply.
         """
         self.__operator_by_priority[priority] = operator
+        self.__operators = tuple(operator for _, operator in sorted(self.__operator_by_priority.items()))
+        self.__prepared = None
 
     @overload
     def __get__(self, instance: None, owner: None) -> Self: ...
@@ -119,19 +280,70 @@ class AsyncEndpointDescriptor(Generic[PT, ResponseBodyType]):
         if instance is None or owner is None:
             return self
 
-        priority_operator_pair = list(self.__operator_by_priority.items())
-        priority_operator_pair.sort()
-        operators = [operator for _, operator in priority_operator_pair]
-
-        return BoundAsyncEndpointDescriptor[PT, ResponseBodyType](
-            instance,
-            operators,
-            self.template,
-            self.response_decoder,
-            self.get_json,
-            self.get_text,
-            self.get_error,
+        # Memoize the bound callable in the instance dictionary. The descriptor does not define __set__, so subsequent
+        # lookups of the attribute are resolved from the instance dictionary without calling __get__ again. The memoized
+        # callable refers to the instance weakly, so the instance is still freed as soon as it is no longer used.
+        instance_dict = getattr(instance, "__dict__", None)
+        if self.__name is not None and instance_dict is not None and hasattr(type(instance), "__weakref__"):
+            instance_dict[self.__name] = BoundAsyncEndpointDescriptor[PT, ResponseBodyType](
+                instance, self.__call_endpoint, weak=True
+            )
+        # the first lookup may be made on a temporary instance, for example, Client(session).get_products()
+        return BoundAsyncEndpointDescriptor[PT, ResponseBodyType](instance, self.__call_endpoint)
+
+    def __prepare(self) -> "_PreparedEndpoint[ResponseBodyType]":
+        response_decoder = chunk_adapter(
+            trust_adapter(self.response_decoder, self.__validation_ratio), self.__chunk_threshold, self.__chunk_size
         )
+        steps: Optional[list[AsyncOperator[ResponseBodyType]]] = None
+        if self.__operators:
+            steps = compose_operators(self.__operators, partial(self.__send_request, response_decoder))
+        prepared = self.__prepared = (self.template, response_decoder, steps)
+        return prepared
+
+    async def __call_endpoint(
+        self, instance: BaseAsyncClient, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> ResponseBodyType:
+        prepared = self.__prepared
+        if prepared is None:
+            prepared = self.__prepare()
+        template, response_decoder, steps = prepared
+
+        request = template.build_request(*args, **kwargs)
+        # When no operators are registered, the HTTP request is sent directly without creating a context.
+        if steps is None:
+            return await self.__process_response(await instance.send(request), response_decoder)
+
+        context: AsyncContext[ResponseBodyType] = AsyncContext(instance, steps, request)
+        return await context.proceed()
+
+    async def __send_request(
+        self, response_decoder: TypeAdapter[ResponseBodyType], context: AsyncContext[ResponseBodyType]
+    ) -> ResponseBodyType:
+        response = await context.client.send(context.request)
+        context.response = response
+        if context.conditional and response.status == HTTPStatus.NOT_MODIFIED:
+            # the body of the cached response is reused by the cache operator
+            return NOT_MODIFIED
+        return await self.__process_response(response, response_decoder)
+
+    async def __process_response(
+        self, response: AsyncResponse, response_decoder: TypeAdapter[ResponseBodyType]
+    ) -> ResponseBodyType:
+        if self.get_json is not None:
+            response.get_json = self.get_json  # type: ignore[attr-defined]
+        if self.get_text is not None:
+            response.get_text = self.get_text  # type: ignore[attr-defined]
+
+        if self.get_error is not None:
+            error = await self.get_error(response)
+            if error is not None:
+                raise error
+
+        return await response_decoder.from_async_response(response)
+
+
+_PreparedEndpoint = tuple[RequestTemplate[Any], TypeAdapter[T], Optional[list[AsyncOperator[T]]]]
 
 
 class BoundAsyncEndpointDescriptor(Generic[PT, ResponseBodyType]):
@@ -140,32 +352,19 @@ class BoundAsyncEndpointDescriptor(Generic[PT, ResponseBodyType]):
     def __init__(
         self,
         instance: BaseAsyncClient,
-        operators: Iterable[AsyncOperator[ResponseBodyType]],
-        template: RequestTemplate[Any],
-        response_decoder: TypeAdapter[ResponseBodyType],
-        get_json: Optional[Callable[[Any], Awaitable[Any]]],
-        get_text: Optional[Callable[[Any], Awaitable[str]]],
-        get_error: Optional[Callable[[AsyncResponse], Awaitable[Optional[Exception]]]],
+        call_endpoint: Callable[[BaseAsyncClient, tuple[Any, ...], dict[str, Any]], Awaitable[ResponseBodyType]],
+        weak: bool = False,
     ) -> None:
         """Initializes the bound descriptor.
 
         Args:
             instance: HTTP client instance.
-            operators: the list of operators to apply on HTTP requests and responses.
-            template: the template for building HTTP requests to call the endpoint.
-            response_decoder: the adapter for decoding the HTTP responses returned from the endpoint.
-            get_json: the function to get JSON from the HTTP response.
-            get_text: the function to get text from the HTTP response.
-            get_error: the function to get an error from the HTTP response.
+            call_endpoint: the function that calls the endpoint using the given client instance and arguments.
+            weak: if set to True, the bound descriptor does not keep the client instance alive.
         """
-        self.__instance = instance
-        self.__operators = list(operators)
-        self.__operators.append(self.__send_request)
-        self.__template = template
-        self.__response_decoder = response_decoder
-        self.__get_json = get_json
-        self.__get_text = get_text
-        self.__get_error = get_error
+        self.__instance: Optional[BaseAsyncClient] = None if weak else instance
+        self.__instance_ref = weakref.ref(instance) if weak else None
+        self.__call_endpoint = call_endpoint
 
     async def __call__(self, *args: PT.args, **kwargs: PT.kwargs) -> ResponseBodyType:
         """Sends an HTTP request.
@@ -177,22 +376,124 @@ class BoundAsyncEndpointDescriptor(Generic[PT, ResponseBodyType]):
         Returns:
             HTTP response body parsed to the expected Python return type used in the method signature.
         """
-        request = self.__template.build_request(*args, **kwargs)
-        context = AsyncContext[ResponseBodyType](self.__instance, self.__operators, request)
-        return await context.proceed()
+        instance = self.__instance
+        if instance is None:
+            instance = cast(weakref.ref[BaseAsyncClient], self.__instance_ref)()
+            if instance is None:
+                raise ReferenceError("The HTTP client instance no longer exists")
+        return await self.__call_endpoint(instance, args, kwargs)
 
-    async def __send_request(self, context: AsyncContext[ResponseBodyType]) -> ResponseBodyType:
-        response = await self.__instance.send(context.request)
-        if self.__get_json is not None:
-            response.get_json = self.__get_json
-        if self.__get_text is not None:
-            response.get_text = self.__get_text
+    @overload
+    def map(
+        self,
+        *iterables: Iterable[Any],
+        concurrency: int = ...,
+        ordered: bool = ...,
+        return_exceptions: Literal[False] = ...,
+    ) -> AsyncIterator[ResponseBodyType]: ...
 
-        context.response = response
+    @overload
+    def map(
+        self,
+        *iterables: Iterable[Any],
+        concurrency: int = ...,
+        ordered: bool = ...,
+        return_exceptions: Literal[True],
+    ) -> AsyncIterator[Union[ResponseBodyType, BaseException]]: ...
 
-        if self.__get_error is not None:
-            error = await self.__get_error(response)
-            if error is not None:
-                raise error
+    async def map(
+        self,
+        *iterables: Iterable[Any],
+        concurrency: int = 16,
+        ordered: bool = True,
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[Union[ResponseBodyType, BaseException]]:
+        """Calls the endpoint for each set of arguments taken from the iterables, running at most `concurrency` calls at a time.
+
+        Similarly to the built-in `map` function, the n-th call receives the n-th element of each iterable as positional arguments. The iterables are consumed lazily, a new call is started only when a result was consumed or a call slot became available.
+        Each call goes through the operators registered for the endpoint, such as caching, rate limiting and retries.
 
-        return await self.__response_decoder.from_async_response(response)
+        Args:
+            *iterables: positional arguments for the endpoint calls.
+            concurrency: maximum number of calls running at the same time.
+            ordered: if set to True (default), results are produced in the order of arguments. Otherwise, results are produced as soon as the calls complete.
+            return_exceptions: if set to False (default), the first failed call cancels the calls in progress and its exception is raised. Otherwise, exceptions are produced in place of results.
+
+        Returns:
+            An asynchronous iterator over the results of the endpoint calls.
+
+        Raises:
+            ValueError: if concurrency is less than 1.
+        """
+        if concurrency < 1:
+            raise ValueError("'concurrency' must be greater than 0")
+
+        call = cast(Callable[..., Awaitable[ResponseBodyType]], self)
+        arguments = zip(*iterables)
+        pending: deque[asyncio.Task[ResponseBodyType]] = deque()
+        failure: Optional[asyncio.Future[asyncio.Task[ResponseBodyType]]] = None
+        if ordered and not return_exceptions:
+            # resolved with the first failed call, so the calls that follow the next one in order are not awaited
+            failure = asyncio.get_running_loop().create_future()
+        try:
+            for args in arguments:
+                task = asyncio.ensure_future(call(*args))
+                if failure is not None:
+                    task.add_done_callback(partial(_set_failure, failure))
+                pending.append(task)
+                while len(pending) >= concurrency:
+                    task = await self.__next_completed(pending, ordered, failure)
+                    yield _get_result(task, return_exceptions)
+
+            while pending:
+                task = await self.__next_completed(pending, ordered, failure)
+                yield _get_result(task, return_exceptions)
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending)
+            for task in pending:
+                # a call may fail instead of being cancelled, its exception is retrieved to avoid the asyncio warning
+                if not task.cancelled():
+                    task.exception()
+
+    @staticmethod
+    async def __next_completed(
+        pending: deque[asyncio.Task[ResponseBodyType]],
+        ordered: bool,
+        failure: Optional[asyncio.Future[asyncio.Task[ResponseBodyType]]],
+    ) -> asyncio.Task[ResponseBodyType]:
+        if not ordered:
+            while True:
+                for task in pending:
+                    if task.done():
+                        pending.remove(task)
+                        return task
+                await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+        # only the next call in order is awaited, the calls completed out of order would wake up the loop repeatedly
+        if failure is None:
+            await asyncio.wait((pending[0],))
+        else:
+            await asyncio.wait((pending[0], failure), return_when=asyncio.FIRST_COMPLETED)
+        if pending[0].done():
+            return pending.popleft()
+
+        # fail fast even if the failed call is not the next one in order
+        failed_task = cast(asyncio.Future[asyncio.Task[ResponseBodyType]], failure).result()
+        pending.remove(failed_task)
+        return failed_task
+
+
+def _set_failure(failure: "asyncio.Future[asyncio.Task[T]]", task: "asyncio.Task[T]") -> None:
+    if not failure.done() and not task.cancelled() and task.exception() is not None:
+        failure.set_result(task)
+
+
+def _get_result(task: "asyncio.Task[T]", return_exceptions: bool) -> Union[T, BaseException]:
+    if return_exceptions and not task.cancelled():
+        exc = task.exception()
+        if exc is not None:
+            return exc
+    return task.result()
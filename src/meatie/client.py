@@ -5,6 +5,7 @@ from typing import Any, Optional, TypeVar
 
 from typing_extensions import Self
 
+from meatie.codec import JsonCodec
 from meatie.internal.cache import Cache
 from meatie.internal.limit import Limiter, Rate
 from meatie.types import INF, Request
@@ -13,25 +14,38 @@ from meatie.types import INF, Request
 class BaseClient:
     """Base class for the integration with HTTP client libraries."""
 
-    SHARED_CACHE_MAX_SIZE: int = 1000
+    SHARED_CACHE_MAX_SIZE: Optional[int] = 1000
+    SHARED_CACHE_MAX_BYTES: Optional[int] = None
     shared_cache: Cache
 
     def __init__(
         self,
         local_cache: Optional[Cache] = None,
         limiter: Optional[Limiter] = None,
+        json_codec: Optional[JsonCodec] = None,
     ):
         """Creates a BaseClient.
 
         Args:
             local_cache: Cache implementation for storing the HTTP responses.
             limiter: Rate limiter used for throttling the rate of sending the HTTP requests.
+            json_codec: JSON codec used for encoding the HTTP request bodies and decoding the HTTP response bodies. The default is to rely on the behaviour of the HTTP client library.
         """
         self.local_cache = local_cache if local_cache is not None else Cache()
         self.limiter = limiter if limiter is not None else Limiter(Rate.max, INF)
+        self.json_codec = json_codec
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
-        cls.shared_cache = Cache(max_size=cls.SHARED_CACHE_MAX_SIZE)
+        # a subclass may assign its own shared cache, for example a TinyLfuCache
+        if "shared_cache" not in cls.__dict__:
+            cls.shared_cache = Cache(max_size=cls.SHARED_CACHE_MAX_SIZE, max_bytes=cls.SHARED_CACHE_MAX_BYTES)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Bound endpoints are memoized in the instance dictionary. They refer to this instance, so copies of the client
+        # create their own on the first lookup.
+        from meatie.descriptor import BoundEndpointDescriptor
+
+        return {name: value for name, value in self.__dict__.items() if not isinstance(value, BoundEndpointDescriptor)}
 
     def __enter__(self) -> Self:
         return self
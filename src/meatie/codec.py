@@ -0,0 +1,138 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+"""JSON codecs used by clients to encode HTTP request bodies and decode HTTP response bodies."""
+
+import json
+from importlib import import_module
+from typing import Any, Optional, Protocol, runtime_checkable
+
+__all__ = ["JsonCodec", "StdJsonCodec", "OrjsonCodec", "MsgspecJsonCodec", "get_json_codec", "with_json_content_type"]
+
+
+@runtime_checkable
+class JsonCodec(Protocol):
+    """Interface for a JSON codec."""
+
+    def loads(self, data: bytes) -> Any:
+        """Decodes a JSON document.
+
+        Args:
+            data: the JSON document.
+
+        Returns:
+            The decoded value.
+
+        Raises:
+            ValueError: If the data is not a valid JSON document.
+        """
+        ...
+
+    def dumps(self, value: Any) -> bytes:
+        """Encodes a value as a JSON document.
+
+        Args:
+            value: the value to encode.
+
+        Returns:
+            The JSON document encoded in UTF-8.
+        """
+        ...
+
+
+class StdJsonCodec:
+    """JSON codec using the json module from the standard library."""
+
+    __slots__ = ()
+
+    def loads(self, data: bytes) -> Any:
+        """Decodes a JSON document."""
+        return json.loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        """Encodes a value as a compact JSON document."""
+        return json.dumps(value, separators=(",", ":")).encode()
+
+
+class OrjsonCodec:
+    """JSON codec using orjson.
+
+    Requires the orjson package.
+    """
+
+    __slots__ = ("__loads", "__dumps")
+
+    def __init__(self) -> None:
+        """Creates an OrjsonCodec.
+
+        Raises:
+            ImportError: If the orjson package is not installed.
+        """
+        orjson = import_module("orjson")
+        self.__loads = orjson.loads
+        self.__dumps = orjson.dumps
+
+    def loads(self, data: bytes) -> Any:
+        """Decodes a JSON document."""
+        return self.__loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        """Encodes a value as a JSON document."""
+        return self.__dumps(value)
+
+
+class MsgspecJsonCodec:
+    """JSON codec using msgspec.
+
+    Requires the msgspec package.
+    """
+
+    __slots__ = ("__decoder", "__encoder")
+
+    def __init__(self) -> None:
+        """Creates a MsgspecJsonCodec.
+
+        Raises:
+            ImportError: If the msgspec package is not installed.
+        """
+        msgspec = import_module("msgspec")
+        self.__decoder = msgspec.json.Decoder()
+        self.__encoder = msgspec.json.Encoder()
+
+    def loads(self, data: bytes) -> Any:
+        """Decodes a JSON document."""
+        return self.__decoder.decode(data)
+
+    def dumps(self, value: Any) -> bytes:
+        """Encodes a value as a JSON document."""
+        return self.__encoder.encode(value)
+
+
+def get_json_codec(response: Any) -> Optional[JsonCodec]:
+    """Returns the JSON codec for decoding the body of the HTTP response.
+
+    The JSON decoder customized for the endpoint, i.e., using the body option, takes precedence over the codec.
+
+    Args:
+        response: the HTTP response created by the client.
+
+    Returns:
+        The JSON codec of the client. None if the client has no codec or the JSON decoder was customized.
+    """
+    if "get_json" in getattr(response, "__dict__", ()):
+        return None
+    return getattr(response, "json_codec", None)
+
+
+def with_json_content_type(headers: dict[str, Any]) -> dict[str, Any]:
+    """Returns HTTP headers with the JSON Content-Type added unless the content type is already set.
+
+    Args:
+        headers: the HTTP request headers, the dictionary is not modified.
+
+    Returns:
+        The HTTP request headers declaring the JSON content type.
+    """
+    for name in headers:
+        if name.lower() == "content-type":
+            return headers
+    return {**headers, "Content-Type": "application/json"}
@@ -2,6 +2,7 @@
 #  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
 import inspect
 from collections.abc import Callable
+from functools import partial
 from typing import (
     Any,
     Optional,
@@ -13,7 +14,7 @@ from typing import (
 from meatie.aio import AsyncEndpointDescriptor
 from meatie.descriptor import EndpointDescriptor
 from meatie.internal.adapter import TypeAdapter, get_adapter
-from meatie.internal.template import PathTemplate, RequestTemplate
+from meatie.internal.template import EndpointLoader, PathTemplate, RequestTemplate
 from meatie.internal.types import PT, T
 from meatie.types import Method
 
@@ -22,6 +23,7 @@ def endpoint(
     path: str,
     *args: Any,
     method: Optional[Method] = None,
+    lazy: bool = False,
 ) -> Callable[[Callable[PT, T]], Callable[PT, T]]:
     """Class descriptor for decorating methods that represent API endpoints.
 
@@ -31,6 +33,7 @@ def endpoint(
         path: URL path template. It should start with `/`. Path parameters should be surrounded by parentheses.
         args: options to customize the endpoint behaviour, such as caching, rate limiting, retries, and authentication.
         method: HTTP method for making the request. Inferred from the method name by default.
+        lazy: if set to True, inspecting the method signature and creating the adapters for the request and response bodies is deferred until the endpoint is used for the first time. Lazy endpoints reduce the import time of clients with many endpoints. Use `validate` to report errors in lazy endpoint definitions ahead of time, for instance, in tests.
 
     Returns:
         A decorator that preserves the callable signature of the decorated method.
@@ -58,23 +61,20 @@ def endpoint(
     """
 
     def class_descriptor(func: Callable[PT, T]) -> Callable[PT, T]:
-        path_template = PathTemplate.from_string(path)
-
-        signature = inspect.signature(func)
-        type_hints = get_type_hints(func, include_extras=True)
-        request_template: RequestTemplate[Any] = RequestTemplate.from_signature(
-            signature, type_hints, path_template, method
-        )
-
-        return_type = type_hints["return"]
-        response_decoder: TypeAdapter[T] = get_adapter(return_type)
-
+        loader: EndpointLoader[T] = partial(_load_endpoint, func, path, method)
         is_coroutine = inspect.iscoroutinefunction(func)
         descriptor: Union[EndpointDescriptor[PT, T], AsyncEndpointDescriptor[PT, T]]
-        if is_coroutine:
-            descriptor = AsyncEndpointDescriptor[PT, T](request_template, response_decoder)
+        if lazy:
+            if is_coroutine:
+                descriptor = AsyncEndpointDescriptor[PT, T](None, None, loader)
+            else:
+                descriptor = EndpointDescriptor[PT, T](None, None, loader)
         else:
-            descriptor = EndpointDescriptor[PT, T](request_template, response_decoder)
+            request_template, response_decoder = loader()
+            if is_coroutine:
+                descriptor = AsyncEndpointDescriptor[PT, T](request_template, response_decoder)
+            else:
+                descriptor = EndpointDescriptor[PT, T](request_template, response_decoder)
 
         for option in args:
             option(descriptor)
@@ -85,3 +85,31 @@ def endpoint(
         return cast(Callable[PT, T], descriptor)
 
     return class_descriptor
+
+
+def validate(client_type: type[Any]) -> None:
+    """Creates lazy endpoints of the client class, so errors in the endpoint definitions are reported immediately.
+
+    Parameters:
+        client_type: the client class, endpoints declared in the base classes are validated as well.
+    """
+    for owner in client_type.__mro__:
+        for value in vars(owner).values():
+            if isinstance(value, (EndpointDescriptor, AsyncEndpointDescriptor)):
+                value.validate()
+
+
+def _load_endpoint(
+    func: Callable[..., Any], path: str, method: Optional[Method]
+) -> tuple[RequestTemplate[Any], TypeAdapter[Any]]:
+    path_template = PathTemplate.from_string(path)
+
+    signature = inspect.signature(func)
+    type_hints = get_type_hints(func, include_extras=True)
+    request_template: RequestTemplate[Any] = RequestTemplate.from_signature(
+        signature, type_hints, path_template, method
+    )
+
+    return_type = type_hints["return"]
+    response_decoder: TypeAdapter[Any] = get_adapter(return_type)
+    return request_template, response_decoder
@@ -2,20 +2,33 @@
 #  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
 
 # isort:skip_file
-from .types import TypeAdapter
+from .types import ConstructTypeAdapter, JsonEncoder, JsonTypeAdapter, TypeAdapter
 from .bytes_ import BytesAdapter
 from .json_ import JsonAdapter
 from .client_response import ClientResponseAdapter
 from .none_ import NoneAdapter
 from .string_ import StringAdapter
+from .stream_ import StreamAdapter, is_stream_type
+from .json_stream import ChunkedJsonAdapter, JsonStreamAdapter, chunk_adapter
 from .factory import get_adapter
+from .trusted import TrustedTypeAdapter, trust_adapter
 
 __all__ = [
     "TypeAdapter",
+    "JsonTypeAdapter",
+    "JsonEncoder",
+    "ConstructTypeAdapter",
+    "JsonStreamAdapter",
+    "ChunkedJsonAdapter",
     "JsonAdapter",
     "NoneAdapter",
     "BytesAdapter",
     "StringAdapter",
+    "StreamAdapter",
     "ClientResponseAdapter",
+    "TrustedTypeAdapter",
     "get_adapter",
+    "trust_adapter",
+    "chunk_adapter",
+    "is_stream_type",
 ]
@@ -0,0 +1,193 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+import collections.abc
+import dataclasses
+from abc import ABC, abstractmethod
+from enum import Enum
+from inspect import isclass
+from typing import Any, Callable, Iterable, Literal, Union, get_args, get_origin, get_type_hints
+
+from typing_extensions import Annotated, is_typeddict
+
+Constructor = Callable[[Any], Any]
+
+_JSON_TYPES = (str, int, float, bool, type(None))
+_SEQUENCE_TYPES = (list, collections.abc.Sequence, collections.abc.MutableSequence)
+_MAPPING_TYPES = (dict, collections.abc.Mapping, collections.abc.MutableMapping)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _pending(value: Any) -> Any:  # pragma: no cover
+    raise RuntimeError("The constructor is not created yet")
+
+
+class ConstructorFactory(ABC):
+    """Creates functions that build values of a type from decoded JSON without validation.
+
+    Models, dataclasses and typed dictionaries are built from their fields. Values of other types that are not
+    represented in JSON natively, such as datetime or enums, are validated.
+    """
+
+    def __init__(self) -> None:
+        self.__constructors: dict[Any, Constructor] = {}
+
+    def create(self, value_type: Any) -> Constructor:
+        if value_type is Any or value_type is object or value_type in _JSON_TYPES:
+            return _identity
+
+        origin = get_origin(value_type)
+        args = get_args(value_type)
+        if origin is Annotated:
+            return self.create(args[0])
+
+        if origin is Literal:
+            if all(isinstance(arg, _JSON_TYPES) and not isinstance(arg, Enum) for arg in args):
+                return _identity
+            return self.create_validator(value_type)
+
+        if origin is Union:
+            members = [arg for arg in args if arg is not type(None)]
+            if all(member in _JSON_TYPES for member in members):
+                return _identity
+            if len(members) == 1:
+                return _optional(self.create(members[0]))
+            return self.create_validator(value_type)
+
+        if origin in _SEQUENCE_TYPES and len(args) == 1:
+            return _list(self.create(args[0]))
+
+        if origin is tuple and len(args) == 2 and args[1] is Ellipsis:
+            return _tuple(self.create(args[0]))
+
+        if origin in _MAPPING_TYPES and len(args) == 2:
+            if args[0] is str or args[0] is Any:
+                return _dict(self.create(args[1]))
+            return self.create_validator(value_type)
+
+        if value_type is list or value_type is dict:
+            return _identity
+
+        if isclass(value_type):
+            return self.__create_class(value_type)
+
+        return self.create_validator(value_type)
+
+    def __create_class(self, cls: type[Any]) -> Constructor:
+        constructor = self.__constructors.get(cls)
+        if constructor is _pending:
+            # recursive types refer to the constructor before it is created
+            return lambda value: self.__constructors[cls](value)
+        if constructor is not None:
+            return constructor
+
+        self.__constructors[cls] = _pending
+        try:
+            if self.is_model(cls):
+                constructor = self.__create_model(cls)
+            elif dataclasses.is_dataclass(cls) and not self.is_validated_dataclass(cls):
+                constructor = self.__create_dataclass(cls)
+            elif is_typeddict(cls):
+                constructor = self.__create_typeddict(cls)
+            else:
+                constructor = self.create_validator(cls)
+        except NameError:
+            # forward references that cannot be resolved from the module of the class
+            constructor = self.create_validator(cls)
+        self.__constructors[cls] = constructor
+        return constructor
+
+    def __create_model(self, cls: type[Any]) -> Constructor:
+        construct_model = self.construct_model
+        fields = self.__create_fields(self.model_fields(cls))
+        if not fields:
+            return lambda value: construct_model(cls, value)
+
+        def construct(value: Any) -> Any:
+            values = dict(value)
+            for keys, field_constructor in fields:
+                for key in keys:
+                    if key in values:
+                        values[key] = field_constructor(values[key])
+                        break
+            return construct_model(cls, values)
+
+        return construct
+
+    def __create_dataclass(self, cls: type[Any]) -> Constructor:
+        type_hints = get_type_hints(cls, include_extras=True)
+        names = [field.name for field in dataclasses.fields(cls) if field.init]
+        fields = self.__create_fields((name, name, type_hints[name]) for name in names)
+
+        def construct(value: Any) -> Any:
+            values = {name: value[name] for name in names if name in value}
+            for keys, field_constructor in fields:
+                if keys[0] in values:
+                    values[keys[0]] = field_constructor(values[keys[0]])
+            return cls(**values)
+
+        return construct
+
+    def __create_typeddict(self, cls: type[Any]) -> Constructor:
+        type_hints = get_type_hints(cls, include_extras=True)
+        fields = self.__create_fields((name, name, annotation) for name, annotation in type_hints.items())
+        if not fields:
+            return _identity
+
+        def construct(value: Any) -> Any:
+            values = dict(value)
+            for keys, field_constructor in fields:
+                if keys[0] in values:
+                    values[keys[0]] = field_constructor(values[keys[0]])
+            return values
+
+        return construct
+
+    def __create_fields(self, fields: Iterable[tuple[str, str, Any]]) -> list[tuple[tuple[str, ...], Constructor]]:
+        result: list[tuple[tuple[str, ...], Constructor]] = []
+        for name, alias, annotation in fields:
+            field_constructor = self.create(annotation)
+            if field_constructor is not _identity:
+                keys = (alias,) if alias == name else (alias, name)
+                result.append((keys, field_constructor))
+        return result
+
+    @abstractmethod
+    def is_model(self, cls: type[Any]) -> bool: ...
+
+    @abstractmethod
+    def model_fields(self, cls: type[Any]) -> Iterable[tuple[str, str, Any]]:
+        """Returns the name, the alias and the annotation of each field of the model."""
+
+    @abstractmethod
+    def construct_model(self, cls: type[Any], values: dict[str, Any]) -> Any: ...
+
+    @abstractmethod
+    def is_validated_dataclass(self, cls: type[Any]) -> bool: ...
+
+    @abstractmethod
+    def create_validator(self, value_type: Any) -> Constructor: ...
+
+
+def _optional(constructor: Constructor) -> Constructor:
+    return lambda value: None if value is None else constructor(value)
+
+
+def _list(constructor: Constructor) -> Constructor:
+    if constructor is _identity:
+        return _identity
+    return lambda value: [constructor(item) for item in value]
+
+
+def _tuple(constructor: Constructor) -> Constructor:
+    if constructor is _identity:
+        return tuple
+    return lambda value: tuple(constructor(item) for item in value)
+
+
+def _dict(constructor: Constructor) -> Constructor:
+    if constructor is _identity:
+        return _identity
+    return lambda value: {key: constructor(item) for key, item in value.items()}
@@ -1,5 +1,6 @@
 #  Copyright 2024 The Meatie Authors. All rights reserved.
 #  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+from functools import lru_cache
 from importlib.metadata import PackageNotFoundError, version
 from inspect import isclass
 from types import GenericAlias
@@ -13,19 +14,25 @@ from typing import (
     Union,
     get_args,
     get_origin,
+    overload,
 )
 
 from typing_extensions import Annotated
 
 from meatie.internal.types import T
+from meatie.lazy import Lazy
+from meatie.projection import Projection
 from meatie.types import AsyncResponse, Response
 
 from .bytes_ import BytesAdapter
 from .client_response import ClientResponseAdapter
 from .json_ import JsonAdapter
+from .json_stream import JsonStreamAdapter
+from .lazy_ import LazyAdapter, LazyFields
 from .none_ import NoneAdapter
+from .stream_ import StreamAdapter, is_stream_type
 from .string_ import StringAdapter
-from .types import TypeAdapter
+from .types import JsonTypeAdapter, TypeAdapter
 
 
 def _is_model_type_no_pydantic(value: type[Any]) -> bool:  # pragma: no cover
@@ -38,6 +45,13 @@ class PydanticTypeAdapterFactory(Protocol):
     @staticmethod
     def is_model_type(model_cls: type[Any]) -> bool: ...
 
+    @staticmethod
+    def create_lazy_fields(model_cls: Any) -> Optional[LazyFields]: ...
+
+    @staticmethod
+    def projected_fields(model_cls: Any) -> Optional[list[tuple[str, str, Any]]]:
+        """Returns the name, the key in JSON and the annotation of each field, or None if the model cannot be projected."""
+
 
 def _resolve_pydantic_type_adapter_factory() -> Optional[PydanticTypeAdapterFactory]:  # pragma: no cover
     try:
@@ -58,6 +72,27 @@ def _resolve_pydantic_type_adapter_factory() -> Optional[PydanticTypeAdapterFact
 _PydanticTypeAdapterFactory: Optional[PydanticTypeAdapterFactory] = _resolve_pydantic_type_adapter_factory()
 
 
+class StructTypeAdapterFactory(Protocol):
+    def __call__(self, model_cls: type[T]) -> TypeAdapter[T]: ...
+
+    @staticmethod
+    def is_model_type(model_cls: Any) -> bool: ...
+
+
+def _resolve_msgspec_type_adapter_factory() -> Optional[StructTypeAdapterFactory]:  # pragma: no cover
+    try:
+        version("msgspec")
+    except PackageNotFoundError:
+        return None
+
+    from .msgspec_ import MsgspecTypeAdapterFactory
+
+    return MsgspecTypeAdapterFactory()
+
+
+_MsgspecTypeAdapterFactory: Optional[StructTypeAdapterFactory] = _resolve_msgspec_type_adapter_factory()
+
+
 def _resolve_is_model_type() -> Callable[[type[Any]], bool]:
     if _PydanticTypeAdapterFactory is None:
         return _is_model_type_no_pydantic
@@ -67,7 +102,37 @@ def _resolve_is_model_type() -> Callable[[type[Any]], bool]:
 _is_model_type = _resolve_is_model_type()
 
 
-def get_adapter(value_type: Union[type[T], GenericAlias, None]) -> TypeAdapter[T]:
+# Maximum number of adapters kept in the registry. Adapters of types evicted from the registry are created again on demand.
+ADAPTER_REGISTRY_MAX_SIZE = 1024
+
+
+@overload
+def get_adapter(value_type: type[T]) -> TypeAdapter[T]: ...
+
+
+# type forms that are not classes, such as Annotated, Union or None
+@overload
+def get_adapter(value_type: Any) -> TypeAdapter[Any]: ...
+
+
+def get_adapter(value_type: Any) -> TypeAdapter[Any]:
+    try:
+        hash(value_type)
+    except TypeError:
+        # Annotated types may carry unhashable metadata, such as dictionaries
+        return _create_adapter(value_type)
+
+    # Equal types may differ in ways that matter for validation, e.g., the order of Union members, so the
+    # representation of the type is a part of the key.
+    return _get_registered_adapter(value_type, repr(value_type))
+
+
+@lru_cache(maxsize=ADAPTER_REGISTRY_MAX_SIZE)
+def _get_registered_adapter(value_type: Any, type_repr: str) -> TypeAdapter[Any]:
+    return _create_adapter(value_type)
+
+
+def _create_adapter(value_type: Union[type[T], GenericAlias, None]) -> TypeAdapter[T]:
     if value_type is None:
         return NoneAdapter  # type: ignore[return-value]
 
@@ -77,12 +142,35 @@ def get_adapter(value_type: Union[type[T], GenericAlias, None]) -> TypeAdapter[T
     if value_type is str:
         return StringAdapter  # type: ignore[return-value]
 
+    if get_origin(value_type) is Lazy:
+        return _create_lazy_adapter(get_args(value_type)[0])
+
+    if get_origin(value_type) is Annotated:
+        base_type, *metadata = get_args(value_type)
+        if any(isinstance(item, Projection) for item in metadata):
+            metadata = [item for item in metadata if not isinstance(item, Projection)]
+            return _create_projection_adapter(Annotated[(base_type, *metadata)] if metadata else base_type)
+
+    if is_stream_type(value_type):
+        item_type = get_args(value_type)[0]
+        if item_type is bytes:
+            return StreamAdapter  # type: ignore[return-value]
+
+        item_adapter = get_adapter(item_type)
+        batch_adapter = get_adapter(list[item_type])  # type: ignore[valid-type]
+        if not isinstance(item_adapter, JsonTypeAdapter) or not isinstance(batch_adapter, JsonTypeAdapter):
+            item_adapter = batch_adapter = JsonAdapter
+        return JsonStreamAdapter(item_adapter, batch_adapter)  # type: ignore[return-value]
+
+    if _MsgspecTypeAdapterFactory is not None and _MsgspecTypeAdapterFactory.is_model_type(value_type):
+        return _MsgspecTypeAdapterFactory(value_type)  # type: ignore[arg-type]
+
     # Handle Annotated types: check base type but pass full Annotated type to pydantic
     origin = get_origin(value_type)
     if origin is Annotated:
         base_type = get_args(value_type)[0]
-        # Check if base type is a pydantic model
-        if _is_model_type(base_type):
+        # Check if base type is a pydantic model or a collection of pydantic models, e.g., conlist
+        if _is_model_type(base_type) or _is_model_collection_type(base_type):
             if _PydanticTypeAdapterFactory is None:
                 return JsonAdapter
             # Pass the full Annotated type to preserve metadata (discriminators, etc.)
@@ -120,3 +208,38 @@ def get_adapter(value_type: Union[type[T], GenericAlias, None]) -> TypeAdapter[T
         return ClientResponseAdapter  # type: ignore[return-value]
 
     return JsonAdapter
+
+
+def _is_model_collection_type(value_type: Any) -> bool:
+    origin = get_origin(value_type)
+    if not isclass(origin):
+        return False
+
+    args = get_args(value_type)
+    if issubclass(origin, Sequence) and len(args) == 1:
+        return _is_model_type(args[0])
+    if issubclass(origin, Mapping) and len(args) == 2:
+        return _is_model_type(args[1])
+    return False
+
+
+def _create_lazy_adapter(model_type: Any) -> TypeAdapter[Any]:
+    fields = None if _PydanticTypeAdapterFactory is None else _PydanticTypeAdapterFactory.create_lazy_fields(model_type)
+    model_adapter = get_adapter(model_type)
+    if fields is None or not isinstance(model_adapter, JsonTypeAdapter):
+        raise ValueError(f"Lazy requires a pydantic model, got '{model_type}'")
+    return LazyAdapter(model_type, model_adapter, fields)
+
+
+def _create_projection_adapter(value_type: Any) -> TypeAdapter[Any]:
+    model_adapter = get_adapter(value_type)
+    if (
+        _MsgspecTypeAdapterFactory is None
+        or _PydanticTypeAdapterFactory is None
+        or not isinstance(model_adapter, JsonTypeAdapter)
+    ):
+        return model_adapter
+
+    from .projection import create_projection_adapter
+
+    return create_projection_adapter(value_type, model_adapter, _PydanticTypeAdapterFactory.projected_fields)
@@ -1,11 +1,16 @@
 #  Copyright 2024 The Meatie Authors. All rights reserved.
 #  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+import json
 from json import JSONDecodeError
-from typing import Any
+from typing import Any, Callable, Union
 
+from meatie.codec import get_json_codec
 from meatie.error import ParseResponseError, ResponseError
+from meatie.internal.types import T
 from meatie.types import AsyncResponse, Response
 
+from .types import JsonTypeAdapter
+
 
 class _JsonAdapter:
     @staticmethod
@@ -28,9 +33,33 @@ class _JsonAdapter:
         except (ParseResponseError, ResponseError):
             raise
 
+    @staticmethod
+    def from_json(data: bytes) -> Any:
+        return json.loads(data)
+
     @staticmethod
     def to_content(value: Any) -> Any:
         return value
 
 
 JsonAdapter = _JsonAdapter()
+
+
+def has_custom_json(response: Union[Response, AsyncResponse]) -> bool:
+    """Returns True if the JSON decoder of the response was customized, i.e., using the body option.
+
+    Adapters that can decode the raw response body should use the JSON decoder of the response instead.
+    """
+    return "get_json" in getattr(response, "__dict__", ())
+
+
+def get_json_loads(adapter: JsonTypeAdapter[T], response: Union[Response, AsyncResponse]) -> Callable[[bytes], T]:
+    """Returns the function that decodes JSON documents read from the response body using the adapter.
+
+    Adapters that return plain JSON values are replaced by the JSON codec of the client, if the client has one.
+    """
+    if adapter is JsonAdapter:
+        json_codec = get_json_codec(response)
+        if json_codec is not None:
+            return json_codec.loads
+    return adapter.from_json
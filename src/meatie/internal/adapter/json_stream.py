@@ -0,0 +1,335 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+import asyncio
+import re
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Generator,
+    Generic,
+    Iterator,
+    NoReturn,
+    Optional,
+    Union,
+    cast,
+    get_origin,
+)
+
+from meatie.error import ParseResponseError
+from meatie.internal.types import T
+from meatie.types import AsyncResponse, Response
+
+from .json_ import JsonAdapter, get_json_loads, has_custom_json
+from .types import JsonTypeAdapter, TypeAdapter
+
+# Consume bytes up to the next structural character skipping over complete strings. Commas are structural only between
+# the items of the top-level array. An incomplete string at the end of the buffer stops the scan at its opening quote.
+_TOP_LEVEL_SCAN = re.compile(rb'[^\[\]{},"]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^\[\]{},"]*)*', re.DOTALL)
+_NESTED_SCAN = re.compile(rb'[^\[\]{}"]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^\[\]{}"]*)*', re.DOTALL)
+_WHITESPACE = re.compile(rb"[ \t\r\n]*")
+_JSON_LINES_MEDIA_TYPES = frozenset(["application/x-ndjson", "application/jsonl", "application/json-seq"])
+# JSON text sequences (RFC 7464) prefix every record with the ASCII record separator.
+_RECORD_SEPARATOR = b"\x1e"
+_OPEN_ARRAY, _CLOSE_ARRAY, _OPEN_OBJECT, _CLOSE_OBJECT, _QUOTE = b'[]{}"'
+
+
+class JsonStreamAdapter(Generic[T]):
+    """Decodes the response body to an iterator over records as the body arrives.
+
+    A body with the Content-Type of JSON Lines (NDJSON) or JSON text sequences is decoded one record per line. Otherwise,
+    a body that starts with `[` is decoded as a JSON array, one record per item, and any other body is decoded in the
+    JSON Lines format. Only the records received in the last chunk are kept in memory.
+    """
+
+    def __init__(self, item_adapter: JsonTypeAdapter[T], batch_adapter: JsonTypeAdapter[list[T]]) -> None:
+        self.item_adapter = item_adapter
+        self.batch_adapter = batch_adapter
+
+    def from_response(self, response: Response) -> Iterator[T]:
+        return self.__iter_records(response)
+
+    async def from_async_response(self, response: AsyncResponse) -> AsyncIterator[T]:
+        return self.__aiter_records(response)
+
+    @staticmethod
+    def to_content(value: Iterator[T]) -> NoReturn:
+        raise RuntimeError("Streaming request body is not supported")
+
+    def __iter_records(self, response: Response) -> Generator[T, None, None]:
+        decoder = _RecordDecoder(self.item_adapter, self.batch_adapter, response)
+        chunks = response.iter_bytes()
+        try:
+            splitter = _create_splitter_from_headers(response)
+            for chunk in chunks:
+                if splitter is None:
+                    splitter = _create_splitter(chunk)
+                    if splitter is None:
+                        continue
+                yield from decoder.decode_all(splitter, self.__feed(splitter, chunk, response))
+            if splitter is not None:
+                yield from decoder.decode_all(splitter, self.__finish(splitter, response))
+        finally:
+            chunks.close()
+
+    async def __aiter_records(self, response: AsyncResponse) -> AsyncGenerator[T, None]:
+        decoder = _RecordDecoder(self.item_adapter, self.batch_adapter, response)
+        chunks = response.iter_bytes()
+        try:
+            splitter = _create_splitter_from_headers(response)
+            async for chunk in chunks:
+                if splitter is None:
+                    splitter = _create_splitter(chunk)
+                    if splitter is None:
+                        continue
+                for record in decoder.decode_all(splitter, self.__feed(splitter, chunk, response)):
+                    yield record
+            if splitter is not None:
+                for record in decoder.decode_all(splitter, self.__finish(splitter, response)):
+                    yield record
+        finally:
+            await chunks.aclose()
+
+    @staticmethod
+    def __feed(splitter: "_Splitter", chunk: bytes, response: Union[Response, AsyncResponse]) -> list[bytes]:
+        try:
+            return splitter.feed(chunk)
+        except ValueError as exc:
+            raise ParseResponseError(splitter.pending().decode(errors="replace"), response) from exc
+
+    @staticmethod
+    def __finish(splitter: "_Splitter", response: Union[Response, AsyncResponse]) -> list[bytes]:
+        try:
+            return splitter.finish()
+        except ValueError as exc:
+            raise ParseResponseError(splitter.pending().decode(errors="replace"), response) from exc
+
+
+class _RecordDecoder(Generic[T]):
+    __slots__ = ("item_loads", "batch_loads", "response")
+
+    def __init__(
+        self,
+        item_adapter: JsonTypeAdapter[T],
+        batch_adapter: JsonTypeAdapter[list[T]],
+        response: Union[Response, AsyncResponse],
+    ) -> None:
+        self.item_loads = get_json_loads(item_adapter, response)
+        self.batch_loads = get_json_loads(batch_adapter, response)
+        self.response = response
+
+    def decode_all(self, splitter: "_Splitter", items: list[bytes]) -> list[T]:
+        if len(items) > 1 and isinstance(splitter, _JsonArraySplitter):
+            # Items of a JSON array are separated by commas already, so they are validated in a single call.
+            try:
+                records = self.batch_loads(b"[" + b",".join(items) + b"]")
+            except ValueError:
+                pass  # decode items one by one to report the invalid item
+            else:
+                if len(records) == len(items):
+                    return records
+        return [self.decode(item) for item in items]
+
+    def decode(self, item: bytes) -> T:
+        try:
+            return self.item_loads(item)
+        except ValueError as exc:
+            raise ParseResponseError(item.decode(errors="replace"), self.response) from exc
+
+
+class ChunkedJsonAdapter(Generic[T]):
+    """Decodes large JSON arrays in chunks, so the event loop runs other tasks between the chunks.
+
+    Items of the array are validated in batches by the adapter of the endpoint. Bodies smaller than the threshold, bodies
+    that are not JSON arrays and bodies that fail the validation are decoded by the adapter in a single call. Use
+    `chunk_adapter` to create the adapter, it keeps the adapters of types with constraints on the whole list unchanged.
+    """
+
+    def __init__(self, adapter: JsonTypeAdapter[T], threshold: int, chunk_size: int) -> None:
+        self.adapter = adapter
+        self.threshold = threshold
+        self.chunk_size = chunk_size
+
+    def from_response(self, response: Response) -> T:
+        return self.adapter.from_response(response)
+
+    async def from_async_response(self, response: AsyncResponse) -> T:
+        if not has_custom_json(response):
+            content = await response.read()
+            if len(content) >= self.threshold and _is_json_array(content):
+                records = await self.__decode_chunks(content, get_json_loads(self.adapter, response))
+                if records is not None:
+                    return cast(T, records)
+        return await self.adapter.from_async_response(response)
+
+    def to_content(self, value: T) -> Any:
+        return self.adapter.to_content(value)
+
+    async def __decode_chunks(self, content: bytes, loads: Callable[[bytes], T]) -> Optional[list[Any]]:
+        splitter = _JsonArraySplitter()
+        records: list[Any] = []
+        try:
+            for start in range(0, len(content), self.chunk_size):
+                items = splitter.feed(content[start : start + self.chunk_size])
+                if items:
+                    batch = loads(b"[" + b",".join(items) + b"]")
+                    if not isinstance(batch, list) or len(batch) != len(items):
+                        return None
+                    records.extend(batch)
+                await asyncio.sleep(0)
+            splitter.finish()
+        except Exception:
+            # the adapter decodes the whole body again to report the error
+            return None
+        return records
+
+
+def chunk_adapter(adapter: TypeAdapter[T], threshold: Optional[int], chunk_size: int) -> TypeAdapter[T]:
+    if threshold is None or not isinstance(adapter, JsonTypeAdapter) or not _validates_items_only(adapter):
+        return adapter
+    return ChunkedJsonAdapter(adapter, threshold, chunk_size)
+
+
+def _validates_items_only(adapter: JsonTypeAdapter[Any]) -> bool:
+    # Each batch is validated as a list on its own, so the constraints on the whole list, such as the maximum length of
+    # conlist or the metadata of Annotated, would not be checked. Only the adapters of plain lists are decoded in chunks.
+    if adapter is JsonAdapter:
+        return True
+    return get_origin(getattr(adapter, "model_type", None)) is list
+
+
+class _JsonLinesSplitter:
+    __slots__ = ("__parts",)
+
+    def __init__(self) -> None:
+        self.__parts: list[bytes] = []
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        # Only the new chunk is searched for line breaks, parts of a line that spans many chunks are joined once.
+        lines = []
+        start = 0
+        end = chunk.find(b"\n")
+        while end >= 0:
+            self.__parts.append(chunk[start:end])
+            line = b"".join(self.__parts)
+            self.__parts.clear()
+            line = line.lstrip(_RECORD_SEPARATOR)
+            if line.strip():
+                lines.append(line)
+            start = end + 1
+            end = chunk.find(b"\n", start)
+        if start < len(chunk):
+            self.__parts.append(chunk[start:])
+        return lines
+
+    def finish(self) -> list[bytes]:
+        line = self.pending().lstrip(_RECORD_SEPARATOR)
+        self.__parts.clear()
+        return [line] if line.strip() else []
+
+    def pending(self) -> bytes:
+        return b"".join(self.__parts)
+
+
+class _JsonArraySplitter:
+    __slots__ = ("__buffer", "__position", "__depth", "__separated", "__done")
+
+    def __init__(self) -> None:
+        self.__buffer = b""
+        self.__position = 0
+        self.__depth = 0
+        self.__separated = False
+        self.__done = False
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        # The buffer holds the bytes of the current item only, the position is where the scan should be resumed.
+        buffer = self.__buffer + chunk
+        size = len(buffer)
+        position = self.__position
+        item_start = 0
+        depth = self.__depth
+        items = []
+        while position < size:
+            if self.__done:
+                position = _WHITESPACE.match(buffer, position).end()  # type: ignore[union-attr]
+                if position < size:
+                    raise ValueError("Unexpected data after the end of the JSON array")
+                break
+
+            if depth == 0:
+                position = _WHITESPACE.match(buffer, position).end()  # type: ignore[union-attr]
+                if position == size:
+                    break
+                if buffer[position] != _OPEN_ARRAY:
+                    raise ValueError("Response body is not a JSON array")
+                depth = 1
+                position += 1
+                item_start = position
+                continue
+
+            scan = _TOP_LEVEL_SCAN if depth == 1 else _NESTED_SCAN
+            position = scan.match(buffer, position).end()  # type: ignore[union-attr]
+            if position == size:
+                break
+
+            char = buffer[position]
+            if char == _QUOTE:
+                break  # the string is not complete yet, wait for more data
+            if char == _OPEN_ARRAY or char == _OPEN_OBJECT:
+                depth += 1
+            elif char == _CLOSE_ARRAY or char == _CLOSE_OBJECT:
+                depth -= 1
+                if depth == 0:
+                    item = buffer[item_start:position].strip()
+                    if item or self.__separated:
+                        items.append(self.__item(item))
+                    self.__done = True
+            else:  # comma separating items of the top-level array
+                items.append(self.__item(buffer[item_start:position].strip()))
+                self.__separated = True
+                item_start = position + 1
+            position += 1
+
+        self.__buffer = buffer[item_start:]
+        self.__position = position - item_start
+        self.__depth = depth
+        return items
+
+    def finish(self) -> list[bytes]:
+        if not self.__done:
+            raise ValueError("JSON array is truncated")
+        return []
+
+    def pending(self) -> bytes:
+        return self.__buffer
+
+    @staticmethod
+    def __item(item: bytes) -> bytes:
+        if not item:
+            raise ValueError("JSON array has an empty item")
+        return item
+
+
+_Splitter = Union[_JsonLinesSplitter, _JsonArraySplitter]
+
+
+def _is_json_array(content: bytes) -> bool:
+    position = _WHITESPACE.match(content).end()  # type: ignore[union-attr]
+    return content[position : position + 1] == b"["
+
+
+def _create_splitter_from_headers(response: Union[Response, AsyncResponse]) -> Optional[_Splitter]:
+    media_type = response.headers.get("Content-Type", "").partition(";")[0].strip().lower()
+    if media_type in _JSON_LINES_MEDIA_TYPES:
+        return _JsonLinesSplitter()
+    return None
+
+
+def _create_splitter(chunk: bytes) -> Optional[_Splitter]:
+    first_char = chunk.lstrip()[:1]
+    if not first_char:
+        return None
+    if first_char == b"[":
+        return _JsonArraySplitter()
+    return _JsonLinesSplitter()
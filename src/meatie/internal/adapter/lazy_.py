@@ -0,0 +1,188 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+import json
+import re
+from collections.abc import Mapping
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Callable, Generic, Optional, Protocol
+
+from meatie.error import ParseResponseError
+from meatie.internal.types import T
+from meatie.lazy import Lazy
+from meatie.types import AsyncResponse, Response
+
+from . import JsonAdapter
+from .json_ import has_custom_json
+from .json_stream import _CLOSE_ARRAY, _CLOSE_OBJECT, _NESTED_SCAN, _OPEN_ARRAY, _OPEN_OBJECT, _WHITESPACE
+from .types import JsonTypeAdapter
+
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_SCALAR = re.compile(rb"[^,}\]\s]+")
+
+
+class LazyFields(Protocol):
+    @property
+    def keys(self) -> Mapping[str, str]: ...
+
+    def decode(self, name: str, data: bytes) -> Any: ...
+
+    def default(self, name: str) -> Any: ...
+
+
+class ObjectIndex(Protocol):
+    @property
+    def content(self) -> bytes: ...
+
+    def get(self, key: str) -> Optional[bytes]: ...
+
+
+class JsonObjectIndex:
+    """Finds the members of a JSON object without parsing their values.
+
+    The object is scanned up to the member that is looked up, so members at the beginning of a large object are found
+    without scanning the rest of the object.
+    """
+
+    __slots__ = ("content", "__position", "__spans", "__separated", "__done")
+
+    def __init__(self, content: bytes) -> None:
+        position = _WHITESPACE.match(content).end()  # type: ignore[union-attr]
+        if content[position : position + 1] != b"{":
+            raise ValueError("Response body is not a JSON object")
+
+        self.content = content
+        self.__position = position + 1
+        self.__spans: dict[str, tuple[int, int]] = {}
+        self.__separated = False
+        self.__done = False
+
+    def get(self, key: str) -> Optional[bytes]:
+        span = self.__spans.get(key)
+        while span is None and not self.__done:
+            if self.__scan_member() == key:
+                span = self.__spans[key]
+        if span is None:
+            return None
+        return self.content[span[0] : span[1]]
+
+    def __scan_member(self) -> Optional[str]:
+        content = self.content
+        position = _WHITESPACE.match(content, self.__position).end()  # type: ignore[union-attr]
+        char = content[position : position + 1]
+        if char == b"}":
+            if content[_WHITESPACE.match(content, position + 1).end() :]:  # type: ignore[union-attr]
+                raise ValueError("Unexpected data after the end of the JSON object")
+            self.__done = True
+            return None
+
+        if self.__separated:
+            if char != b",":
+                raise ValueError("Expected ',' or '}' after the value")
+            position = _WHITESPACE.match(content, position + 1).end()  # type: ignore[union-attr]
+
+        key_match = _STRING.match(content, position)
+        if key_match is None:
+            raise ValueError("Expected a key")
+        raw_key = key_match.group()
+        key: str = json.loads(raw_key) if b"\\" in raw_key else raw_key[1:-1].decode()
+
+        position = _WHITESPACE.match(content, key_match.end()).end()  # type: ignore[union-attr]
+        if content[position : position + 1] != b":":
+            raise ValueError("Expected ':' after the key")
+        start = _WHITESPACE.match(content, position + 1).end()  # type: ignore[union-attr]
+        end = self.__skip_value(start)
+
+        self.__spans.setdefault(key, (start, end))
+        self.__position = end
+        self.__separated = True
+        return key
+
+    def __skip_value(self, position: int) -> int:
+        content = self.content
+        char = content[position : position + 1]
+        if char == b'"':
+            match = _STRING.match(content, position)
+            if match is None:
+                raise ValueError("String is not terminated")
+            return match.end()
+
+        if char == b"{" or char == b"[":
+            size = len(content)
+            depth = 1
+            position += 1
+            while depth:
+                position = _NESTED_SCAN.match(content, position).end()  # type: ignore[union-attr]
+                if position == size:
+                    raise ValueError("JSON object is truncated")
+                char_code = content[position]
+                if char_code == _OPEN_ARRAY or char_code == _OPEN_OBJECT:
+                    depth += 1
+                elif char_code == _CLOSE_ARRAY or char_code == _CLOSE_OBJECT:
+                    depth -= 1
+                else:
+                    raise ValueError("String is not terminated")
+                position += 1
+            return position
+
+        match = _SCALAR.match(content, position)
+        if match is None:
+            raise ValueError("Expected a value")
+        return match.end()
+
+
+def _resolve_create_object_index() -> Callable[[bytes], ObjectIndex]:  # pragma: no cover
+    try:
+        version("msgspec")
+    except PackageNotFoundError:
+        return JsonObjectIndex
+
+    from .msgspec_ import create_object_index
+
+    return create_object_index
+
+
+create_object_index = _resolve_create_object_index()
+
+
+class LazyAdapter(Generic[T]):
+    def __init__(self, model_type: type[T], model_adapter: JsonTypeAdapter[T], fields: LazyFields) -> None:
+        self.model_name = model_type.__name__
+        self.model_adapter = model_adapter
+        self.fields = fields
+        self.keys = fields.keys
+
+    def from_response(self, response: Response) -> Lazy[T]:
+        if has_custom_json(response):
+            content = json.dumps(JsonAdapter.from_response(response)).encode()
+        else:
+            content = response.read()
+        try:
+            index = create_object_index(content)
+        except ValueError as exc:
+            text = response.text()
+            raise ParseResponseError(text, response) from exc
+        return Lazy(index, self, response)
+
+    async def from_async_response(self, response: AsyncResponse) -> Lazy[T]:
+        if has_custom_json(response):
+            content = json.dumps(await JsonAdapter.from_async_response(response)).encode()
+        else:
+            content = await response.read()
+        try:
+            index = create_object_index(content)
+        except ValueError as exc:
+            text = await response.text()
+            raise ParseResponseError(text, response) from exc
+        return Lazy(index, self, response)
+
+    def to_content(self, value: Lazy[T]) -> Any:
+        return self.model_adapter.to_content(value.materialize())
+
+    def decode_field(self, name: str, data: bytes) -> Any:
+        return self.fields.decode(name, data)
+
+    def default(self, name: str) -> Any:
+        return self.fields.default(name)
+
+    def materialize(self, data: bytes) -> T:
+        return self.model_adapter.from_json(data)
@@ -0,0 +1,106 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+from inspect import isclass
+from typing import Any, Generic, Mapping, Optional, Sequence, Union, get_args, get_origin
+
+import msgspec
+from typing_extensions import Annotated
+
+from meatie.error import ParseResponseError
+from meatie.internal.types import T
+from meatie.types import AsyncResponse, Response
+
+from . import JsonAdapter, TypeAdapter
+from .json_ import has_custom_json
+
+_encoder = msgspec.json.Encoder()
+_object_decoder = msgspec.json.Decoder(dict[str, msgspec.Raw])
+
+
+class MsgspecTypeAdapter(Generic[T]):
+    def __init__(self, model_type: type[T]) -> None:
+        self.model_type = model_type
+        self.decoder = msgspec.json.Decoder(model_type)
+
+    def from_response(self, response: Response) -> T:
+        content = None if has_custom_json(response) else response.read()
+        try:
+            if isinstance(content, bytes):
+                return self.decoder.decode(content)
+            return msgspec.convert(JsonAdapter.from_response(response), self.model_type)
+        except msgspec.DecodeError as exc:  # msgspec.ValidationError is a subclass of msgspec.DecodeError
+            text = response.text()
+            raise ParseResponseError(text, response) from exc
+
+    async def from_async_response(self, response: AsyncResponse) -> T:
+        content = None if has_custom_json(response) else await response.read()
+        try:
+            if isinstance(content, bytes):
+                return self.decoder.decode(content)
+            return msgspec.convert(await JsonAdapter.from_async_response(response), self.model_type)
+        except msgspec.DecodeError as exc:
+            text = await response.text()
+            raise ParseResponseError(text, response) from exc
+
+    def from_json(self, data: bytes) -> T:
+        return self.decoder.decode(data)
+
+    @staticmethod
+    def to_content(value: T) -> Any:
+        return msgspec.to_builtins(value)
+
+    @staticmethod
+    def to_json(value: T) -> bytes:
+        return _encoder.encode(value)
+
+
+class RawJsonObjectIndex:
+    """Holds the members of a JSON object as raw JSON values."""
+
+    __slots__ = ("content", "__members")
+
+    def __init__(self, content: bytes, members: dict[str, msgspec.Raw]) -> None:
+        self.content = content
+        self.__members = members
+
+    def get(self, key: str) -> Optional[bytes]:
+        member = self.__members.get(key)
+        if member is None:
+            return None
+        return bytes(member)
+
+
+def create_object_index(content: bytes) -> RawJsonObjectIndex:
+    # msgspec splits the object into raw members in C, which is much faster than scanning the object in Python
+    try:
+        members = _object_decoder.decode(content)
+    except msgspec.DecodeError as exc:
+        raise ValueError(str(exc)) from exc
+    return RawJsonObjectIndex(content, members)
+
+
+class MsgspecTypeAdapterFactory:
+    @staticmethod
+    def __call__(model_cls: type[T]) -> TypeAdapter[T]:
+        return MsgspecTypeAdapter(model_cls)
+
+    @classmethod
+    def is_model_type(cls, value: Any) -> bool:
+        if isclass(value):
+            return issubclass(value, msgspec.Struct)
+
+        origin = get_origin(value)
+        if origin is Annotated:
+            return cls.is_model_type(get_args(value)[0])
+
+        if origin is Union:
+            return all(arg is type(None) or cls.is_model_type(arg) for arg in get_args(value))
+
+        if isclass(origin):
+            args = get_args(value)
+            if issubclass(origin, Sequence) and len(args) == 1:
+                return cls.is_model_type(args[0])
+            if issubclass(origin, Mapping) and len(args) == 2:
+                return cls.is_model_type(args[1])
+
+        return False
@@ -0,0 +1,135 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+import collections.abc
+from inspect import isclass
+from typing import Any, Callable, Generic, Optional, Union, get_args, get_origin
+
+import msgspec
+from typing_extensions import Annotated
+
+from meatie.error import ParseResponseError
+from meatie.internal.types import T
+from meatie.types import AsyncResponse, Response
+
+from .json_ import has_custom_json
+from .types import JsonTypeAdapter
+
+ModelFields = Callable[[Any], Optional[list[tuple[str, str, Any]]]]
+
+_SEQUENCE_TYPES = (list, collections.abc.Sequence, collections.abc.MutableSequence)
+_MAPPING_TYPES = (dict, collections.abc.Mapping, collections.abc.MutableMapping)
+
+_encoder = msgspec.json.Encoder()
+
+
+class ProjectionFactory:
+    """Creates msgspec types that keep only the fields of models when decoding JSON.
+
+    Each model is replaced by a struct with the fields of the model, so the decoder skips the other members of the JSON
+    object. Values of other types are decoded as they are and validated against the model later.
+    """
+
+    def __init__(self, model_fields: ModelFields) -> None:
+        self.model_fields = model_fields
+        self.__structs: dict[Any, Any] = {}
+
+    def create(self, value_type: Any) -> Any:
+        origin = get_origin(value_type)
+        args = get_args(value_type)
+        if origin is Annotated:
+            return self.create(args[0])
+
+        if origin is Union:
+            members = [arg for arg in args if arg is not type(None)]
+            if len(members) == 1:
+                projected = self.create(members[0])
+                return Any if projected is Any else Optional[projected]
+            return Any
+
+        if origin in _SEQUENCE_TYPES and len(args) == 1:
+            projected = self.create(args[0])
+            return Any if projected is Any else list[projected]  # type: ignore[valid-type]
+
+        if origin in _MAPPING_TYPES and len(args) == 2 and args[0] is str:
+            projected = self.create(args[1])
+            return Any if projected is Any else dict[str, projected]  # type: ignore[valid-type]
+
+        if isclass(value_type):
+            return self.__create_struct(value_type)
+
+        return Any
+
+    def __create_struct(self, cls: type[Any]) -> Any:
+        if cls in self.__structs:
+            return self.__structs[cls]
+
+        # recursive models are decoded as they are below the first level
+        self.__structs[cls] = Any
+        fields = self.model_fields(cls)
+        if fields is None:
+            return Any
+
+        struct = msgspec.defstruct(
+            f"{cls.__name__}Projection",
+            [(name, self.create(annotation), msgspec.UNSET) for name, _, annotation in fields],
+            rename={name: key for name, key, _ in fields},
+        )
+        self.__structs[cls] = struct
+        return struct
+
+
+class ProjectionAdapter(Generic[T]):
+    def __init__(self, projection_type: Any, model_adapter: JsonTypeAdapter[T]) -> None:
+        self.decoder = msgspec.json.Decoder(projection_type)
+        self.model_adapter = model_adapter
+
+    def from_response(self, response: Response) -> T:
+        if has_custom_json(response):
+            return self.model_adapter.from_response(response)
+
+        content = self.__project(response.read())
+        if content is None:
+            return self.model_adapter.from_response(response)
+
+        try:
+            return self.model_adapter.from_json(content)
+        except ValueError as exc:
+            text = response.text()
+            raise ParseResponseError(text, response) from exc
+
+    async def from_async_response(self, response: AsyncResponse) -> T:
+        if has_custom_json(response):
+            return await self.model_adapter.from_async_response(response)
+
+        content = self.__project(await response.read())
+        if content is None:
+            return await self.model_adapter.from_async_response(response)
+
+        try:
+            return self.model_adapter.from_json(content)
+        except ValueError as exc:
+            text = await response.text()
+            raise ParseResponseError(text, response) from exc
+
+    def from_json(self, data: bytes) -> T:
+        content = self.__project(data)
+        return self.model_adapter.from_json(data if content is None else content)
+
+    def to_content(self, value: T) -> Any:
+        return self.model_adapter.to_content(value)
+
+    def __project(self, content: bytes) -> Optional[bytes]:
+        try:
+            return _encoder.encode(self.decoder.decode(content))
+        except msgspec.DecodeError:
+            # the model adapter reports invalid JSON and values that do not match the structure of the model
+            return None
+
+
+def create_projection_adapter(
+    value_type: Any, model_adapter: JsonTypeAdapter[T], model_fields: ModelFields
+) -> JsonTypeAdapter[T]:
+    projection_type = ProjectionFactory(model_fields).create(value_type)
+    if projection_type is Any:
+        return model_adapter
+    return ProjectionAdapter(projection_type, model_adapter)
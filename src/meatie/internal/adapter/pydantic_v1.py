@@ -3,10 +3,11 @@
 import json
 from dataclasses import is_dataclass
 from inspect import isclass
-from typing import Any, Generic, Union, get_args, get_origin
+from typing import Any, Callable, Generic, Iterable, Optional, Union, get_args, get_origin, get_type_hints
 
 import pydantic
 import pydantic.json
+from pydantic.typing import display_as_type
 from typing_extensions import Annotated, is_typeddict
 
 from meatie.error import ParseResponseError
@@ -14,39 +15,143 @@ from meatie.internal.types import T
 from meatie.types import AsyncResponse, Response
 
 from . import JsonAdapter, TypeAdapter
+from .construct import ConstructorFactory
+from .json_ import has_custom_json
+from .lazy_ import LazyFields
 
 
 class PydanticV1TypeAdapter(Generic[T]):
     def __init__(self, model_type: type[T]) -> None:
         self.model_type = model_type
+        # pydantic.parse_obj_as looks up the wrapper model on every call, so the model is created once per adapter
+        self.parsing_model = _create_parsing_model(model_type)
+        self.constructor: Optional[Callable[[Any], T]] = None
 
     def from_response(self, response: Response) -> T:
-        json_model = JsonAdapter.from_response(response)
+        content = None if has_custom_json(response) else response.read()
         try:
-            return pydantic.parse_obj_as(self.model_type, json_model)
+            if isinstance(content, bytes):
+                return self.parsing_model.parse_raw(content).__root__
+            return self.parsing_model(__root__=JsonAdapter.from_response(response)).__root__
         except pydantic.ValidationError as exc:
             text = response.text()
             raise ParseResponseError(text, response) from exc
 
     async def from_async_response(self, response: AsyncResponse) -> T:
-        json_model = await JsonAdapter.from_async_response(response)
+        content = None if has_custom_json(response) else await response.read()
         try:
-            return pydantic.parse_obj_as(self.model_type, json_model)
+            if isinstance(content, bytes):
+                return self.parsing_model.parse_raw(content).__root__
+            return self.parsing_model(__root__=await JsonAdapter.from_async_response(response)).__root__
         except pydantic.ValidationError as exc:
             text = await response.text()
             raise ParseResponseError(text, response) from exc
 
+    def from_json(self, data: bytes) -> T:
+        return self.parsing_model.parse_raw(data).__root__
+
+    def construct(self, value: Any) -> T:
+        constructor = self.constructor
+        if constructor is None:
+            constructor = _PydanticV1ConstructorFactory().create(self.model_type)
+            self.constructor = constructor
+        return constructor(value)
+
     @staticmethod
     def to_content(value: T) -> Any:
         json_string = json.dumps(value, default=pydantic.json.pydantic_encoder)
         return json.loads(json_string)
 
+    @staticmethod
+    def to_json(value: T) -> bytes:
+        return json.dumps(value, default=pydantic.json.pydantic_encoder, separators=(",", ":")).encode()
+
+
+def _create_parsing_model(model_type: Any) -> Any:
+    return pydantic.create_model(f"ParsingModel[{display_as_type(model_type)}]", __root__=(model_type, ...))
+
+
+class _PydanticV1ConstructorFactory(ConstructorFactory):
+    def is_model(self, cls: type[Any]) -> bool:
+        return issubclass(cls, pydantic.BaseModel) and not getattr(cls, "__custom_root_type__", False)
+
+    def model_fields(self, cls: type[Any]) -> Iterable[tuple[str, str, Any]]:
+        type_hints = get_type_hints(cls, include_extras=True)
+        return [(name, field.alias, type_hints.get(name, Any)) for name, field in cls.__fields__.items()]
+
+    def construct_model(self, cls: type[Any], values: dict[str, Any]) -> Any:
+        fields_values = {}
+        for name, field in cls.__fields__.items():
+            if field.alias in values:
+                fields_values[name] = values[field.alias]
+            elif name in values:
+                fields_values[name] = values[name]
+        return cls.construct(**fields_values)
+
+    def is_validated_dataclass(self, cls: type[Any]) -> bool:
+        return hasattr(cls, "__pydantic_model__")
+
+    def create_validator(self, value_type: Any) -> Callable[[Any], Any]:
+        parsing_model = _create_parsing_model(value_type)
+        return lambda value: parsing_model(__root__=value).__root__
+
+
+class _PydanticV1LazyFields:
+    def __init__(self, model_cls: Any) -> None:
+        self.model_cls = model_cls
+        self.model_fields = model_cls.__fields__
+        self.keys = {name: field.alias for name, field in self.model_fields.items()}
+
+    def decode(self, name: str, data: bytes) -> Any:
+        field = self.model_fields[name]
+        value, errors = field.validate(json.loads(data), {}, loc=field.alias, cls=self.model_cls)
+        if errors:
+            raise pydantic.ValidationError([errors], self.model_cls)
+        return value
+
+    def default(self, name: str) -> Any:
+        field = self.model_fields[name]
+        if field.required is True:
+            raise KeyError(name)
+        return field.get_default()
+
+
+def _get_projected_fields(model_cls: Any) -> Optional[list[tuple[str, str, Any]]]:
+    config = model_cls.__config__
+    if getattr(model_cls, "__custom_root_type__", False) or config.extra != pydantic.Extra.ignore:
+        return None
+    if model_cls.__pre_root_validators__:
+        return None
+
+    try:
+        type_hints = get_type_hints(model_cls, include_extras=True)
+    except NameError:
+        return None
+    fields = []
+    for name, field in model_cls.__fields__.items():
+        if config.allow_population_by_field_name and field.alias != name:
+            return None
+        fields.append((name, field.alias, type_hints.get(name, Any)))
+    return fields
+
 
 class PydanticV1TypeAdapterFactory:
     @staticmethod
     def __call__(model_cls: type[T]) -> TypeAdapter[T]:
         return PydanticV1TypeAdapter(model_cls)
 
+    @staticmethod
+    def create_lazy_fields(model_cls: Any) -> Optional[LazyFields]:
+        if isclass(model_cls) and issubclass(model_cls, pydantic.BaseModel):
+            return _PydanticV1LazyFields(model_cls)
+        return None
+
+    @staticmethod
+    def projected_fields(model_cls: Any) -> Optional[list[tuple[str, str, Any]]]:
+        if isclass(model_cls) and issubclass(model_cls, pydantic.BaseModel):
+            return _get_projected_fields(model_cls)
+        return None
+
     @classmethod
     def is_model_type(cls, value: Any) -> bool:
         if isclass(value):
@@ -2,7 +2,7 @@
 #  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
 from dataclasses import is_dataclass
 from inspect import isclass
-from typing import Any, Generic, get_args, get_origin
+from typing import Any, Generic, Optional, get_args, get_origin
 
 import pydantic
 from typing_extensions import Annotated, Union, is_typeddict
@@ -12,31 +12,70 @@ from meatie.internal.types import T
 from meatie.types import AsyncResponse, Response
 
 from . import JsonAdapter, TypeAdapter
+from .json_ import has_custom_json
+from .lazy_ import LazyFields
 
 
 class PydanticV2TypeAdapter(Generic[T]):
-    def __init__(self, adapter: pydantic.TypeAdapter[T]) -> None:
+    def __init__(self, adapter: pydantic.TypeAdapter[T], model_type: Any = None) -> None:
         self.adapter = adapter
+        # None if the adapter was created from a pydantic.TypeAdapter
+        self.model_type = model_type
 
     def from_response(self, response: Response) -> T:
-        json_model = JsonAdapter.from_response(response)
+        content = None if has_custom_json(response) else response.read()
         try:
-            return self.adapter.validate_python(json_model)
+            if isinstance(content, bytes):
+                return self.adapter.validate_json(content)
+            return self.adapter.validate_python(JsonAdapter.from_response(response))
         except pydantic.ValidationError as exc:
             text = response.text()
             raise ParseResponseError(text, response) from exc
 
     async def from_async_response(self, response: AsyncResponse) -> T:
-        json_model = await JsonAdapter.from_async_response(response)
+        content = None if has_custom_json(response) else await response.read()
         try:
-            return self.adapter.validate_python(json_model)
+            if isinstance(content, bytes):
+                return self.adapter.validate_json(content)
+            return self.adapter.validate_python(await JsonAdapter.from_async_response(response))
         except pydantic.ValidationError as exc:
             text = await response.text()
             raise ParseResponseError(text, response) from exc
 
+    def from_json(self, data: bytes) -> T:
+        return self.adapter.validate_json(data)
+
     def to_content(self, value: T) -> Any:
         return self.adapter.dump_python(value, mode="json", by_alias=True)
 
+    def to_json(self, value: T) -> bytes:
+        return self.adapter.dump_json(value, by_alias=True)
+
+
+class _PydanticV2LazyFields:
+    def __init__(self, model_cls: type[pydantic.BaseModel]) -> None:
+        self.model_fields = model_cls.model_fields
+        self.keys = {
+            name: field.validation_alias if isinstance(field.validation_alias, str) else field.alias or name
+            for name, field in self.model_fields.items()
+        }
+        self.adapters: dict[str, pydantic.TypeAdapter[Any]] = {}
+
+    def decode(self, name: str, data: bytes) -> Any:
+        adapter = self.adapters.get(name)
+        if adapter is None:
+            field = self.model_fields[name]
+            field_type: Any = Annotated[(field.annotation, *field.metadata)] if field.metadata else field.annotation
+            adapter = pydantic.TypeAdapter(field_type)
+            self.adapters[name] = adapter
+        return adapter.validate_json(data)
+
+    def default(self, name: str) -> Any:
+        field = self.model_fields[name]
+        if field.is_required():
+            raise KeyError(name)
+        return field.get_default(call_default_factory=True)
+
 
 class PydanticV2TypeAdapterFactory:
     @staticmethod
@@ -44,7 +83,33 @@ class PydanticV2TypeAdapterFactory:
         if isinstance(model_cls, pydantic.TypeAdapter):
             return PydanticV2TypeAdapter(model_cls)
         adapter = pydantic.TypeAdapter(model_cls)
-        return PydanticV2TypeAdapter(adapter)
+        return PydanticV2TypeAdapter(adapter, model_cls)
+
+    @staticmethod
+    def create_lazy_fields(model_cls: Any) -> Optional[LazyFields]:
+        if isclass(model_cls) and issubclass(model_cls, pydantic.BaseModel):
+            return _PydanticV2LazyFields(model_cls)
+        return None
+
+    @staticmethod
+    def projected_fields(model_cls: Any) -> Optional[list[tuple[str, str, Any]]]:
+        if not isclass(model_cls) or not issubclass(model_cls, pydantic.BaseModel):
+            return None
+        if issubclass(model_cls, pydantic.RootModel) or model_cls.model_config.get("extra") not in (None, "ignore"):
+            return None
+        if any(
+            decorator.info.mode != "after" for decorator in model_cls.__pydantic_decorators__.model_validators.values()
+        ):
+            return None
+
+        by_name = model_cls.model_config.get("populate_by_name") or model_cls.model_config.get("validate_by_name")
+        fields = []
+        for name, field in model_cls.model_fields.items():
+            key = field.validation_alias or field.alias or name
+            if not isinstance(key, str) or (by_name and key != name):
+                return None
+            fields.append((name, key, field.annotation))
+        return fields
 
     @classmethod
     def is_model_type(cls, value: Any) -> bool:
@@ -0,0 +1,30 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+from collections.abc import AsyncIterator, Iterator
+from typing import Any, NoReturn, get_args, get_origin
+
+from meatie.types import AsyncResponse, Response
+
+_STREAM_ORIGINS = (Iterator, AsyncIterator)
+
+
+def is_stream_type(value_type: Any) -> bool:
+    """Returns True if the type annotation is Iterator[T] or AsyncIterator[T], so the response body should be streamed."""
+    return get_origin(value_type) in _STREAM_ORIGINS and len(get_args(value_type)) == 1
+
+
+class _StreamAdapter:
+    @staticmethod
+    def from_response(response: Response) -> Iterator[bytes]:
+        return response.iter_bytes()
+
+    @staticmethod
+    async def from_async_response(response: AsyncResponse) -> AsyncIterator[bytes]:
+        return response.iter_bytes()
+
+    @staticmethod
+    def to_content(value: Any) -> NoReturn:
+        raise RuntimeError("Streaming request body is not supported")
+
+
+StreamAdapter = _StreamAdapter()
@@ -0,0 +1,48 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+from random import random
+from typing import Any, Generic
+
+from meatie.error import ParseResponseError
+from meatie.internal.types import T
+from meatie.types import AsyncResponse, Response
+
+from . import JsonAdapter
+from .types import ConstructTypeAdapter, TypeAdapter
+
+
+class TrustedTypeAdapter(Generic[T]):
+    def __init__(self, adapter: ConstructTypeAdapter[T], validation_ratio: float) -> None:
+        self.adapter = adapter
+        self.validation_ratio = validation_ratio
+
+    def from_response(self, response: Response) -> T:
+        if self.validation_ratio > 0.0 and random() < self.validation_ratio:
+            return self.adapter.from_response(response)
+
+        value = JsonAdapter.from_response(response)
+        try:
+            return self.adapter.construct(value)
+        except (AttributeError, KeyError, TypeError, ValueError) as exc:
+            text = response.text()
+            raise ParseResponseError(text, response) from exc
+
+    async def from_async_response(self, response: AsyncResponse) -> T:
+        if self.validation_ratio > 0.0 and random() < self.validation_ratio:
+            return await self.adapter.from_async_response(response)
+
+        value = await JsonAdapter.from_async_response(response)
+        try:
+            return self.adapter.construct(value)
+        except (AttributeError, KeyError, TypeError, ValueError) as exc:
+            text = await response.text()
+            raise ParseResponseError(text, response) from exc
+
+    def to_content(self, value: T) -> Any:
+        return self.adapter.to_content(value)
+
+
+def trust_adapter(adapter: TypeAdapter[T], validation_ratio: float) -> TypeAdapter[T]:
+    if validation_ratio >= 1.0 or not isinstance(adapter, ConstructTypeAdapter):
+        return adapter
+    return TrustedTypeAdapter(adapter, validation_ratio)
@@ -4,9 +4,10 @@
 from typing import (
     Any,
     Protocol,
+    runtime_checkable,
 )
 
-from meatie.internal.types import T
+from meatie.internal.types import T, T_In
 from meatie.types import AsyncResponse, Response
 
 
@@ -16,3 +17,18 @@ class TypeAdapter(Protocol[T]):
     async def from_async_response(self, response: AsyncResponse) -> T: ...
 
     def to_content(self, value: T) -> Any: ...
+
+
+@runtime_checkable
+class JsonTypeAdapter(TypeAdapter[T], Protocol[T]):
+    def from_json(self, data: bytes) -> T: ...
+
+
+@runtime_checkable
+class JsonEncoder(Protocol[T_In]):
+    def to_json(self, value: T_In) -> bytes: ...
+
+
+@runtime_checkable
+class ConstructTypeAdapter(TypeAdapter[T], Protocol[T]):
+    def construct(self, value: Any) -> T: ...
@@ -1,58 +1,463 @@
 #  Copyright 2025 The Meatie Authors. All rights reserved.
 #  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+import heapq
+import itertools
+import sys
+import threading
 import time
+import urllib.parse
+import weakref
 from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Mapping, Optional, cast
+
+from meatie.types import INF, Request
+
+
+def get_key(request: Request) -> str:
+    key = request.path
+    if request.params:
+        key += "?" + urllib.parse.urlencode(request.params)
+    return key
+
+
+class _NotModified:
+    def __repr__(self) -> str:
+        return "NOT_MODIFIED"
+
+
+# returned by the endpoint in place of the value, when a conditional request is answered with 304 Not Modified
+NOT_MODIFIED: Any = _NotModified()
+
+
+@dataclass
+class CachedResponse:
+    value: Any
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    # the length of the HTTP response body charged against the byte budget, None if the size was computed by the sizer
+    size: Optional[int] = None
+
+    @property
+    def has_validators(self) -> bool:
+        return self.etag is not None or self.last_modified is not None
+
+    def get_conditional_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def parse_cache_control(value: str) -> dict[str, Optional[str]]:
+    directives: dict[str, Optional[str]] = {}
+    for directive in value.split(","):
+        name, separator, argument = directive.partition("=")
+        name = name.strip().lower()
+        if name:
+            directives[name] = argument.strip().strip('"') if separator else None
+    return directives
+
+
+def get_ttl(headers: Mapping[str, str], default: float) -> Optional[float]:
+    """Returns: the freshness lifetime of the HTTP response in seconds, or None if the HTTP response must not be stored."""
+    directives = parse_cache_control(headers.get("Cache-Control", ""))
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0.0
+
+    max_age = _parse_seconds(directives.get("max-age"))
+    if max_age is not None:
+        return max(max_age - (_parse_seconds(headers.get("Age")) or 0), 0.0)
+
+    expires = headers.get("Expires")
+    if expires is not None:
+        expires_at = _parse_date(expires)
+        if expires_at is None:
+            # invalid dates, such as "0", represent a time in the past
+            return 0.0
+        date = _parse_date(headers.get("Date", "")) or datetime.now(timezone.utc)
+        return max((expires_at - date).total_seconds(), 0.0)
+
+    return default
+
+
+def _parse_seconds(value: Optional[str]) -> Optional[float]:
+    if value is None or not value.isdigit():
+        return None
+    return float(value)
+
+
+def _parse_date(value: str) -> Optional[datetime]:
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        return date.replace(tzinfo=timezone.utc)
+    return date
 
 
 @dataclass
 class _Record:
     value: Any
     expires_at: float
+    stale_until: float
+    size: int = 0
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of the cache usage.
+
+    Attributes:
+        entries: the number of entries in the cache, including expired entries that have not been removed yet.
+        bytes: the total estimated size of the entries in bytes. It is always 0 for caches without a byte budget.
+        evictions: the number of entries removed to meet the max_size or max_bytes limit since the cache was created.
+    """
+
+    entries: int
+    bytes: int
+    evictions: int
+
+
+def estimate_size(value: Any) -> int:
+    """Estimates the memory used by the value and the objects it references in bytes."""
+    size = 0
+    seen: set[int] = set()
+    pending = [value]
+    while pending:
+        item = pending.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        if isinstance(item, (str, bytes, bytearray, int, float, bool)) or item is None:
+            continue
+        if isinstance(item, dict):
+            pending.extend(item.keys())
+            pending.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            pending.extend(item)
+        elif hasattr(item, "__dict__"):
+            pending.append(item.__dict__)
+    return size
 
 
 class Cache:
-    def __init__(self, max_size: int = 1000) -> None:
+    def __init__(
+        self,
+        max_size: Optional[int] = 1000,
+        max_bytes: Optional[int] = None,
+        sizer: Optional[Callable[[Any], int]] = None,
+        sweep_interval: Optional[float] = None,
+    ) -> None:
+        """Creates a cache that evicts the least recently used entries.
+
+        Args:
+            max_size: the maximum number of entries, or None for no limit.
+            max_bytes: the maximum total size of the entries in bytes, or None for no limit. Each entry is charged the
+                length of the HTTP response body it was decoded from, as declared by the Content-Length header. Entries
+                of HTTP responses without the header are charged the size returned by the sizer. Entries larger than
+                max_bytes are not stored.
+            sizer: the function that returns the size of a cached value in bytes. The default is to estimate the
+                memory used by the value.
+            sweep_interval: if set, a background thread removes expired entries every sweep_interval seconds, so the
+                memory is released also when no new entries are stored. Otherwise, expired entries are removed when
+                the cache is full or when they are loaded.
+        """
         self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.sizer = sizer if sizer is not None else estimate_size
         self._storage: OrderedDict[str, _Record] = OrderedDict()
+        self._lock = threading.Lock()  # the cache may be used by multiple threads, i.e., in batch calls
+        self._bytes = 0
+        self._evictions = 0
+        # min-heap of the entries that expire ordered by the end of their stale period, the entries of deleted or
+        # replaced records are skipped when popped
+        self._expiry: list[tuple[float, int, str, _Record]] = []
+        self._sequence = itertools.count()
+        if sweep_interval is not None:
+            threading.Thread(
+                target=_sweep_periodically,
+                args=(weakref.ref(self), sweep_interval),
+                name="meatie-cache-sweeper",
+                daemon=True,
+            ).start()
 
     def load(self, key: str) -> Any:
         """Load a value from the cache."""
-        record = self._storage.get(key)
-        if record is None:
-            return None
+        with self._lock:
+            self._on_lookup(key)
+            record = self._storage.get(key)
+            if record is None:
+                return None
 
-        if record.expires_at < self._now():
-            del self._storage[key]
-            return None
+            now = self._now()
+            if record.expires_at < now:
+                if record.stale_until < now:
+                    self._remove(key)
+                return None
 
-        self._storage.move_to_end(key)  # Mark as most recently used
-        return record.value
+            self._touch(key)
+            return record.value
+
+    def load_stale(self, key: str) -> Optional[tuple[Any, float]]:
+        """Load a value from the cache that may have expired, but is still within its stale period.
+
+        Returns:
+            The value and the number of seconds since the value expired, which is negative for values that have not expired yet, or None if the value is not in the cache.
+        """
+        with self._lock:
+            self._on_lookup(key)
+            record = self._storage.get(key)
+            if record is None:
+                return None
+
+            now = self._now()
+            if record.stale_until < now:
+                self._remove(key)
+                return None
+
+            self._touch(key)
+            return record.value, now - record.expires_at
+
+    def store(self, key: str, value: Any, ttl: float, stale_ttl: float = 0.0, size: Optional[int] = None) -> None:
+        """Store a value in the cache.
 
-    def store(self, key: str, value: Any, ttl: float) -> None:
-        """Store a value in the cache."""
-        self._storage[key] = _Record(value=value, expires_at=self._now() + ttl)
+        The value expires after ttl seconds. Expired values are kept for another stale_ttl seconds, so they can be loaded with load_stale.
+        The size in bytes is charged against max_bytes. If not given, the size is computed by the sizer.
+        """
+        if self.max_bytes is None:
+            size = 0
+        elif size is None:
+            size = self.sizer(value.value if isinstance(value, CachedResponse) else value)
 
-        if len(self._storage) > self.max_size:
-            self._cleanup()
+        with self._lock:
+            self._remove(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+
+            expires_at = self._now() + ttl
+            record = _Record(value=value, expires_at=expires_at, stale_until=expires_at + stale_ttl, size=size)
+            self._storage[key] = record
+            self._on_insert(key)
+            self._bytes += size
+            if record.stale_until != INF:
+                heapq.heappush(self._expiry, (record.stale_until, next(self._sequence), key, record))
+                if len(self._expiry) > 2 * len(self._storage) + 64:
+                    self._compact_expiry()
+
+            if self._is_full():
+                self._cleanup()
 
     def delete(self, key: str) -> None:
         """Delete a value from the cache."""
-        self._storage.pop(key, None)
+        with self._lock:
+            self._remove(key)
+
+    def sweep(self) -> int:
+        """Remove the entries whose stale period has ended.
+
+        Returns:
+            The number of removed entries.
+        """
+        with self._lock:
+            return self._remove_expired(self._now())
+
+    def stats(self) -> CacheStats:
+        """Returns: the current usage of the cache."""
+        with self._lock:
+            return CacheStats(entries=len(self._storage), bytes=self._bytes, evictions=self._evictions)
 
     def _now(self) -> float:
         return time.monotonic()
 
+    def _remove(self, key: str) -> None:
+        record = self._storage.pop(key, None)
+        if record is not None:
+            self._bytes -= record.size
+
+    def _is_full(self) -> bool:
+        return (self.max_size is not None and len(self._storage) > self.max_size) or (
+            self.max_bytes is not None and self._bytes > self.max_bytes
+        )
+
+    def _remove_expired(self, now: float) -> int:
+        removed = 0
+        while self._expiry and self._expiry[0][0] < now:
+            _, _, key, record = heapq.heappop(self._expiry)
+            if self._storage.get(key) is record:
+                self._remove(key)
+                removed += 1
+        return removed
+
+    def _compact_expiry(self) -> None:
+        self._expiry = [
+            (record.stale_until, next(self._sequence), key, record)
+            for key, record in self._storage.items()
+            if record.stale_until != INF
+        ]
+        heapq.heapify(self._expiry)
+
     def _cleanup(self) -> None:
-        """First remove the expired items, then remove the oldest items until max_size is met."""
-        # remove expired items
-        now = self._now()
-        expired = [key for key, record in self._storage.items() if record.expires_at < now]
-        for key in expired:
-            del self._storage[key]
-
-        # remove the oldest items until max_size is met
-        to_remove = len(self._storage) - self.max_size
-        for _ in range(to_remove):
-            self._storage.popitem(last=False)
+        """First remove the expired items, then remove the oldest items until max_size and max_bytes are met."""
+        self._remove_expired(self._now())
+
+        # remove the oldest items until max_size and max_bytes are met
+        while self._is_full():
+            self._evict()
+            self._evictions += 1
+
+    def _on_lookup(self, key: str) -> None:
+        """Called with the lock held whenever a key is looked up, whether or not it is in the cache."""
+        pass
+
+    def _touch(self, key: str) -> None:
+        """Called with the lock held when an entry is loaded from the cache."""
+        self._storage.move_to_end(key)  # Mark as most recently used
+
+    def _on_insert(self, key: str) -> None:
+        """Called with the lock held when an entry is stored in the cache."""
+        pass
+
+    def _evict(self) -> None:
+        """Removes the least recently used entry. Called with the lock held while the cache is full."""
+        _, record = self._storage.popitem(last=False)
+        self._bytes -= record.size
+
+
+def _sweep_periodically(cache_ref: "weakref.ref[Cache]", interval: float) -> None:
+    # the thread holds a weak reference, so it does not keep the cache alive and stops once the cache is collected
+    while True:
+        time.sleep(interval)
+        cache = cache_ref()
+        if cache is None:
+            return
+        cache.sweep()
+        del cache
+
+
+# halves every 4-bit counter of the frequency sketch
+_HALVE = bytes(value >> 1 for value in range(256))
+_SEEDS = (0xC3A5C85C97CB3127, 0xB492B66FBE98F273, 0x9AE16A3B2F90404F, 0xCBF29CE484222325)
+_MASK64 = (1 << 64) - 1
+
+
+class FrequencySketch:
+    """Count-min sketch of 4-bit counters that estimates how often keys were looked up recently.
+
+    Each row has four counters per cache entry, so collisions rarely inflate the estimates. All counters are halved
+    once the number of recorded lookups reaches ten times the capacity, so the estimates follow changes in popularity.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.width = 1 << max(4, (4 * capacity - 1).bit_length())
+        self.table = bytearray(len(_SEEDS) * self.width)
+        self.sample_size = 10 * capacity
+        self.additions = 0
+
+    def increment(self, key: str) -> None:
+        added = False
+        for index in self._indexes(key):
+            if self.table[index] < 15:
+                self.table[index] += 1
+                added = True
+
+        if added:
+            self.additions += 1
+            if self.additions >= self.sample_size:
+                self.table = self.table.translate(_HALVE)
+                self.additions //= 2
+
+    def frequency(self, key: str) -> int:
+        return min(self.table[index] for index in self._indexes(key))
+
+    def _indexes(self, key: str) -> list[int]:
+        mask = self.width - 1
+        hash_ = hash(key)
+        indexes = []
+        for row, seed in enumerate(_SEEDS):
+            # every row projects the hash with a different multiplier, so the rows collide independently
+            mixed = ((hash_ + seed) * seed) & _MASK64
+            indexes.append(row * self.width + ((mixed + (mixed >> 32)) & mask))
+        return indexes
+
+
+class TinyLfuCache(Cache):
+    def __init__(
+        self,
+        max_size: int = 1000,
+        max_bytes: Optional[int] = None,
+        sizer: Optional[Callable[[Any], int]] = None,
+        sweep_interval: Optional[float] = None,
+    ) -> None:
+        """Creates a cache that admits new entries only if they are looked up more often than the entries they evict.
+
+        The cache follows the W-TinyLFU policy. New entries are stored in a small LRU window. Entries that leave the
+        window compete with the least recently used entry of the main cache, and the entry looked up more often
+        according to a frequency sketch stays. Keys looked up once, for example by a batch job that walks through many
+        ids, do not flush the entries looked up often.
+
+        Args:
+            max_size: the maximum number of entries.
+            max_bytes: the maximum total size of the entries in bytes, or None for no limit. See Cache.
+            sizer: the function that returns the size of a cached value in bytes. See Cache.
+            sweep_interval: the interval in seconds of removing expired entries in a background thread. See Cache.
+        """
+        if max_size < 1:
+            raise ValueError("'max_size' must be positive")
+
+        self._window: OrderedDict[str, None] = OrderedDict()
+        self._probation: OrderedDict[str, None] = OrderedDict()
+        self._protected: OrderedDict[str, None] = OrderedDict()
+        self._window_size = max(1, max_size // 100)
+        self._protected_size = (max_size - self._window_size) * 4 // 5
+        self._sketch = FrequencySketch(max_size)
+        super().__init__(max_size=max_size, max_bytes=max_bytes, sizer=sizer, sweep_interval=sweep_interval)
+
+    def _on_lookup(self, key: str) -> None:
+        self._sketch.increment(key)
+
+    def _touch(self, key: str) -> None:
+        if key in self._window:
+            self._window.move_to_end(key)
+        elif key in self._protected:
+            self._protected.move_to_end(key)
+        else:
+            # entries looked up again in the probation segment are protected from eviction
+            del self._probation[key]
+            self._protected[key] = None
+            if len(self._protected) > self._protected_size:
+                demoted, _ = self._protected.popitem(last=False)
+                self._probation[demoted] = None
+
+    def _on_insert(self, key: str) -> None:
+        self._window[key] = None
+        while len(self._window) > self._window_size and len(self._storage) <= cast(int, self.max_size):
+            # the main cache has room, so the entries leaving the window are admitted without competing
+            candidate, _ = self._window.popitem(last=False)
+            self._probation[candidate] = None
+
+    def _remove(self, key: str) -> None:
+        super()._remove(key)
+        for segment in (self._window, self._probation, self._protected):
+            segment.pop(key, None)
+
+    def _evict(self) -> None:
+        victim = next(iter(self._probation or self._protected), None)
+        if len(self._window) > self._window_size or victim is None:
+            candidate = next(iter(self._window))
+            if victim is not None and self._sketch.frequency(candidate) > self._sketch.frequency(victim):
+                self._remove(victim)
+                del self._window[candidate]
+                self._probation[candidate] = None
+            else:
+                self._remove(candidate)
+        else:
+            self._remove(victim)
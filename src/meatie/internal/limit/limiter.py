@@ -2,6 +2,7 @@
 #  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
 
 
+import threading
 import time as sys_time
 from typing import Optional
 
@@ -14,7 +15,7 @@ from .reservation import Reservation, Tokens
 class Limiter:
     """Leaky bucket rate limiter."""
 
-    __slots__ = ("rate", "capacity", "__last_tokens", "__last_time")
+    __slots__ = ("rate", "capacity", "__last_tokens", "__last_time", "__lock")
 
     def __init__(
         self,
@@ -32,6 +33,7 @@ class Limiter:
         self.capacity = capacity
         self.__last_tokens = init_tokens if init_tokens is not None else capacity
         self.__last_time = init_time if init_time is not None else sys_time.monotonic()
+        self.__lock = threading.Lock()
 
     def reserve_now(self, tokens: Tokens) -> Reservation:
         return self.reserve_at(sys_time.monotonic(), tokens)
@@ -40,18 +42,19 @@ class Limiter:
         if tokens > self.capacity:
             raise ValueError(f"amount of requested tokens ({tokens}) exceed the limit ({self.capacity})")
 
-        available = self.__advance_until(time)
-        remaining = available - tokens
+        with self.__lock:
+            available = self.__advance_until(time)
+            remaining = available - tokens
 
-        if remaining < 0:
-            wait_duration = self.rate.duration_from_tokens(-remaining)
-        else:
-            wait_duration = 0.0
+            if remaining < 0:
+                wait_duration = self.rate.duration_from_tokens(-remaining)
+            else:
+                wait_duration = 0.0
 
-        result = Reservation(ready_at=time + wait_duration, tokens=tokens)
-        self.__last_time = time
-        self.__last_tokens = remaining
-        return result
+            result = Reservation(ready_at=time + wait_duration, tokens=tokens)
+            self.__last_time = time
+            self.__last_tokens = remaining
+            return result
 
     def __advance_until(self, time: Time) -> Time:
         last_time = self.__last_time
@@ -6,6 +6,6 @@
 from .method import get_method
 from .parameter import Kind, Parameter
 from .path import PathTemplate
-from .request import RequestTemplate
+from .request import EndpointLoader, RequestTemplate
 
-__all__ = ["Kind", "Parameter", "PathTemplate", "RequestTemplate", "get_method"]
+__all__ = ["EndpointLoader", "Kind", "Parameter", "PathTemplate", "RequestTemplate", "get_method"]
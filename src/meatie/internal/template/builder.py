@@ -0,0 +1,168 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+
+import keyword
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from meatie.internal.adapter import JsonEncoder
+from meatie.types import Request
+
+from .parameter import Kind, Parameter
+from .path import PathTemplate, _param_pattern
+from .unwrap import Unwrappable
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .request import RequestTemplate
+
+__all__ = ["RequestBuilder", "compile_builder"]
+
+RequestBuilder = Callable[..., Request]
+
+# Types of query parameter values that never implement the Unwrappable protocol.
+_PLAIN_TYPES = frozenset([str, int, float, bool, list, tuple])
+
+
+class _Missing:
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<missing>"
+
+
+_MISSING = _Missing()
+
+
+def compile_builder(template: "RequestTemplate[Any]") -> Optional[RequestBuilder]:
+    """Generates a straight-line function that builds HTTP requests for the given request template.
+
+    The generated function accepts the same positional and keyword arguments as the endpoint. Python binds the
+    arguments to parameters, so the builder avoids the bookkeeping done by the generic implementation.
+
+    Args:
+        template: the request template.
+
+    Returns:
+        The request builder or None if the request template cannot be compiled. In the latter case, the caller should
+        fall back to the generic implementation.
+    """
+    for param in template.params:
+        if not param.name.isidentifier() or keyword.iskeyword(param.name) or param.name.startswith("_meatie_"):
+            return None
+
+    path_source = _compile_path(template.template, template.params)
+    if path_source is None:
+        return None
+
+    namespace: dict[str, Any] = {
+        "_meatie_template": template,
+        "_meatie_encoder": template.request_encoder,
+        "_meatie_missing": _MISSING,
+        "_meatie_plain_types": _PLAIN_TYPES,
+        "_meatie_text_types": (str, bytes),
+        "_meatie_unwrappable": Unwrappable,
+        "_meatie_isinstance": isinstance,
+        "_meatie_type": type,
+        "_meatie_request": Request,
+        "_meatie_key_error": KeyError,
+        "_meatie_runtime_error": RuntimeError,
+        "_meatie_stream": template.stream,
+    }
+
+    arguments = []
+    lines = [
+        "    _meatie_method = _meatie_template.method",
+        "    if _meatie_method is None:",
+        "        raise _meatie_runtime_error(\"'method' is None\")",
+        "    _meatie_query = {}",
+        "    _meatie_json = None",
+        "    _meatie_data = None",
+        "    _meatie_headers = {}",
+    ]
+    for index, param in enumerate(template.params):
+        default_name = "_meatie_missing"
+        if param.default_value is not None:
+            default_name = f"_meatie_default_{index}"
+            namespace[default_name] = param.default_value
+        arguments.append(f"{param.name}={default_name}")
+
+        formatter_name = f"_meatie_formatter_{index}"
+        if param.formatter is not None:
+            namespace[formatter_name] = param.formatter
+        api_ref = repr(param.api_ref)
+        value = param.name
+
+        if param.kind == Kind.PATH:
+            lines.append(f"    if {value} is _meatie_missing:")
+            lines.append(f"        raise _meatie_key_error({api_ref})")
+            if param.formatter is not None:
+                lines.append(f"    {value} = {formatter_name}({value})")
+            continue
+
+        if param.kind == Kind.QUERY:
+            # emit query parameters only if underlying value is not None
+            lines.append(f"    if {value} is not None and {value} is not _meatie_missing:")
+            if param.marshaller is not None:
+                marshaller_name = f"_meatie_marshaller_{index}"
+                namespace[marshaller_name] = param.marshaller
+                lines.append(f"        _meatie_query.update({marshaller_name}({value}))")
+            elif param.formatter is not None:
+                lines.append(f"        _meatie_query[{api_ref}] = {formatter_name}({value})")
+            else:
+                lines.append(
+                    f"        if _meatie_type({value}) not in _meatie_plain_types"
+                    f" and _meatie_isinstance({value}, _meatie_unwrappable):"
+                )
+                lines.append(f"            _meatie_query.update({value}.unwrap())")
+                lines.append("        else:")
+                lines.append(f"            _meatie_query[{api_ref}] = {value}")
+            continue
+
+        if param.kind == Kind.BODY:
+            lines.append(f"    if {value} is not _meatie_missing:")
+            if param.formatter is not None:
+                lines.append(f"        _meatie_raw = {formatter_name}({value})")
+                lines.append("        if _meatie_isinstance(_meatie_raw, _meatie_text_types):")
+                lines.append("            _meatie_data = _meatie_raw")
+                lines.append("        else:")
+                lines.append("            _meatie_json = _meatie_raw")
+            elif isinstance(template.request_encoder, JsonEncoder):
+                lines.append(f"        if {value} is not None:")
+                lines.append(f"            _meatie_data = _meatie_encoder.to_json({value})")
+                lines.append("            _meatie_headers['Content-Type'] = 'application/json'")
+            else:
+                lines.append(f"        _meatie_json = _meatie_encoder.to_content({value})")
+            continue
+
+        return None  # pragma: no cover
+
+    lines.append(
+        f"    return _meatie_request(method=_meatie_method, path={path_source}, params=_meatie_query, headers=_meatie_headers,"
+        " json=_meatie_json, data=_meatie_data, stream=_meatie_stream)"
+    )
+    source = f"def _meatie_build({', '.join(arguments)}):\n" + "\n".join(lines)
+    exec(source, namespace)
+    builder: RequestBuilder = namespace["_meatie_build"]
+    return builder
+
+
+def _compile_path(template: PathTemplate, params: list[Parameter]) -> Optional[str]:
+    """Returns the source code of an f-string that renders the URL path or None if the path cannot be compiled."""
+    name_by_api_ref = {param.api_ref: param.name for param in params if param.kind == Kind.PATH}
+
+    parts = []
+    position = 0
+    template_str = str(template)
+    for match in _param_pattern.finditer(template_str):
+        name = name_by_api_ref.get(match.group("name"))
+        if name is None:
+            return None
+        parts.append(template_str[position : match.start()])
+        parts.append("{" + name + "}")
+        position = match.end()
+    parts.append(template_str[position:])
+
+    literals = parts[::2]
+    if any("{" in literal or "}" in literal for literal in literals):
+        # str.format treats braces outside parameters specially, leave them to the generic implementation
+        return None
+    return "f" + repr("".join(parts))
@@ -13,11 +13,12 @@ from typing import (
 from typing_extensions import Callable, Self, Union, get_type_hints
 
 from meatie.api_reference import ApiReference
-from meatie.internal.adapter import JsonAdapter, StringAdapter, TypeAdapter, get_adapter
+from meatie.internal.adapter import JsonAdapter, JsonEncoder, StringAdapter, TypeAdapter, get_adapter, is_stream_type
 from meatie.internal.types import PT, RequestBodyType, T
 from meatie.types import Method, Request
 
 from . import Kind, Parameter, PathTemplate
+from .builder import RequestBuilder, compile_builder
 from .unwrap import Unwrappable
 
 
@@ -29,7 +30,10 @@ class RequestTemplate(Generic[RequestBodyType]):
         "template",
         "params",
         "request_encoder",
+        "stream",
         "__param_by_name",
+        "__json_encoder",
+        "__builder",
     )
 
     def __init__(
@@ -38,6 +42,8 @@ class RequestTemplate(Generic[RequestBodyType]):
         params: list[Parameter],
         request_encoder: TypeAdapter[RequestBodyType],
         method: Optional[Method],
+        compiled: bool = True,
+        stream: bool = False,
     ) -> None:
         """Creates a RequestTemplate.
 
@@ -46,19 +52,42 @@ class RequestTemplate(Generic[RequestBodyType]):
             params: parameters for the HTTP request, such as path, query, and body parameters.
             request_encoder: request body encoder.
             method: HTTP method.
+            compiled: if set to True (default), a specialized function for building HTTP requests is generated ahead of time. Otherwise, HTTP requests are built by the generic implementation.
+            stream: if set to True, HTTP requests ask the client library to stream the response body.
         """
         self.method = method
         self.template = template
         self.params = params
         self.request_encoder = request_encoder
+        self.stream = stream
 
         self.__param_by_name: dict[str, Parameter] = {}
         for param in self.params:
             self.__param_by_name[param.name] = param
 
+        # encoders that produce JSON bytes serialize request bodies once, bypassing the client library encoder
+        self.__json_encoder: Optional[JsonEncoder[Any]] = (
+            request_encoder if isinstance(request_encoder, JsonEncoder) else None
+        )
+        self.__builder: Optional[RequestBuilder] = compile_builder(self) if compiled else None
+
     def build_request(self, *args: Any, **kwargs: Any) -> Request:
         """Create Request given *args and **kwargs.
 
+        :return: Request instance
+        """
+        if self.__builder is not None:
+            try:
+                return self.__builder(*args, **kwargs)
+            except TypeError as exc:
+                # Arguments that cannot be bound to the builder signature are reported by the generic implementation.
+                if exc.__traceback__ is None or exc.__traceback__.tb_next is not None:
+                    raise
+        return self.build_generic_request(*args, **kwargs)
+
+    def build_generic_request(self, *args: Any, **kwargs: Any) -> Request:
+        """Create Request given *args and **kwargs without using the compiled builder.
+
         :return: Request instance
         """
         if self.method is None:
@@ -91,6 +120,7 @@ class RequestTemplate(Generic[RequestBodyType]):
         query_kwargs = {}
         body_json: Any = None
         body_data: Any = None
+        headers: dict[str, str] = {}
         for param, value in value_by_param.items():
             if param.kind == Kind.PATH:
                 if param.formatter is not None:
@@ -128,6 +158,9 @@ class RequestTemplate(Generic[RequestBodyType]):
                         body_data = raw_value
                     else:
                         body_json = raw_value
+                elif self.__json_encoder is not None and value is not None:
+                    body_data = self.__json_encoder.to_json(value)
+                    headers["Content-Type"] = "application/json"
                 else:
                     body_json = self.request_encoder.to_content(value)
                 continue
@@ -139,9 +172,10 @@ class RequestTemplate(Generic[RequestBodyType]):
             method=self.method,
             path=path,
             params=query_kwargs,
-            headers={},
+            headers=headers,
             json=body_json,
             data=body_data,
+            stream=self.stream,
         )
 
     @classmethod
@@ -221,7 +255,8 @@ class RequestTemplate(Generic[RequestBodyType]):
             )
             parameters.append(parameter)
 
-        return cls.validate_object(template, parameters, signature, request_encoder, method)
+        stream = is_stream_type(type_hints.get("return"))
+        return cls.validate_object(template, parameters, signature, request_encoder, method, stream)
 
     @classmethod
     def validate_object(
@@ -231,6 +266,7 @@ class RequestTemplate(Generic[RequestBodyType]):
         signature: inspect.Signature,
         request_encoder: TypeAdapter[RequestBodyType],
         method: Optional[Method],
+        stream: bool = False,
     ) -> Self:
         """Create RequestTemplate given the URL path template, HTTP request parameters, Python function signature, request body encoder, and HTTP method.
 
@@ -240,6 +276,7 @@ class RequestTemplate(Generic[RequestBodyType]):
             signature: Python function signature.
             request_encoder: request body encoder.
             method: HTTP method.
+            stream: if set to True, HTTP requests ask the client library to stream the response body.
 
         Returns:
             RequestTemplate instance.
@@ -268,4 +305,8 @@ class RequestTemplate(Generic[RequestBodyType]):
         for api_ref in missing_api_refs:
             raise ValueError(f"Parameter '{api_ref}' is not present in the method signature '{signature}'")
 
-        return cls(template, list(params), request_encoder, method)
+        return cls(template, list(params), request_encoder, method, stream=stream)
+
+
+EndpointLoader = Callable[[], tuple[RequestTemplate[Any], TypeAdapter[T]]]
+"""Function that creates the request template and the response decoder of a lazy endpoint."""
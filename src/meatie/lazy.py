@@ -0,0 +1,96 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+"""Proxy over the HTTP response body that validates the fields of a model when they are accessed for the first time."""
+
+from typing import TYPE_CHECKING, Any, Generic, Union
+
+from meatie.error import ParseResponseError
+from meatie.internal.types import T
+from meatie.types import AsyncResponse, Response
+
+if TYPE_CHECKING:
+    from meatie.internal.adapter.lazy_ import LazyAdapter, ObjectIndex
+
+__all__ = ["Lazy"]
+
+_MISSING = object()
+
+
+class Lazy(Generic[T]):
+    """Proxy over a JSON object that validates the fields of the model when they are accessed for the first time.
+
+    Use `Lazy[Model]` as the return type of an endpoint to receive the proxy instead of the model. Parts of the HTTP
+    response body that belong to fields which are never accessed are neither parsed nor validated. Field values are
+    validated against the field types, model and field validators run only when the proxy is materialized.
+
+    Invalid field values are reported by raising `ParseResponseError` when the field is accessed.
+    """
+
+    __slots__ = ("__index", "__adapter", "__response", "__values", "__model")
+
+    def __init__(
+        self,
+        index: "ObjectIndex",
+        adapter: "LazyAdapter[T]",
+        response: Union[Response, AsyncResponse],
+    ) -> None:
+        """Creates a proxy.
+
+        Args:
+            index: the index of the members of the JSON object.
+            adapter: the adapter that decodes the fields of the model.
+            response: the HTTP response, used for reporting errors.
+        """
+        self.__index = index
+        self.__adapter = adapter
+        self.__response = response
+        self.__values: dict[str, Any] = {}
+        self.__model: Any = _MISSING
+
+    def __getattr__(self, name: str) -> Any:
+        """Returns the value of the field, validating it on the first access.
+
+        Raises:
+            AttributeError: If the model has no such field.
+            ParseResponseError: If the value of the field is invalid or missing.
+        """
+        values = self.__values
+        if name in values:
+            return values[name]
+
+        key = self.__adapter.keys.get(name)
+        if key is None:
+            raise AttributeError(f"'{self.__adapter.model_name}' object has no attribute '{name}'")
+
+        try:
+            data = self.__index.get(key)
+            value = self.__adapter.default(name) if data is None else self.__adapter.decode_field(name, data)
+        except (KeyError, ValueError) as exc:
+            raise ParseResponseError(self.__text(), self.__response) from exc
+        values[name] = value
+        return value
+
+    def materialize(self) -> T:
+        """Returns the model validated from the whole HTTP response body.
+
+        Raises:
+            ParseResponseError: If the HTTP response body is not a valid model.
+        """
+        if self.__model is _MISSING:
+            try:
+                self.__model = self.__adapter.materialize(self.__index.content)
+            except ValueError as exc:
+                raise ParseResponseError(self.__text(), self.__response) from exc
+        return self.__model
+
+    def __dir__(self) -> list[str]:
+        """Returns the names of the fields and the methods of the proxy."""
+        return sorted({*super().__dir__(), *self.__adapter.keys})
+
+    def __repr__(self) -> str:
+        """Returns the representation of the proxy showing the fields validated so far."""
+        fields = ", ".join(f"{name}={value!r}" for name, value in self.__values.items())
+        return f"Lazy[{self.__adapter.model_name}]({fields})"
+
+    def __text(self) -> str:
+        return self.__index.content.decode(errors="replace")
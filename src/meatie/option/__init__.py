@@ -3,10 +3,13 @@
 
 """Provides options for customizing the endpoint behaviour such as caching, rate limiting and retries."""
 
-__all__ = ["cache", "limit", "retry", "body", "private"]
+__all__ = ["cache", "coalesce", "limit", "retry", "body", "private", "trusted", "chunked"]
 
 from .body_option import body
 from .cache_option import cache
+from .chunked_option import chunked
+from .coalesce_option import coalesce
 from .limit_option import limit
 from .private_option import private
 from .retry_option import retry
+from .trusted_option import trusted
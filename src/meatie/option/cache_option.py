@@ -2,14 +2,21 @@
 #  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
 
 import abc
-import urllib.parse
-from typing import Generic, Union
+import asyncio
+import copy
+import dataclasses
+import threading
+from typing import Any, Generic, Mapping, Optional, Union
 
 from meatie.aio import AsyncContext, AsyncEndpointDescriptor
-from meatie.descriptor import Context, EndpointDescriptor
-from meatie.internal.cache import Cache
+from meatie.aio.descriptor import AsyncOperator
+from meatie.aio.descriptor import proceed as async_proceed
+from meatie.descriptor import Context, EndpointDescriptor, Operator, proceed
+from meatie.internal.cache import NOT_MODIFIED, Cache, CachedResponse, get_key, get_ttl
 from meatie.internal.types import PT, T
-from meatie.types import Duration, Request
+from meatie.types import INF, AsyncResponse, Duration, Request, Response
+
+from .coalesce_option import CoalesceOption
 
 __all__ = ["cache"]
 
@@ -17,22 +24,51 @@ __all__ = ["cache"]
 class CacheOption:
     """Configure caching of endpoint call results."""
 
-    def __init__(self, ttl: Duration, shared: bool = False) -> None:
+    def __init__(
+        self,
+        ttl: Duration,
+        shared: bool = False,
+        coalesce: bool = False,
+        stale_while_revalidate: Duration = 0.0,
+        stale_if_error: Duration = 0.0,
+        http: bool = False,
+    ) -> None:
         """Creates a new cache option.
 
         Parameters:
             ttl: the time-to-live of the cache entry in seconds
             shared: if set to False (default) the cache entry will be stored in the local cache owned by the client instance. Records cached by another client instance will not be visible.
                 Otherwise, if set to True, all client that are instances of the same Python class will share the same cache.
+            coalesce: if set to True, concurrent calls that miss the cache share a single in-flight HTTP request. See meatie.coalesce.
+            stale_while_revalidate: the time in seconds after the cache entry expired during which the expired value is returned immediately, while a single call refreshes the cache entry in the background. Synchronous clients refresh the entry in a worker thread, asynchronous clients in an asyncio task.
+            stale_if_error: the time in seconds after the cache entry expired during which the expired value is returned if the endpoint call fails.
+            http: if set to True, the cache follows the caching headers of the HTTP response. The time-to-live is read from the Cache-Control max-age directive or the Expires header, and ttl is used only if neither is present.
+                Responses with the Cache-Control no-store directive are not cached. Expired entries of responses with an ETag or Last-Modified header are kept in the cache and revalidated with a conditional request.
+                A 304 Not Modified response renews the cache entry without reading and decoding the response body again.
+
+        Raises:
+            ValueError: if stale_while_revalidate or stale_if_error is negative.
         """
+        if stale_while_revalidate < 0:
+            raise ValueError("'stale_while_revalidate' must be non-negative")
+        if stale_if_error < 0:
+            raise ValueError("'stale_if_error' must be non-negative")
+
         self.ttl = ttl
         self.shared = shared
+        self.coalesce = coalesce
+        self.stale_while_revalidate = stale_while_revalidate
+        self.stale_if_error = stale_if_error
+        self.http = http
 
     def __call__(
         self,
         descriptor: Union[EndpointDescriptor[PT, T], AsyncEndpointDescriptor[PT, T]],
     ) -> None:
         """Apply the cache option to the endpoint descriptor."""
+        if self.coalesce:
+            CoalesceOption(shared=self.shared)(descriptor)
+
         if isinstance(descriptor, EndpointDescriptor):
             return self.__sync_descriptor(descriptor)
         return self.__async_descriptor(descriptor)
@@ -45,46 +81,170 @@ class CacheOption:
     def __sync_descriptor(self, descriptor: EndpointDescriptor[PT, T]) -> None:
         operator: BaseOperator[T]
         if self.shared:
-            operator = SharedOperator[T](self.ttl)
+            operator = SharedOperator[T](self.ttl, self.stale_while_revalidate, self.stale_if_error, self.http)
         else:
-            operator = LocalOperator[T](self.ttl)
+            operator = LocalOperator[T](self.ttl, self.stale_while_revalidate, self.stale_if_error, self.http)
         descriptor.register_operator(self.priority, operator)
 
     def __async_descriptor(self, descriptor: AsyncEndpointDescriptor[PT, T]) -> None:
         operator: BaseAsyncOperator[T]
         if self.shared:
-            operator = SharedAsyncOperator[T](self.ttl)
+            operator = SharedAsyncOperator[T](self.ttl, self.stale_while_revalidate, self.stale_if_error, self.http)
         else:
-            operator = LocalAsyncOperator[T](self.ttl)
+            operator = LocalAsyncOperator[T](self.ttl, self.stale_while_revalidate, self.stale_if_error, self.http)
         descriptor.register_operator(self.priority, operator)
 
 
 cache = CacheOption
 
 
-def get_key(request: Request) -> str:
-    key = request.path
-    if request.params:
-        key += "?" + urllib.parse.urlencode(request.params)
-    return key
+def _store_response(
+    storage: Cache,
+    key: str,
+    value: Any,
+    response: Union[Response, AsyncResponse, None],
+    cached: Optional[CachedResponse],
+    ttl: Duration,
+    stale_ttl: Duration,
+) -> Any:
+    """Stores the value in the cache following the caching headers of the HTTP response and returns the value."""
+    headers: Mapping[str, str] = {} if response is None else response.headers
+    record = CachedResponse(value, headers.get("ETag"), headers.get("Last-Modified"), _get_size(storage, response))
+    if value is NOT_MODIFIED and cached is not None:
+        # the 304 Not Modified response may omit the validators of the cached response, and its body is empty, so the
+        # renewed entry is charged the size of the cached response
+        record = CachedResponse(
+            cached.value, record.etag or cached.etag, record.last_modified or cached.last_modified, cached.size
+        )
+
+    record_ttl = get_ttl(headers, ttl)
+    if record_ttl is None:
+        storage.delete(key)
+        return record.value
+
+    # expired responses that can be revalidated are kept in the cache until they are evicted
+    storage.store(key, record, record_ttl, INF if record.has_validators else stale_ttl, record.size)
+    return record.value
+
+
+def _get_size(storage: Cache, response: Union[Response, AsyncResponse, None]) -> Optional[int]:
+    """Returns: the length of the HTTP response body if the cache has a byte budget and the length is known."""
+    if storage.max_bytes is None or response is None:
+        return None
+    content_length = response.headers.get("Content-Length")
+    if content_length is None or not content_length.isdigit():
+        return None
+    return int(content_length)
+
+
+def _get_conditional_request(request: Request, cached: Any) -> Optional[Request]:
+    if not isinstance(cached, CachedResponse) or not cached.has_validators:
+        return None
+    return dataclasses.replace(request, headers={**request.headers, **cached.get_conditional_headers()})
+
+
+def _get_value(cached: Any) -> Any:
+    return cached.value if isinstance(cached, CachedResponse) else cached
 
 
 class BaseOperator(Generic[T]):
     """Base class for cache operators. Saves the value returned from the endpoint in cache."""
 
-    def __init__(self, ttl: Duration) -> None:
+    def __init__(
+        self,
+        ttl: Duration,
+        stale_while_revalidate: Duration = 0.0,
+        stale_if_error: Duration = 0.0,
+        http: bool = False,
+    ) -> None:
         self.ttl = ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.stale_if_error = stale_if_error
+        self.http = http
+        self.stale_ttl = max(stale_while_revalidate, stale_if_error)
+        self.__lock = threading.Lock()
+        self.__revalidating: set[tuple[int, str]] = set()
 
     def __call__(self, ctx: Context[T]) -> T:
+        return self.apply(proceed, ctx)
+
+    def apply(self, call_next: Operator[T], ctx: Context[T]) -> T:
+        """Returns the cached value if available, otherwise calls the endpoint and caches the result."""
         storage = self._storage(ctx)
         key = get_key(ctx.request)
-        value_opt = storage.load(key)
-        if value_opt is not None:
-            return value_opt
-
-        value = ctx.proceed()
-        storage.store(key, value, self.ttl)
-        return value
+        if not self.stale_ttl and not self.http:
+            value_opt = storage.load(key)
+            if value_opt is not None:
+                return value_opt
+
+            value = call_next(ctx)
+            storage.store(key, value, self.ttl, size=_get_size(storage, ctx.response))
+            return value
+
+        entry = storage.load_stale(key)
+        if entry is None:
+            return self.__load(call_next, ctx, storage, key, None)
+
+        cached, staleness = entry
+        if staleness <= 0:
+            return _get_value(cached)
+
+        if staleness <= self.stale_while_revalidate:
+            self.__revalidate(call_next, ctx, storage, key, cached)
+            return _get_value(cached)
+
+        try:
+            return self.__load(call_next, ctx, storage, key, cached)
+        except Exception:
+            # expired responses that can be revalidated are kept in the cache also after the stale-if-error period
+            if staleness <= self.stale_if_error:
+                return _get_value(cached)
+            raise
+
+    def __load(self, call_next: Operator[T], ctx: Context[T], storage: Cache, key: str, cached: Any) -> T:
+        if not self.http:
+            value = call_next(ctx)
+            storage.store(key, value, self.ttl, self.stale_ttl, _get_size(storage, ctx.response))
+            return value
+
+        request = ctx.request
+        conditional_request = _get_conditional_request(request, cached)
+        try:
+            if conditional_request is not None:
+                ctx.request = conditional_request
+                ctx.conditional = True
+            value = call_next(ctx)
+        finally:
+            ctx.request = request
+            ctx.conditional = False
+
+        if value is NOT_MODIFIED and conditional_request is None:
+            # the call was coalesced with a conditional request of another caller
+            value = call_next(ctx)
+
+        return _store_response(storage, key, value, ctx.response, cached, self.ttl, self.stale_ttl)
+
+    def __revalidate(self, call_next: Operator[T], ctx: Context[T], storage: Cache, key: str, cached: Any) -> None:
+        revalidation_key = (id(storage), key)
+        with self.__lock:
+            if revalidation_key in self.__revalidating:
+                return
+            self.__revalidating.add(revalidation_key)
+
+        # the context is copied, because the caller resets the context to the current step once the stale value is returned
+        revalidation_ctx = copy.copy(ctx)
+
+        def revalidate() -> None:
+            try:
+                self.__load(call_next, revalidation_ctx, storage, key, cached)
+            except Exception:
+                # the stale value is returned until the next revalidation or the end of the stale period
+                pass
+            finally:
+                with self.__lock:
+                    self.__revalidating.discard(revalidation_key)
+
+        threading.Thread(target=revalidate, name=f"meatie-revalidate-{key}", daemon=True).start()
 
     @abc.abstractmethod
     def _storage(self, ctx: Context[T]) -> Cache:
@@ -109,19 +269,102 @@ class SharedOperator(BaseOperator[T]):
 class BaseAsyncOperator(Generic[T]):
     """Base class for asynchronous cache operators. Saves the value returned from the endpoint in cache."""
 
-    def __init__(self, ttl: Duration) -> None:
+    def __init__(
+        self,
+        ttl: Duration,
+        stale_while_revalidate: Duration = 0.0,
+        stale_if_error: Duration = 0.0,
+        http: bool = False,
+    ) -> None:
         self.ttl = ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.stale_if_error = stale_if_error
+        self.http = http
+        self.stale_ttl = max(stale_while_revalidate, stale_if_error)
+        self.__revalidations: dict[tuple[int, str], asyncio.Task[None]] = {}
 
     async def __call__(self, ctx: AsyncContext[T]) -> T:
+        return await self.apply(async_proceed, ctx)
+
+    async def apply(self, call_next: AsyncOperator[T], ctx: AsyncContext[T]) -> T:
+        """Returns the cached value if available, otherwise calls the endpoint and caches the result."""
         storage = self._storage(ctx)
         key = get_key(ctx.request)
-        value_opt = storage.load(key)
-        if value_opt is not None:
-            return value_opt
-
-        value = await ctx.proceed()
-        storage.store(key, value, self.ttl)
-        return value
+        if not self.stale_ttl and not self.http:
+            value_opt = storage.load(key)
+            if value_opt is not None:
+                return value_opt
+
+            value = await call_next(ctx)
+            storage.store(key, value, self.ttl, size=_get_size(storage, ctx.response))
+            return value
+
+        entry = storage.load_stale(key)
+        if entry is None:
+            return await self.__load(call_next, ctx, storage, key, None)
+
+        cached, staleness = entry
+        if staleness <= 0:
+            return _get_value(cached)
+
+        if staleness <= self.stale_while_revalidate:
+            self.__revalidate(call_next, ctx, storage, key, cached)
+            return _get_value(cached)
+
+        try:
+            return await self.__load(call_next, ctx, storage, key, cached)
+        except Exception:
+            # expired responses that can be revalidated are kept in the cache also after the stale-if-error period
+            if staleness <= self.stale_if_error:
+                return _get_value(cached)
+            raise
+
+    async def __load(
+        self, call_next: AsyncOperator[T], ctx: AsyncContext[T], storage: Cache, key: str, cached: Any
+    ) -> T:
+        if not self.http:
+            value = await call_next(ctx)
+            storage.store(key, value, self.ttl, self.stale_ttl, _get_size(storage, ctx.response))
+            return value
+
+        request = ctx.request
+        conditional_request = _get_conditional_request(request, cached)
+        try:
+            if conditional_request is not None:
+                ctx.request = conditional_request
+                ctx.conditional = True
+            value = await call_next(ctx)
+        finally:
+            ctx.request = request
+            ctx.conditional = False
+
+        if value is NOT_MODIFIED and conditional_request is None:
+            # the call was coalesced with a conditional request of another caller
+            value = await call_next(ctx)
+
+        return _store_response(storage, key, value, ctx.response, cached, self.ttl, self.stale_ttl)
+
+    def __revalidate(
+        self, call_next: AsyncOperator[T], ctx: AsyncContext[T], storage: Cache, key: str, cached: Any
+    ) -> None:
+        revalidation_key = (id(storage), key)
+        if revalidation_key in self.__revalidations:
+            return
+
+        # the context is copied, because the caller resets the context to the current step once the stale value is returned
+        revalidation_ctx = copy.copy(ctx)
+
+        async def revalidate() -> None:
+            try:
+                await self.__load(call_next, revalidation_ctx, storage, key, cached)
+            except Exception:
+                # the stale value is returned until the next revalidation or the end of the stale period
+                pass
+
+        # the task is referenced until it completes, so it is not garbage collected while running
+        task = asyncio.get_running_loop().create_task(revalidate())
+        self.__revalidations[revalidation_key] = task
+        task.add_done_callback(lambda _: self.__revalidations.pop(revalidation_key, None))
 
     @abc.abstractmethod
     def _storage(self, ctx: AsyncContext[T]) -> Cache:
@@ -0,0 +1,51 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+
+from typing import Union
+
+from meatie.aio import AsyncEndpointDescriptor
+from meatie.descriptor import EndpointDescriptor
+from meatie.internal.types import PT, T
+
+__all__ = ["chunked"]
+
+
+class ChunkedOption:
+    """Decode large JSON arrays returned by an asynchronous endpoint in chunks, so the event loop is not blocked for the whole time of decoding.
+
+    Items of the array are validated in batches. Between the batches, the event loop runs other tasks, such as sending concurrent requests. Decoding is neither moved to a thread pool nor to a process pool, because JSON parsers and validators implemented in native code, such as pydantic-core, hold the GIL for the whole call, and passing decoded objects back from another process costs more than decoding them.
+
+    The option is meant for endpoints that return lists. Bodies that are not JSON arrays are decoded in a single call. The option has no effect on synchronous endpoints and on endpoints that use the `trusted` option or a custom JSON function.
+    """
+
+    __slots__ = ("threshold", "chunk_size")
+
+    def __init__(self, threshold: int = 1048576, chunk_size: int = 65536) -> None:
+        """Creates a new chunked option.
+
+        Parameters:
+            threshold: the minimum size of the HTTP response body in bytes to decode in chunks.
+            chunk_size: the size of a chunk in bytes. Items are validated in batches of items that end in the chunk.
+
+        Raises:
+            ValueError: if threshold is negative or chunk_size is not positive.
+        """
+        if threshold < 0:
+            raise ValueError("'threshold' must not be negative")
+        if chunk_size < 1:
+            raise ValueError("'chunk_size' must be greater than 0")
+
+        self.threshold = threshold
+        self.chunk_size = chunk_size
+
+    def __call__(
+        self,
+        descriptor: Union[EndpointDescriptor[PT, T], AsyncEndpointDescriptor[PT, T]],
+    ) -> None:
+        """Apply the chunked option to the endpoint descriptor."""
+        if isinstance(descriptor, AsyncEndpointDescriptor):
+            descriptor.chunk_threshold = self.threshold
+            descriptor.chunk_size = self.chunk_size
+
+
+chunked = ChunkedOption
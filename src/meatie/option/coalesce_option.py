@@ -0,0 +1,171 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+import asyncio
+import threading
+from typing import Any, Generic, Optional, Union
+
+from meatie.aio import AsyncContext, AsyncEndpointDescriptor
+from meatie.aio.descriptor import AsyncOperator
+from meatie.aio.descriptor import proceed as async_proceed
+from meatie.descriptor import Context, EndpointDescriptor, Operator, proceed
+from meatie.internal.cache import get_key
+from meatie.internal.types import PT, T
+from meatie.types import AsyncResponse, Response
+
+__all__ = ["coalesce"]
+
+_Key = tuple[Optional[int], str]
+
+
+class CoalesceOption:
+    """Share a single in-flight HTTP request between concurrent identical endpoint calls (single-flight).
+
+    While an endpoint call is in progress, other calls that would send the same HTTP request wait for its outcome instead of sending their own request. Requests are considered identical if they have the same URL path and query parameters.
+
+    The option is designed for idempotent endpoints, typically GET requests. All waiting callers receive the same result object or the same exception.
+    """
+
+    def __init__(self, shared: bool = False) -> None:
+        """Creates a new coalesce option.
+
+        Parameters:
+            shared: if set to False (default) only calls made by the same client instance are coalesced.
+                Otherwise, if set to True, calls made by all client instances are coalesced.
+        """
+        self.shared = shared
+
+    def __call__(
+        self,
+        descriptor: Union[EndpointDescriptor[PT, T], AsyncEndpointDescriptor[PT, T]],
+    ) -> None:
+        """Apply the coalesce option to the endpoint descriptor."""
+        if isinstance(descriptor, EndpointDescriptor):
+            return self.__sync_descriptor(descriptor)
+        return self.__async_descriptor(descriptor)
+
+    @property
+    def priority(self) -> int:
+        """Returns: the priority of the coalesce operator."""
+        return 30
+
+    def __sync_descriptor(self, descriptor: EndpointDescriptor[PT, T]) -> None:
+        descriptor.register_operator(self.priority, CoalesceOperator[T](self.shared))
+
+    def __async_descriptor(self, descriptor: AsyncEndpointDescriptor[PT, T]) -> None:
+        descriptor.register_operator(self.priority, AsyncCoalesceOperator[T](self.shared))
+
+
+coalesce = CoalesceOption
+
+
+def _get_key(ctx: Any, shared: bool) -> _Key:
+    # in-flight calls are removed before they complete, so the client is alive while its id is used in the key
+    return (None if shared else id(ctx.client)), get_key(ctx.request)
+
+
+class _Call(Generic[T]):
+    __slots__ = ("done", "value", "response", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Optional[T] = None
+        self.response: Optional[Response] = None
+        self.error: Optional[BaseException] = None
+
+
+class CoalesceOperator(Generic[T]):
+    """Lets concurrent threads calling the endpoint with the same HTTP request share a single result."""
+
+    def __init__(self, shared: bool) -> None:
+        """Creates a new coalesce operator.
+
+        Args:
+            shared: whether calls made by different client instances should be coalesced.
+        """
+        self.shared = shared
+        self.__lock = threading.Lock()
+        self.__in_flight: dict[_Key, _Call[T]] = {}
+
+    def __call__(self, ctx: Context[T]) -> T:
+        return self.apply(proceed, ctx)
+
+    def apply(self, call_next: Operator[T], ctx: Context[T]) -> T:
+        """Waits for the result of an identical call in progress, otherwise calls the endpoint."""
+        key = _get_key(ctx, self.shared)
+        with self.__lock:
+            call = self.__in_flight.get(key)
+            is_leader = call is None
+            if call is None:
+                call = _Call[T]()
+                self.__in_flight[key] = call
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            # operators above, such as the cache, read the headers of the HTTP response
+            ctx.response = call.response
+            return call.value  # type: ignore[return-value]
+
+        try:
+            call.value = call_next(ctx)
+            call.response = ctx.response
+            return call.value
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self.__lock:
+                del self.__in_flight[key]
+            call.done.set()
+
+
+class AsyncCoalesceOperator(Generic[T]):
+    """Lets concurrent coroutines calling the endpoint with the same HTTP request share a single in-flight future."""
+
+    def __init__(self, shared: bool) -> None:
+        """Creates a new coalesce operator.
+
+        Args:
+            shared: whether calls made by different client instances should be coalesced.
+        """
+        self.shared = shared
+        self.__in_flight: dict[_Key, asyncio.Future[tuple[T, Optional[AsyncResponse]]]] = {}
+
+    async def __call__(self, ctx: AsyncContext[T]) -> T:
+        return await self.apply(async_proceed, ctx)
+
+    async def apply(self, call_next: AsyncOperator[T], ctx: AsyncContext[T]) -> T:
+        """Awaits the result of an identical call in progress, otherwise calls the endpoint."""
+        key = _get_key(ctx, self.shared)
+        future = self.__in_flight.get(key)
+        while future is not None:
+            try:
+                result, response = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # the call in progress was cancelled, but the current task was not, so the call is repeated
+                if not future.cancelled():
+                    raise
+            else:
+                # operators above, such as the cache, read the headers of the HTTP response
+                ctx.response = response
+                return result
+            future = self.__in_flight.get(key)
+
+        future = asyncio.get_running_loop().create_future()
+        self.__in_flight[key] = future
+        try:
+            result = await call_next(ctx)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # the exception is propagated to the caller, waiting callers are optional
+            future.exception()
+            raise
+        else:
+            future.set_result((result, ctx.response))
+            return result
+        finally:
+            del self.__in_flight[key]
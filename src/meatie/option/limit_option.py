@@ -5,7 +5,9 @@ import time
 from typing import Awaitable, Callable, Generic, Union
 
 from meatie.aio import AsyncContext, AsyncEndpointDescriptor
-from meatie.descriptor import Context, EndpointDescriptor
+from meatie.aio.descriptor import AsyncOperator
+from meatie.aio.descriptor import proceed as async_proceed
+from meatie.descriptor import Context, EndpointDescriptor, Operator, proceed
 from meatie.internal.limit import Tokens
 from meatie.internal.types import PT, T
 from meatie.types import Duration
@@ -85,13 +87,17 @@ class LimitOperator(Generic[T]):
         self.sleep_func = sleep_func
 
     def __call__(self, ctx: Context[T]) -> T:
+        return self.apply(proceed, ctx)
+
+    def apply(self, call_next: Operator[T], ctx: Context[T]) -> T:
+        """Waits until the rate limiter allows the endpoint call, then calls the endpoint."""
         current_time = time.monotonic()
         reservation = ctx.client.limiter.reserve_at(current_time, self.tokens)
         delay = reservation.ready_at - current_time
         if delay > 0:
             self.sleep_func(delay)
 
-        return ctx.proceed()
+        return call_next(ctx)
 
 
 class AsyncLimitOperator(Generic[T]):
@@ -108,10 +114,14 @@ class AsyncLimitOperator(Generic[T]):
         self.sleep_func = sleep_func
 
     async def __call__(self, ctx: AsyncContext[T]) -> T:
+        return await self.apply(async_proceed, ctx)
+
+    async def apply(self, call_next: AsyncOperator[T], ctx: AsyncContext[T]) -> T:
+        """Waits until the rate limiter allows the endpoint call, then calls the endpoint."""
         current_time = time.monotonic()
         reservation = ctx.client.limiter.reserve_at(current_time, self.tokens)
         delay = reservation.ready_at - current_time
         if delay > 0:
             await self.sleep_func(delay)
 
-        return await ctx.proceed()
+        return await call_next(ctx)
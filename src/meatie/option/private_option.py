@@ -1,9 +1,11 @@
 #  Copyright 2023 The Meatie Authors. All rights reserved.
 #  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
-from typing import Union
+from typing import Generic, Union
 
 from meatie.aio import AsyncContext, AsyncEndpointDescriptor
-from meatie.descriptor import Context, EndpointDescriptor
+from meatie.aio.descriptor import AsyncOperator
+from meatie.aio.descriptor import proceed as async_proceed
+from meatie.descriptor import Context, EndpointDescriptor, Operator, proceed
 from meatie.internal.types import PT, T
 
 __all__ = ["private"]
@@ -32,20 +34,34 @@ class PrivateOption:
         return 80
 
     def __sync_descriptor(self, descriptor: EndpointDescriptor[PT, T]) -> None:
-        descriptor.register_operator(self.priority, _operator)
+        descriptor.register_operator(self.priority, PrivateOperator[T]())
 
     def __async_descriptor(self, descriptor: AsyncEndpointDescriptor[PT, T]) -> None:
-        descriptor.register_operator(self.priority, _async_operator)
+        descriptor.register_operator(self.priority, AsyncPrivateOperator[T]())
 
 
 private = PrivateOption()
 
 
-def _operator(ctx: Context[T]) -> T:
-    ctx.client.authenticate(ctx.request)
-    return ctx.proceed()
+class PrivateOperator(Generic[T]):
+    """Calls the `authenticate` method of the client instance before sending the HTTP request."""
 
+    def __call__(self, ctx: Context[T]) -> T:
+        return self.apply(proceed, ctx)
 
-async def _async_operator(ctx: AsyncContext[T]) -> T:
-    await ctx.client.authenticate(ctx.request)
-    return await ctx.proceed()
+    def apply(self, call_next: Operator[T], ctx: Context[T]) -> T:
+        """Authenticates the HTTP request, then calls the endpoint."""
+        ctx.client.authenticate(ctx.request)
+        return call_next(ctx)
+
+
+class AsyncPrivateOperator(Generic[T]):
+    """Calls the `authenticate` method of the client instance before sending the HTTP request."""
+
+    async def __call__(self, ctx: AsyncContext[T]) -> T:
+        return await self.apply(async_proceed, ctx)
+
+    async def apply(self, call_next: AsyncOperator[T], ctx: AsyncContext[T]) -> T:
+        """Authenticates the HTTP request, then calls the endpoint."""
+        await ctx.client.authenticate(ctx.request)
+        return await call_next(ctx)
@@ -6,7 +6,9 @@ from http import HTTPStatus
 from typing import Awaitable, Callable, Generic, Optional, Union
 
 from meatie.aio import AsyncContext, AsyncEndpointDescriptor
-from meatie.descriptor import Context, EndpointDescriptor
+from meatie.aio.descriptor import AsyncOperator
+from meatie.aio.descriptor import proceed as async_proceed
+from meatie.descriptor import Context, EndpointDescriptor, Operator, proceed
 from meatie.error import RetryError
 from meatie.internal.retry import Condition, RetryContext, WaitFunc, has_status, never, zero
 from meatie.internal.types import PT, T
@@ -109,6 +111,10 @@ class RetryOperator(Generic[T]):
         self.__sleep_func = sleep_func
 
     def __call__(self, operation_ctx: Context[T]) -> T:
+        return self.apply(proceed, operation_ctx)
+
+    def apply(self, call_next: Operator[T], operation_ctx: Context[T]) -> T:
+        """Calls the endpoint until the call succeeds or the retry strategy stops."""
         retry_ctx = RetryContext(attempt_number=1, started_at=time.monotonic())
         last_result: Optional[T] = None
         stopped = False
@@ -121,7 +127,7 @@ class RetryOperator(Generic[T]):
             retry_ctx.error = None
             retry_ctx.response = None
             try:
-                last_result = operation_ctx.proceed()
+                last_result = call_next(operation_ctx)
                 retry_ctx.response = operation_ctx.response
             except BaseException as exc:
                 retry_ctx.error = exc
@@ -164,6 +170,10 @@ class AsyncRetryOperator(Generic[T]):
         self.__sleep_func = sleep_func
 
     async def __call__(self, operation_ctx: AsyncContext[T]) -> T:
+        return await self.apply(async_proceed, operation_ctx)
+
+    async def apply(self, call_next: AsyncOperator[T], operation_ctx: AsyncContext[T]) -> T:
+        """Calls the endpoint until the call succeeds or the retry strategy stops."""
         retry_ctx = RetryContext(attempt_number=1, started_at=time.monotonic())
         last_result: Optional[T] = None
         stopped = False
@@ -176,7 +186,7 @@ class AsyncRetryOperator(Generic[T]):
             retry_ctx.error = None
             retry_ctx.response = None
             try:
-                last_result = await operation_ctx.proceed()
+                last_result = await call_next(operation_ctx)
                 retry_ctx.response = operation_ctx.response
             except BaseException as exc:
                 retry_ctx.error = exc
@@ -0,0 +1,45 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+
+from typing import Union
+
+from meatie.aio import AsyncEndpointDescriptor
+from meatie.descriptor import EndpointDescriptor
+from meatie.internal.types import PT, T
+
+__all__ = ["trusted"]
+
+
+class TrustedOption:
+    """Build the HTTP response body from JSON without validating it against the return type of the endpoint.
+
+    Pydantic 1.x models are created with `construct`, dataclasses and typed dictionaries are created from their fields. Values of types that are not represented in JSON natively, such as datetime, are still validated.
+
+    Use the option for endpoints of services that are known to conform to the schema. Validating a sample of HTTP responses helps to detect schema drift. The option has no effect with pydantic 2, which validates JSON faster than models can be constructed in Python, and on return types that are not models, such as `dict` or `bytes`.
+    """
+
+    __slots__ = ("validation_ratio",)
+
+    def __init__(self, validation_ratio: float = 0.0) -> None:
+        """Creates a new trusted option.
+
+        Parameters:
+            validation_ratio: the fraction of HTTP responses to validate, for example, 0.01 validates 1 in 100 responses. The default is to validate none.
+
+        Raises:
+            ValueError: if validation_ratio is not between 0 and 1.
+        """
+        if not 0.0 <= validation_ratio <= 1.0:
+            raise ValueError("'validation_ratio' must be between 0 and 1")
+
+        self.validation_ratio = validation_ratio
+
+    def __call__(
+        self,
+        descriptor: Union[EndpointDescriptor[PT, T], AsyncEndpointDescriptor[PT, T]],
+    ) -> None:
+        """Apply the trusted option to the endpoint descriptor."""
+        descriptor.validation_ratio = self.validation_ratio
+
+
+trusted = TrustedOption
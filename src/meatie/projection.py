@@ -0,0 +1,32 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+"""Marker of return types whose HTTP response body is decoded only to the extent needed by the model."""
+
+from typing import Any
+
+__all__ = ["projection", "Projection"]
+
+
+class Projection:
+    """Projection decodes only the fields of the model from the HTTP response body.
+
+    Annotate the return type of an endpoint with the marker, for example `Annotated[Model, projection()]`. Members of
+    JSON objects that do not belong to the fields of the model, or to the fields of its nested models, are skipped by the
+    parser without being decoded. The remaining fields are validated against the model.
+
+    Use the marker with models that declare only the fields the application needs when the HTTP response body carries
+    many more. Models that do not ignore extra fields, accept fields by more than one key, or have validators that run
+    before the fields are validated are decoded from the whole HTTP response body. The marker requires the msgspec
+    package and has no effect without it.
+    """
+
+    __slots__ = ()
+
+    def __hash__(self) -> int:
+        return hash(Projection)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Projection)
+
+
+projection = Projection
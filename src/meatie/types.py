@@ -1,7 +1,7 @@
 #  Copyright 2024 The Meatie Authors. All rights reserved.
 #  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
 from dataclasses import dataclass
-from typing import Any, Optional, Protocol, Union, runtime_checkable
+from typing import Any, AsyncGenerator, Generator, Mapping, Optional, Protocol, Union, runtime_checkable
 
 from typing_extensions import Literal
 
@@ -22,6 +22,7 @@ class Request:
     """Specification of an HTTP request.
 
     Value types used for headers and query parameters must be supported by the underlying HTTP client library.
+    If `stream` is set, the HTTP client library should not read the response body upfront, so it can be consumed in chunks.
     """
 
     method: Method
@@ -30,6 +31,7 @@ class Request:
     headers: dict[str, Any]
     data: Optional[Union[str, bytes]] = None
     json: Any = None
+    stream: bool = False
 
 
 @runtime_checkable
@@ -45,6 +47,15 @@ class AsyncResponse(Protocol):
         """
         ...
 
+    @property
+    def headers(self) -> Mapping[str, str]:
+        """Get HTTP response headers.
+
+        Returns:
+            HTTP response headers. Header names are case-insensitive.
+        """
+        ...
+
     async def read(self) -> bytes:
         """Reads the response body and returns it as bytes without decoding.
 
@@ -79,6 +90,19 @@ class AsyncResponse(Protocol):
         """
         ...
 
+    def iter_bytes(self) -> AsyncGenerator[bytes, None]:
+        """Reads the response body in chunks without loading it into memory at once.
+
+        The connection is released once the iterator is exhausted or closed.
+
+        Returns:
+            Asynchronous iterator over chunks of the response body.
+
+        Raises:
+            ResponseError: If an error occurs while reading the response body.
+        """
+        ...
+
 
 @runtime_checkable
 class Response(Protocol):
@@ -93,6 +117,15 @@ class Response(Protocol):
         """
         ...
 
+    @property
+    def headers(self) -> Mapping[str, str]:
+        """Get HTTP response headers.
+
+        Returns:
+            HTTP response headers. Header names are case-insensitive.
+        """
+        ...
+
     def read(self) -> bytes:
         """Reads the response body and returns it as bytes without decoding.
 
@@ -126,3 +159,16 @@ class Response(Protocol):
             ParseResponseError: If an error occurs while parsing the response body.
         """
         ...
+
+    def iter_bytes(self) -> Generator[bytes, None, None]:
+        """Reads the response body in chunks without loading it into memory at once.
+
+        The connection is released once the iterator is exhausted or closed.
+
+        Returns:
+            Iterator over chunks of the response body.
+
+        Raises:
+            ResponseError: If an error occurs while reading the response body.
+        """
+        ...
@@ -9,6 +9,7 @@ from meatie import (
     AsyncResponse,
     BaseAsyncClient,
     Cache,
+    JsonCodec,
     MeatieError,
     ProxyError,
     Request,
@@ -17,6 +18,7 @@ from meatie import (
     Timeout,
     TransportError,
 )
+from meatie.codec import with_json_content_type
 
 from .response import Response
 
@@ -31,8 +33,9 @@ class Client(BaseAsyncClient):
         local_cache: Optional[Cache] = None,
         limiter: Optional[Any] = None,
         prefix: Optional[str] = None,
+        json_codec: Optional[JsonCodec] = None,
     ) -> None:
-        super().__init__(local_cache, limiter)
+        super().__init__(local_cache, limiter, json_codec)
 
         self.session = session
         self.session_params = session_params if session_params else {}
@@ -48,11 +51,16 @@ class Client(BaseAsyncClient):
         if request.data is not None:
             kwargs["data"] = request.data
 
+        headers = request.headers
         if request.json is not None:
-            kwargs["json"] = request.json
+            if self.json_codec is None:
+                kwargs["json"] = request.json
+            else:
+                kwargs["data"] = self.json_codec.dumps(request.json)
+                headers = with_json_content_type(headers)
 
-        if request.headers:
-            kwargs["headers"] = request.headers
+        if headers:
+            kwargs["headers"] = headers
 
         if request.params:
             kwargs["params"] = request.params
@@ -81,7 +89,7 @@ class Client(BaseAsyncClient):
             raise TransportError() from exc
         except Exception as exc:
             raise MeatieError() from exc
-        return Response(response)
+        return Response(response, json_codec=self.json_codec)
 
     async def __aexit__(
         self,
@@ -1,10 +1,11 @@
 #  Copyright 2024 The Meatie Authors. All rights reserved.
 #  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
 from json.decoder import JSONDecodeError
-from typing import Any, Awaitable, Callable, Optional
+from typing import Any, AsyncGenerator, Awaitable, Callable, Mapping, Optional
 
 from aiohttp import ClientError, ClientResponse, ContentTypeError
 
+from meatie.codec import JsonCodec, get_json_codec
 from meatie.error import ParseResponseError, ResponseError
 from meatie.types import AsyncResponse as BaseAsyncResponse
 
@@ -12,13 +13,17 @@ from meatie.types import AsyncResponse as BaseAsyncResponse
 class Response(BaseAsyncResponse):
     """The async response implementation for aiohttp."""
 
+    chunk_size = 64 * 1024
+
     def __init__(
         self,
         response: ClientResponse,
         get_json: Optional[Callable[[ClientResponse], Awaitable[dict[str, Any]]]] = None,
         get_text: Optional[Callable[[ClientResponse], Awaitable[str]]] = None,
+        json_codec: Optional[JsonCodec] = None,
     ) -> None:
         self.response = response
+        self.json_codec = json_codec
         if get_json is not None:
             self.get_json = get_json  # type: ignore[assignment]
         if get_text is not None:
@@ -28,9 +33,13 @@ class Response(BaseAsyncResponse):
     def status(self) -> int:
         return self.response.status
 
+    @property
+    def headers(self) -> Mapping[str, str]:
+        return self.response.headers
+
     async def read(self) -> bytes:
         try:
-            return await self.response.content.read()
+            return await self.response.read()
         except Exception as exc:
             raise ResponseError(self) from exc
 
@@ -41,6 +50,15 @@ class Response(BaseAsyncResponse):
             raise ResponseError(self) from exc
 
     async def json(self) -> dict[str, Any]:
+        json_codec = get_json_codec(self)
+        if json_codec is not None:
+            content = await self.read()
+            try:
+                return json_codec.loads(content)
+            except ValueError as exc:
+                text = await self.text()
+                raise ParseResponseError(text, self) from exc
+
         try:
             return await self.get_json(self.response)
         except JSONDecodeError as exc:
@@ -52,6 +70,15 @@ class Response(BaseAsyncResponse):
         except ClientError as exc:
             raise ResponseError(self) from exc
 
+    async def iter_bytes(self) -> AsyncGenerator[bytes, None]:
+        try:
+            async for chunk in self.response.content.iter_chunked(self.chunk_size):
+                yield chunk
+        except Exception as exc:
+            raise ResponseError(self) from exc
+        finally:
+            self.response.release()
+
     @classmethod
     def get_json(cls, response: ClientResponse) -> Awaitable[dict[str, Any]]:
         return response.json()
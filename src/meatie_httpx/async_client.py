@@ -8,6 +8,7 @@ from typing_extensions import Self
 from meatie import (
     BaseAsyncClient,
     Cache,
+    JsonCodec,
     MeatieError,
     ProxyError,
     RequestError,
@@ -18,7 +19,7 @@ from meatie import (
 from meatie.types import Request
 
 from .async_response import AsyncResponse
-from .client import build_kwargs
+from .client import build_kwargs, split_send_kwargs
 
 
 class AsyncClient(BaseAsyncClient):
@@ -31,22 +32,26 @@ class AsyncClient(BaseAsyncClient):
         local_cache: Optional[Cache] = None,
         limiter: Optional[Any] = None,
         prefix: Optional[str] = None,
+        json_codec: Optional[JsonCodec] = None,
     ) -> None:
-        super().__init__(local_cache, limiter)
+        super().__init__(local_cache, limiter, json_codec)
 
         self.client = client
         self.client_params = client_params if client_params else {}
         self.prefix = prefix
 
     async def send(self, request: Request) -> AsyncResponse:
-        kwargs = build_kwargs(request, self.client_params)
+        kwargs = build_kwargs(request, self.client_params, self.json_codec)
 
         path = request.path
         if self.prefix is not None:
             path = self.prefix + path
 
         try:
-            response = await self.client.request(request.method, path, **kwargs)
+            if request.stream:
+                response = await self.__send_stream(request.method, path, kwargs)
+            else:
+                response = await self.client.request(request.method, path, **kwargs)
         except (httpx.InvalidURL, httpx.UnsupportedProtocol) as exc:
             raise RequestError() from exc
         except httpx.ProxyError as exc:
@@ -59,7 +64,15 @@ class AsyncClient(BaseAsyncClient):
             raise TransportError() from exc
         except httpx.HTTPError as exc:
             raise MeatieError() from exc
-        return AsyncResponse(response)
+        return AsyncResponse(response, json_codec=self.json_codec)
+
+    async def __send_stream(self, method: str, path: str, kwargs: dict[str, Any]) -> httpx.Response:
+        send_kwargs = split_send_kwargs(kwargs)
+        response = await self.client.send(self.client.build_request(method, path, **kwargs), stream=True, **send_kwargs)
+        if response.is_error:
+            # read the body of error responses, so error handlers can inspect it
+            await response.aread()
+        return response
 
     async def __aenter__(self) -> Self:
         return self
@@ -1,24 +1,29 @@
 #  Copyright 2025 The Meatie Authors. All rights reserved.
 #  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
 from json.decoder import JSONDecodeError
-from typing import Any, Awaitable, Callable, Optional
+from typing import Any, AsyncGenerator, Awaitable, Callable, Mapping, Optional
 
 import httpx
 
 from meatie import AsyncResponse as BaseAsyncResponse
-from meatie import ParseResponseError, ResponseError
+from meatie import JsonCodec, ParseResponseError, ResponseError
+from meatie.codec import get_json_codec
 
 
 class AsyncResponse(BaseAsyncResponse):
     """The async response implementation using httpx."""
 
+    chunk_size = 64 * 1024
+
     def __init__(
         self,
         response: httpx.Response,
         get_json: Optional[Callable[[httpx.Response], Awaitable[Any]]] = None,
         get_text: Optional[Callable[[httpx.Response], Awaitable[str]]] = None,
+        json_codec: Optional[JsonCodec] = None,
     ) -> None:
         self.response = response
+        self.json_codec = json_codec
         if get_json is not None:
             self.get_json = get_json  # type: ignore[assignment]
         if get_text is not None:
@@ -28,6 +33,10 @@ class AsyncResponse(BaseAsyncResponse):
     def status(self) -> int:
         return self.response.status_code
 
+    @property
+    def headers(self) -> Mapping[str, str]:
+        return self.response.headers
+
     async def read(self) -> bytes:
         try:
             return self.response.content
@@ -41,6 +50,15 @@ class AsyncResponse(BaseAsyncResponse):
             raise ResponseError(self) from exc
 
     async def json(self) -> dict[str, Any]:
+        json_codec = get_json_codec(self)
+        if json_codec is not None:
+            content = await self.read()
+            try:
+                return json_codec.loads(content)
+            except ValueError as exc:
+                text = await self.text()
+                raise ParseResponseError(text, self) from exc
+
         try:
             return await self.get_json(self.response)
         except JSONDecodeError as exc:
@@ -49,6 +67,15 @@ class AsyncResponse(BaseAsyncResponse):
         except Exception as exc:
             raise ResponseError(self) from exc
 
+    async def iter_bytes(self) -> AsyncGenerator[bytes, None]:
+        try:
+            async for chunk in self.response.aiter_bytes(chunk_size=self.chunk_size):
+                yield chunk
+        except Exception as exc:
+            raise ResponseError(self) from exc
+        finally:
+            await self.response.aclose()
+
     @classmethod
     async def get_json(cls, response: httpx.Response) -> Any:
         return response.json()
@@ -8,6 +8,7 @@ from typing_extensions import Self
 from meatie import (
     BaseClient,
     Cache,
+    JsonCodec,
     MeatieError,
     ProxyError,
     Request,
@@ -16,6 +17,7 @@ from meatie import (
     Timeout,
     TransportError,
 )
+from meatie.codec import with_json_content_type
 
 from .response import Response
 
@@ -30,22 +32,26 @@ class Client(BaseClient):
         local_cache: Optional[Cache] = None,
         limiter: Optional[Any] = None,
         prefix: Optional[str] = None,
+        json_codec: Optional[JsonCodec] = None,
     ) -> None:
-        super().__init__(local_cache, limiter)
+        super().__init__(local_cache, limiter, json_codec)
 
         self.client = client
         self.client_params = client_params if client_params else {}
         self.prefix = prefix
 
     def send(self, request: Request) -> Response:
-        kwargs = build_kwargs(request, self.client_params)
+        kwargs = build_kwargs(request, self.client_params, self.json_codec)
 
         path = request.path
         if self.prefix is not None:
             path = self.prefix + path
 
         try:
-            response = self.client.request(request.method, path, **kwargs)
+            if request.stream:
+                response = self.__send_stream(request.method, path, kwargs)
+            else:
+                response = self.client.request(request.method, path, **kwargs)
         except (httpx.InvalidURL, httpx.UnsupportedProtocol) as exc:
             raise RequestError(exc) from exc
         except httpx.ProxyError as exc:
@@ -58,7 +64,15 @@ class Client(BaseClient):
             raise TransportError(exc) from exc
         except httpx.HTTPError as exc:
             raise MeatieError(exc) from exc
-        return Response(response)
+        return Response(response, json_codec=self.json_codec)
+
+    def __send_stream(self, method: str, path: str, kwargs: dict[str, Any]) -> httpx.Response:
+        send_kwargs = split_send_kwargs(kwargs)
+        response = self.client.send(self.client.build_request(method, path, **kwargs), stream=True, **send_kwargs)
+        if response.is_error:
+            # read the body of error responses, so error handlers can inspect it
+            response.read()
+        return response
 
     def __enter__(self) -> Self:
         return self
@@ -75,19 +89,31 @@ class Client(BaseClient):
         self.client.close()
 
 
-def build_kwargs(request: Request, client_params: dict[str, Any]) -> dict[str, Any]:
+def build_kwargs(
+    request: Request, client_params: dict[str, Any], json_codec: Optional[JsonCodec] = None
+) -> dict[str, Any]:
     kwargs = client_params.copy()
 
     if request.data is not None:
         kwargs["content"] = request.data
 
+    headers = request.headers
     if request.json is not None:
-        kwargs["json"] = request.json
+        if json_codec is None:
+            kwargs["json"] = request.json
+        else:
+            kwargs["content"] = json_codec.dumps(request.json)
+            headers = with_json_content_type(headers)
 
-    if request.headers:
-        kwargs["headers"] = request.headers
+    if headers:
+        kwargs["headers"] = headers
 
     if request.params:
         kwargs["params"] = request.params
 
     return kwargs
+
+
+def split_send_kwargs(kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Moves keyword arguments accepted by `send` but not by `build_request` to a separate dictionary."""
+    return {name: kwargs.pop(name) for name in ("auth", "follow_redirects") if name in kwargs}
@@ -1,14 +1,20 @@
 #  Copyright 2024 The Meatie Authors. All rights reserved.
 #  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
-from typing import Any, Optional
+import copy
+import threading
+import weakref
+from functools import partial
+from typing import Any, Callable, Optional
 
 import requests.exceptions
 from requests import Session
+from requests.structures import CaseInsensitiveDict
 from typing_extensions import Self
 
 from meatie import (
     BaseClient,
     Cache,
+    JsonCodec,
     MeatieError,
     ProxyError,
     Request,
@@ -17,12 +23,20 @@ from meatie import (
     Timeout,
     TransportError,
 )
+from meatie.codec import with_json_content_type
+from meatie.descriptor import is_batch_worker
 
 from .response import Response
 
 
 class Client(BaseClient):
-    """The sync client implementation using requests."""
+    """The sync client implementation using requests.
+
+    Batch calls made with map() run in worker threads. requests.Session is not thread-safe, so each worker thread uses
+    its own session created by session_factory. By default, the session is copied with its headers, cookies,
+    authentication and adapters. Set share_session if the session can be used from many threads at the same time.
+    Calls made outside of batches use the session of the client.
+    """
 
     def __init__(
         self,
@@ -31,12 +45,38 @@ class Client(BaseClient):
         local_cache: Optional[Cache] = None,
         limiter: Optional[Any] = None,
         prefix: Optional[str] = None,
+        session_factory: Optional[Callable[[], Session]] = None,
+        json_codec: Optional[JsonCodec] = None,
+        share_session: bool = False,
     ) -> None:
-        super().__init__(local_cache, limiter)
+        super().__init__(local_cache, limiter, json_codec)
 
         self.session = session
         self.session_params = session_params if session_params else {}
         self.prefix = prefix
+        # requests.Session is not thread-safe, the worker threads of batch calls use their own sessions unless the
+        # caller opts in to share the session
+        self.session_factory = session_factory if session_factory is not None else partial(_copy_session, session)
+        self.share_session = share_session
+        self.__local = threading.local()
+        self.__lock = threading.Lock()
+        self.__thread_sessions: list["weakref.finalize[[], _ThreadSession]"] = []
+
+    def get_session(self) -> Session:
+        if self.share_session or not is_batch_worker():
+            return self.session
+
+        holder: Optional[_ThreadSession] = getattr(self.__local, "holder", None)
+        if holder is None:
+            holder = _ThreadSession(self.session_factory())
+            self.__local.holder = holder
+            # the thread-local storage is released when the thread exits, i.e., when the thread pool of a batch call
+            # is shut down, so the session does not outlive the batch
+            finalizer = weakref.finalize(holder, holder.session.close)
+            with self.__lock:
+                self.__thread_sessions = [session for session in self.__thread_sessions if session.alive]
+                self.__thread_sessions.append(finalizer)
+        return holder.session
 
     def send(self, request: Request) -> Response:
         kwargs: dict[str, Any] = self.session_params.copy()
@@ -48,17 +88,25 @@ class Client(BaseClient):
         if request.data is not None:
             kwargs["data"] = request.data
 
+        headers = request.headers
         if request.json is not None:
-            kwargs["json"] = request.json
+            if self.json_codec is None:
+                kwargs["json"] = request.json
+            else:
+                kwargs["data"] = self.json_codec.dumps(request.json)
+                headers = with_json_content_type(headers)
 
-        if request.headers:
-            kwargs["headers"] = request.headers
+        if headers:
+            kwargs["headers"] = headers
 
         if request.params:
             kwargs["params"] = request.params
 
+        if request.stream:
+            kwargs["stream"] = True
+
         try:
-            response = self.session.request(request.method, path, **kwargs)
+            response = self.get_session().request(request.method, path, **kwargs)
         except (
             requests.exceptions.URLRequired,
             requests.exceptions.MissingSchema,
@@ -84,7 +132,7 @@ class Client(BaseClient):
         except requests.exceptions.RequestException as exc:
             raise MeatieError(exc) from exc
 
-        return Response(response)
+        return Response(response, json_codec=self.json_codec)
 
     def __enter__(self) -> Self:
         return self
@@ -99,3 +147,33 @@ class Client(BaseClient):
 
     def close(self) -> None:
         self.session.close()
+
+        with self.__lock:
+            thread_sessions, self.__thread_sessions = self.__thread_sessions, []
+        for close_session in thread_sessions:
+            close_session()
+
+
+def _copy_session(session: Session) -> Session:
+    copied = type(session)()
+    copied.headers = CaseInsensitiveDict(session.headers)
+    # the cookie jar is guarded by a lock, so the sessions share it and see the cookies set by each other
+    copied.cookies = session.cookies
+    copied.auth = session.auth
+    copied.proxies = dict(session.proxies)
+    copied.hooks = {event: list(hooks) for event, hooks in session.hooks.items()}
+    copied.params = copy.copy(session.params)
+    copied.verify = session.verify
+    copied.cert = session.cert
+    copied.stream = session.stream
+    copied.trust_env = session.trust_env
+    copied.max_redirects = session.max_redirects
+    for prefix, adapter in session.adapters.items():
+        # the copy of an adapter has its own connection pool
+        copied.mount(prefix, copy.copy(adapter))
+    return copied
+
+
+class _ThreadSession:
+    def __init__(self, session: Session) -> None:
+        self.session = session
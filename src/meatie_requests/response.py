@@ -1,23 +1,28 @@
 #  Copyright 2024 The Meatie Authors. All rights reserved.
 #  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Generator, Mapping, Optional
 
 import requests
 
-from meatie import ParseResponseError, ResponseError
+from meatie import JsonCodec, ParseResponseError, ResponseError
 from meatie import Response as BaseResponse
+from meatie.codec import get_json_codec
 
 
 class Response(BaseResponse):
     """The sync response implementation using requests."""
 
+    chunk_size = 64 * 1024
+
     def __init__(
         self,
         response: requests.Response,
         get_json: Optional[Callable[[requests.Response], Any]] = None,
         get_text: Optional[Callable[[requests.Response], str]] = None,
+        json_codec: Optional[JsonCodec] = None,
     ) -> None:
         self.response = response
+        self.json_codec = json_codec
         if get_json is not None:
             self.get_json = get_json  # type: ignore[assignment]
         if get_text is not None:
@@ -27,6 +32,10 @@ class Response(BaseResponse):
     def status(self) -> int:
         return self.response.status_code
 
+    @property
+    def headers(self) -> Mapping[str, str]:
+        return self.response.headers
+
     def read(self) -> bytes:
         try:
             return self.response.content
@@ -40,6 +49,15 @@ class Response(BaseResponse):
             raise ResponseError(self) from exc
 
     def json(self) -> Any:
+        json_codec = get_json_codec(self)
+        if json_codec is not None:
+            content = self.read()
+            try:
+                return json_codec.loads(content)
+            except ValueError as exc:
+                text = self.text()
+                raise ParseResponseError(text, self) from exc
+
         try:
             return self.get_json(self.response)
         except requests.JSONDecodeError as exc:
@@ -48,6 +66,14 @@ class Response(BaseResponse):
         except Exception as exc:
             raise ResponseError(self) from exc
 
+    def iter_bytes(self) -> Generator[bytes, None, None]:
+        try:
+            yield from self.response.iter_content(chunk_size=self.chunk_size)
+        except Exception as exc:
+            raise ResponseError(self) from exc
+        finally:
+            self.response.close()
+
     @classmethod
     def get_json(cls, response: requests.Response) -> Any:
         return response.json()
@@ -0,0 +1,40 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+import json
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler
+from typing import Any, AsyncIterator
+
+import pytest
+from aiohttp import ClientSession
+from http_test import HTTPTestServer
+
+from meatie import endpoint
+from meatie_aiohttp import Client
+
+RECORDS = [{"id": index, "name": f"record {index}"} for index in range(10_000)]
+
+
+@pytest.mark.asyncio()
+async def test_can_stream_json_lines(http_server: HTTPTestServer) -> None:
+    # GIVEN
+    def handler(request: BaseHTTPRequestHandler) -> None:
+        content = b"".join(json.dumps(record).encode() + b"\n" for record in RECORDS)
+        request.send_response(HTTPStatus.OK)
+        request.send_header("Content-Type", "application/x-ndjson")
+        request.send_header("Content-Length", str(len(content)))
+        request.end_headers()
+        request.wfile.write(content)
+
+    http_server.handler = handler
+
+    class TestClient(Client):
+        @endpoint("/")
+        async def get_records(self) -> AsyncIterator[dict[str, Any]]: ...
+
+    # WHEN
+    async with TestClient(ClientSession(http_server.base_url)) as client:
+        records = [record async for record in await client.get_records()]
+
+    # THEN
+    assert RECORDS == records
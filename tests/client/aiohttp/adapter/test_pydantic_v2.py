@@ -6,10 +6,10 @@ from typing import Annotated, Union
 import pytest
 from aiohttp import ClientSession
 from http_test import Handler, HTTPTestServer
-from http_test.handlers import echo_json_handler
+from http_test.handlers import echo_json_handler, status_ok_as_text
 from typing_extensions import Literal
 
-from meatie import api_ref, endpoint
+from meatie import ParseResponseError, api_ref, chunked, endpoint
 from meatie_aiohttp import Client
 
 pydantic = pytest.importorskip("pydantic", minversion="2.0.0")
@@ -193,3 +193,58 @@ async def test_can_handle_list_of_discriminated_union(http_server: HTTPTestServe
     assert isinstance(instruments[0], Currency)
     assert isinstance(instruments[1], Spot)
     assert isinstance(instruments[2], Perpetual)
+
+
+@pytest.mark.asyncio()
+async def test_invalid_json_raises_parse_error(http_server: HTTPTestServer) -> None:
+    # GIVEN
+    http_server.handler = status_ok_as_text
+
+    class TestClient(Client):
+        @endpoint("/todos")
+        async def get_todo(self) -> Todo: ...
+
+    # WHEN
+    async with TestClient(ClientSession(base_url=http_server.base_url)) as client:
+        with pytest.raises(ParseResponseError) as exc_info:
+            await client.get_todo()
+
+    # THEN
+    assert "{'status': 'ok'}" == exc_info.value.text
+
+
+async def test_chunked_endpoint_decodes_list(http_server: HTTPTestServer) -> None:
+    # GIVEN
+    http_server.handler = echo_json_handler
+    todos = [Todo(userId=123, id=index, title="abc", completed=True) for index in range(10)]
+
+    class TestClient(Client):
+        @endpoint("/todos", chunked(threshold=0, chunk_size=16))
+        async def post_todos(self, todos: Annotated[list[Todo], api_ref("body")]) -> list[Todo]: ...
+
+    # WHEN
+    async with TestClient(ClientSession(base_url=http_server.base_url)) as client:
+        result = await client.post_todos(todos)
+
+    # THEN
+    assert todos == result
+
+
+async def test_chunked_endpoint_checks_constraints_of_whole_list(http_server: HTTPTestServer) -> None:
+    # GIVEN
+    http_server.handler = echo_json_handler
+    todos = [Todo(userId=123, id=index, title="abc", completed=True) for index in range(10)]
+
+    class TestClient(Client):
+        @endpoint("/todos", chunked(threshold=0, chunk_size=16))
+        async def post_todos(
+            self, todos: Annotated[list[Todo], api_ref("body")]
+        ) -> Annotated[list[Todo], pydantic.Field(max_length=5)]: ...
+
+    # WHEN
+    async with TestClient(ClientSession(base_url=http_server.base_url)) as client:
+        with pytest.raises(ParseResponseError) as exc_info:
+            await client.post_todos(todos)
+
+    # THEN
+    assert isinstance(exc_info.value.__cause__, pydantic.ValidationError)
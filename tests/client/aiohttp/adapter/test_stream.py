@@ -0,0 +1,57 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler
+from typing import AsyncIterator
+
+import pytest
+from aiohttp import ClientSession
+from http_test import HTTPTestServer
+
+from meatie import Request, endpoint
+from meatie_aiohttp import Client
+
+SAMPLE_BYTES = bytes(range(256)) * 1024
+
+
+def stream_handler(request: BaseHTTPRequestHandler) -> None:
+    request.send_response(HTTPStatus.OK)
+    request.send_header("Content-Length", str(len(SAMPLE_BYTES)))
+    request.end_headers()
+    request.wfile.write(SAMPLE_BYTES)
+
+
+@pytest.mark.asyncio()
+async def test_can_stream_bytes(http_server: HTTPTestServer) -> None:
+    # GIVEN
+    http_server.handler = stream_handler
+
+    class TestClient(Client):
+        @endpoint("/")
+        async def get_response(self) -> AsyncIterator[bytes]: ...
+
+    # WHEN
+    async with TestClient(ClientSession(http_server.base_url)) as client:
+        chunks = [chunk async for chunk in await client.get_response()]
+
+    # THEN
+    assert SAMPLE_BYTES == b"".join(chunks)
+    assert len(chunks) > 1
+
+
+@pytest.mark.asyncio()
+async def test_closing_stream_releases_connection(http_server: HTTPTestServer) -> None:
+    # GIVEN
+    http_server.handler = stream_handler
+    request = Request("GET", "/", params={}, headers={}, stream=True)
+
+    async with Client(ClientSession(http_server.base_url)) as client:
+        response = await client.send(request)
+
+        # WHEN
+        stream = response.iter_bytes()
+        await stream.__anext__()
+        await stream.aclose()
+
+        # THEN
+        assert response.response.closed  # type: ignore[attr-defined]
@@ -1,12 +1,18 @@
 #  Copyright 2024 The Meatie Authors. All rights reserved.
 #  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
 
-from typing import Any, cast
+import asyncio
+import time
+from http import HTTPStatus
+from typing import Any, Callable, cast
 
+import aiohttp
 import pytest
 from aiohttp import ClientSession
+from mock_tools.aiohttp import MockTools
+from typing_extensions import override
 
-from meatie import INF, cache, endpoint
+from meatie import INF, Cache, TransportError, cache, endpoint
 from meatie_aiohttp import Client
 
 PRODUCTS = [{"name": "pencil"}, {"name": "headphones"}]
@@ -70,3 +76,108 @@ async def test_global_cache_is_shared(mock_tools) -> None:
     # THEN
     assert PRODUCTS == second_result
     session.request.assert_not_called()
+
+
+class TimedCache(Cache):
+    def __init__(self) -> None:
+        super().__init__()
+        self.current_time = 0.0
+
+    @override
+    def _now(self) -> float:
+        return self.current_time
+
+
+async def wait_for(condition: Callable[[], bool]) -> None:
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline, "the condition was not met in time"
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio()
+async def test_stale_while_revalidate_returns_stale_value_and_refreshes_it(mock_tools: MockTools) -> None:
+    # GIVEN
+    storage = TimedCache()
+    session = mock_tools.session_with_json_response(json=PRODUCTS)
+
+    class Store(Client):
+        @endpoint("/api/v1/products", cache(ttl=10, stale_while_revalidate=10))
+        async def get_products(self) -> list[Any]: ...
+
+    async with Store(session, local_cache=storage) as api:
+        await api.get_products()
+        new_products = [{"name": "pen"}]
+        session.request.return_value = mock_tools.json_response(json=new_products)
+        storage.current_time = 15
+
+        # WHEN
+        stale_results = await asyncio.gather(api.get_products(), api.get_products())
+        await wait_for(lambda: storage.load("/api/v1/products") == new_products)
+        fresh_result = await api.get_products()
+
+    # THEN
+    assert [PRODUCTS, PRODUCTS] == list(stale_results)
+    assert new_products == fresh_result
+    assert 2 == session.request.await_count
+
+
+@pytest.mark.asyncio()
+async def test_stale_if_error_returns_stale_value_on_error(mock_tools: MockTools) -> None:
+    # GIVEN
+    storage = TimedCache()
+    session = mock_tools.session_with_json_response(json=PRODUCTS)
+
+    class Store(Client):
+        @endpoint("/api/v1/products", cache(ttl=10, stale_if_error=10))
+        async def get_products(self) -> list[Any]: ...
+
+    async with Store(session, local_cache=storage) as api:
+        await api.get_products()
+        session.request.side_effect = aiohttp.ClientError("connection refused")
+
+        # WHEN
+        storage.current_time = 15
+        stale_result = await api.get_products()
+
+        # THEN
+        assert PRODUCTS == stale_result
+        assert 2 == session.request.await_count
+
+        # WHEN
+        storage.current_time = 21
+        with pytest.raises(TransportError):
+            await api.get_products()
+
+
+@pytest.mark.asyncio()
+async def test_http_cache_revalidates_expired_response_in_background(mock_tools: MockTools) -> None:
+    # GIVEN
+    storage = TimedCache()
+    response = mock_tools.json_response(json=PRODUCTS, headers={"Cache-Control": "max-age=10", "ETag": '"v1"'})
+    session = mock_tools.session_wrap_response(response)
+
+    class Store(Client):
+        @endpoint("/api/v1/products", cache(ttl=INF, stale_while_revalidate=10, http=True))
+        async def get_products(self) -> list[Any]: ...
+
+    async with Store(session, local_cache=storage) as api:
+        await api.get_products()
+        not_modified = mock_tools.json_response(
+            json=None, status=HTTPStatus.NOT_MODIFIED, headers={"Cache-Control": "max-age=20"}
+        )
+        session.request.return_value = not_modified
+        storage.current_time = 15
+
+        # WHEN
+        stale_result = await api.get_products()
+        await wait_for(lambda: storage.load("/api/v1/products") is not None)
+        storage.current_time = 30
+        fresh_result = await api.get_products()
+
+    # THEN
+    assert PRODUCTS == stale_result
+    assert PRODUCTS == fresh_result
+    assert 2 == session.request.await_count
+    assert {"If-None-Match": '"v1"'} == session.request.call_args.kwargs["headers"]
+    not_modified.read.assert_not_awaited()
@@ -0,0 +1,188 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+import asyncio
+from typing import Any, Optional
+from unittest.mock import AsyncMock
+
+import pytest
+from mock_tools.aiohttp import MockTools
+
+from meatie import INF, Cache, cache, coalesce, endpoint
+from meatie_aiohttp import Client
+
+PRODUCTS = [{"name": "pencil"}, {"name": "headphones"}]
+
+
+def slow_session(
+    mock_tools: MockTools, json: Any, release: asyncio.Event, headers: Optional[dict[str, str]] = None
+) -> Any:
+    response = mock_tools.json_response(json=json, headers=headers)
+    session = mock_tools.session_wrap_response(response)
+
+    async def request(*args: Any, **kwargs: Any) -> Any:
+        await release.wait()
+        return response
+
+    session.request = AsyncMock(side_effect=request)
+    return session
+
+
+@pytest.mark.asyncio()
+async def test_concurrent_calls_share_request(mock_tools: MockTools) -> None:
+    # GIVEN
+    release = asyncio.Event()
+    session = slow_session(mock_tools, PRODUCTS, release)
+
+    class Store(Client):
+        def __init__(self) -> None:
+            super().__init__(session)
+
+        @endpoint("/api/v1/products", coalesce())
+        async def get_products(self) -> list[Any]: ...
+
+    # WHEN
+    async with Store() as api:
+        tasks = [asyncio.create_task(api.get_products()) for _ in range(10)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+    # THEN
+    assert [PRODUCTS] * 10 == results
+    session.request.assert_awaited_once()
+
+
+@pytest.mark.asyncio()
+async def test_calls_with_different_parameters_are_not_coalesced(mock_tools: MockTools) -> None:
+    # GIVEN
+    release = asyncio.Event()
+    session = slow_session(mock_tools, PRODUCTS, release)
+
+    class Store(Client):
+        def __init__(self) -> None:
+            super().__init__(session)
+
+        @endpoint("/api/v1/products", coalesce())
+        async def get_products(self, category: str) -> list[Any]: ...
+
+    # WHEN
+    async with Store() as api:
+        tasks = [asyncio.create_task(api.get_products(category)) for category in ["pens", "pens", "audio"]]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(*tasks)
+
+    # THEN
+    assert 2 == session.request.await_count
+
+
+@pytest.mark.asyncio()
+async def test_error_is_shared(mock_tools: MockTools) -> None:
+    # GIVEN
+    release = asyncio.Event()
+    session = mock_tools.session_with_json_response(json=PRODUCTS)
+
+    async def request(*args: Any, **kwargs: Any) -> Any:
+        await release.wait()
+        raise RuntimeError("upstream")
+
+    session.request = AsyncMock(side_effect=request)
+
+    class Store(Client):
+        def __init__(self) -> None:
+            super().__init__(session)
+
+        @endpoint("/api/v1/products", coalesce())
+        async def get_products(self) -> list[Any]: ...
+
+    # WHEN
+    async with Store() as api:
+        tasks = [asyncio.create_task(api.get_products()) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    # THEN
+    assert all(isinstance(result, Exception) for result in results)
+    session.request.assert_awaited_once()
+
+
+@pytest.mark.asyncio()
+async def test_cancelled_leader_does_not_cancel_waiting_calls(mock_tools: MockTools) -> None:
+    # GIVEN
+    release = asyncio.Event()
+    session = slow_session(mock_tools, PRODUCTS, release)
+
+    class Store(Client):
+        def __init__(self) -> None:
+            super().__init__(session)
+
+        @endpoint("/api/v1/products", coalesce())
+        async def get_products(self) -> list[Any]: ...
+
+    # WHEN
+    async with Store() as api:
+        leader = asyncio.create_task(api.get_products())
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(api.get_products())
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        result = await follower
+
+    # THEN
+    assert PRODUCTS == result
+    assert leader.cancelled()
+    assert 2 == session.request.await_count
+
+
+@pytest.mark.asyncio()
+async def test_cache_with_coalesce(mock_tools: MockTools) -> None:
+    # GIVEN
+    release = asyncio.Event()
+    session = slow_session(mock_tools, PRODUCTS, release)
+
+    class Store(Client):
+        def __init__(self) -> None:
+            super().__init__(session)
+
+        @endpoint("/api/v1/products", cache(ttl=INF, coalesce=True))
+        async def get_products(self) -> list[Any]: ...
+
+    # WHEN
+    async with Store() as api:
+        tasks = [asyncio.create_task(api.get_products()) for _ in range(10)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+        cached_result = await api.get_products()
+
+    # THEN
+    assert [PRODUCTS] * 10 == results
+    assert PRODUCTS == cached_result
+    session.request.assert_awaited_once()
+
+
+@pytest.mark.asyncio()
+async def test_http_cache_with_coalesce_follows_headers_of_shared_response(mock_tools: MockTools) -> None:
+    # GIVEN
+    release = asyncio.Event()
+    session = slow_session(mock_tools, PRODUCTS, release, headers={"Cache-Control": "no-store"})
+    storage = Cache()
+
+    class Store(Client):
+        @endpoint("/api/v1/products", cache(ttl=60, http=True, coalesce=True))
+        async def get_products(self) -> list[Any]: ...
+
+    # WHEN
+    async with Store(session, local_cache=storage) as api:
+        tasks = [asyncio.create_task(api.get_products()) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+    # THEN
+    assert [PRODUCTS] * 3 == results
+    assert storage.load("/api/v1/products") is None
+    session.request.assert_awaited_once()
@@ -8,6 +8,7 @@ import pytest
 from http_test import ClientAdapter
 from suite.client import DefaultSuite
 
+from meatie import JsonCodec
 from meatie_aiohttp import Client as AiohttpClient
 
 
@@ -20,3 +21,15 @@ class TestAiohttpDefaultSuite(DefaultSuite):
     ) -> Generator[ClientAdapter, None, None]:
         with ClientAdapter(event_loop, AiohttpClient(create_client_session())) as client:
             yield client
+
+
+class TestAiohttpJsonCodecSuite(DefaultSuite):
+    @pytest.fixture(name="client")
+    def client_fixture(
+        self,
+        event_loop: asyncio.AbstractEventLoop,
+        create_client_session: Callable[..., aiohttp.ClientSession],
+        json_codec: JsonCodec,
+    ) -> Generator[ClientAdapter, None, None]:
+        with ClientAdapter(event_loop, AiohttpClient(create_client_session(), json_codec=json_codec)) as client:
+            yield client
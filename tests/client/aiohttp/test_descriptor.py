@@ -1,15 +1,19 @@
 #  Copyright 2024 The Meatie Authors. All rights reserved.
 #  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+import copy
 import datetime
 import json
+import weakref
 from dataclasses import dataclass
 from typing import Annotated, Any, Optional
-from unittest.mock import ANY, Mock
+from unittest.mock import ANY, Mock, patch
 
 import pytest
+from mock_tools.aiohttp import MockTools
 
-from meatie import AsyncResponse, Request, api_ref, endpoint
+from meatie import INF, AsyncResponse, Request, api_ref, cache, endpoint, private, validate
 from meatie.aio import AsyncContext, AsyncEndpointDescriptor
+from meatie.internal.adapter import get_adapter
 from meatie.internal.template import RequestTemplate
 from meatie.internal.types import AsyncClient
 from meatie_aiohttp import Client
@@ -320,6 +324,196 @@ async def test_get_with_send_optional_parameter(mock_tools) -> None:
     session.request.assert_awaited_once_with("GET", "/api/v1/products", params={"category": "household"})
 
 
+@pytest.mark.asyncio()
+async def test_bound_endpoint_is_memoized_per_instance(mock_tools: MockTools) -> None:
+    # GIVEN
+    session = mock_tools.session_with_json_response(json=PRODUCTS)
+
+    class Store(Client):
+        def __init__(self) -> None:
+            super().__init__(session)
+
+        @endpoint("/api/v1/products")
+        async def get_products(self) -> list[Any]: ...
+
+    # WHEN
+    async with Store() as first_api, Store() as second_api:
+        first_api.get_products  # noqa: B018 the first lookup memoizes the bound endpoint
+        first_endpoint = first_api.get_products
+        second_endpoint = second_api.get_products
+
+        # THEN
+        assert first_endpoint is first_api.get_products
+        assert first_endpoint is not second_endpoint
+        assert PRODUCTS == await first_endpoint()
+
+
+@pytest.mark.asyncio()
+async def test_client_is_freed_once_no_longer_used(mock_tools: MockTools) -> None:
+    # GIVEN
+    session = mock_tools.session_with_json_response(json=PRODUCTS)
+
+    class Store(Client):
+        @endpoint("/api/v1/products")
+        async def get_products(self) -> list[Any]: ...
+
+    api = Store(session)
+    await api.get_products()
+    await api.get_products()
+    api_ref = weakref.ref(api)
+
+    # WHEN
+    del api
+
+    # THEN
+    assert api_ref() is None
+
+
+@pytest.mark.asyncio()
+async def test_endpoint_can_be_called_on_temporary_client(mock_tools: MockTools) -> None:
+    # GIVEN
+    session = mock_tools.session_with_json_response(json=PRODUCTS)
+
+    class Store(Client):
+        @endpoint("/api/v1/products")
+        async def get_products(self) -> list[Any]: ...
+
+    # WHEN
+    result = await Store(session).get_products()
+
+    # THEN
+    assert PRODUCTS == result
+
+
+@pytest.mark.asyncio()
+async def test_copied_client_calls_endpoint_with_own_session(mock_tools: MockTools) -> None:
+    # GIVEN
+    session = mock_tools.session_with_json_response(json=PRODUCTS)
+    other_session = mock_tools.session_with_json_response(json=PRODUCTS)
+
+    class Store(Client):
+        @endpoint("/api/v1/products")
+        async def get_products(self) -> list[Any]: ...
+
+    api = Store(session)
+    await api.get_products()
+    await api.get_products()
+
+    # WHEN
+    copied_api = copy.copy(api)
+    copied_api.session = other_session
+    await copied_api.get_products()
+
+    # THEN
+    assert 2 == session.request.await_count
+    other_session.request.assert_awaited_once()
+
+
+@pytest.mark.asyncio()
+async def test_operator_registered_after_endpoint_was_used_is_applied(mock_tools: MockTools) -> None:
+    # GIVEN
+    session = mock_tools.session_with_json_response(json=PRODUCTS)
+    calls: list[str] = []
+
+    async def operator(ctx: AsyncContext[Any]) -> Any:
+        calls.append(ctx.request.path)
+        return await ctx.proceed()
+
+    class Store(Client):
+        @endpoint("/api/v1/products")
+        async def get_products(self) -> list[Any]: ...
+
+    api = Store(session)
+    await api.get_products()
+    await api.get_products()
+
+    # WHEN
+    descriptor: AsyncEndpointDescriptor[Any, list[Any]] = vars(Store)["get_products"]
+    descriptor.register_operator(10, operator)
+    result = await api.get_products()
+
+    # THEN
+    assert PRODUCTS == result
+    assert ["/api/v1/products"] == calls
+
+
+@pytest.mark.asyncio()
+async def test_custom_operator_runs_between_built_in_operators(mock_tools: MockTools) -> None:
+    # GIVEN
+    session = mock_tools.session_with_json_response(json=PRODUCTS)
+    calls: list[str] = []
+
+    async def trace(ctx: AsyncContext[Any]) -> Any:
+        calls.append(ctx.request.headers.get("Authorization", "anonymous"))
+        result = await ctx.proceed()
+        calls.append("response")
+        return result
+
+    def custom(descriptor: AsyncEndpointDescriptor[Any, Any]) -> None:
+        descriptor.register_operator(50, trace)
+
+    class Store(Client):
+        def __init__(self) -> None:
+            super().__init__(session)
+
+        @endpoint("/api/v1/products", cache(ttl=INF), private, custom)
+        async def get_products(self) -> list[Any]: ...
+
+        async def authenticate(self, request: Request) -> None:
+            request.headers["Authorization"] = "Bearer token"
+
+    # WHEN
+    async with Store() as api:
+        first_result = await api.get_products()
+        second_result = await api.get_products()
+
+    # THEN
+    assert PRODUCTS == first_result
+    assert PRODUCTS == second_result
+    assert ["anonymous", "response"] == calls
+    session.request.assert_awaited_once_with("GET", "/api/v1/products", headers={"Authorization": "Bearer token"})
+
+
+@pytest.mark.asyncio()
+async def test_lazy_endpoint_is_loaded_on_first_use(mock_tools: MockTools) -> None:
+    # GIVEN
+    session = mock_tools.session_with_json_response(json=PRODUCTS)
+
+    with patch("meatie.endpoint.get_adapter", wraps=get_adapter) as get_adapter_mock:
+
+        class Store(Client):
+            def __init__(self) -> None:
+                super().__init__(session)
+
+            @endpoint("/api/v1/products", lazy=True)
+            async def list_products(self) -> list[Any]: ...
+
+        get_adapter_mock.assert_not_called()
+
+        # WHEN
+        async with Store() as api:
+            result = await api.list_products()
+
+    # THEN
+    assert PRODUCTS == result
+    get_adapter_mock.assert_called_once_with(list[Any])
+    session.request.assert_awaited_once_with("GET", "/api/v1/products")
+
+
+def test_validate_reports_errors_in_lazy_endpoints() -> None:
+    # GIVEN
+    class Store(Client):
+        @endpoint("/api/v1/orders/{order_id}", lazy=True)
+        async def get_order(self) -> None: ...
+
+    # WHEN
+    with pytest.raises(ValueError) as exc_info:
+        validate(Store)
+
+    # THEN
+    assert ("Parameter 'order_id' is not present in the method signature '(self) -> None'",) == exc_info.value.args
+
+
 def test_falls_back_to_get_if_method_name_cannot_be_inferred() -> None:
     # GIVEN
     template = Mock(spec=RequestTemplate, method=None)
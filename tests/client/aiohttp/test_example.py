@@ -3,6 +3,7 @@
 
 # mypy: disable-error-code="valid-type"
 
+import json
 from decimal import Decimal
 from http import HTTPStatus
 from typing import Annotated, Any, Callable
@@ -128,7 +129,12 @@ async def test_plain_example(dump_model: Callable[[Any], Any]) -> None:
 
         # THEN
         assert quote == quote_result
-        session.request.assert_awaited_once_with("POST", "/api/v1/quote/request", json=dump_model(basket))
+        session.request.assert_awaited_once_with(
+            "POST",
+            "/api/v1/quote/request",
+            data=json.dumps(dump_model(basket), separators=(",", ":")).encode(),
+            headers={"Content-Type": "application/json"},
+        )
 
         # GIVEN
         session.request = AsyncMock(return_value=AsyncMock())
@@ -170,8 +176,8 @@ async def test_private_endpoint_example(dump_model: Callable[[Any], Any]) -> Non
         session.request.assert_awaited_once_with(
             "POST",
             "/api/v1/quote/request",
-            json=dump_model(basket),
-            headers={"api-key": "123"},
+            data=json.dumps(dump_model(basket), separators=(",", ":")).encode(),
+            headers={"Content-Type": "application/json", "api-key": "123"},
         )
 
 
@@ -0,0 +1,201 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+import asyncio
+import gc
+import time
+from typing import Any
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from aiohttp import ClientResponse
+
+from meatie import INF, MeatieError, cache, endpoint
+from meatie_aiohttp import Client
+
+
+class Tracker:
+    def __init__(self, delay_by_id: dict[int, float]) -> None:
+        self.delay_by_id = delay_by_id
+        self.running = 0
+        self.max_running = 0
+        self.started: list[int] = []
+        self.cancelled: list[int] = []
+
+    async def request(self, method: str, path: str, **kwargs: Any) -> Any:
+        user_id = int(path.rsplit("/", 1)[-1])
+        self.started.append(user_id)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay_by_id.get(user_id, 0.0))
+        except asyncio.CancelledError:
+            self.cancelled.append(user_id)
+            raise
+        finally:
+            self.running -= 1
+
+        if user_id < 0:
+            raise RuntimeError(f"user {user_id}")
+        return Mock(spec=ClientResponse, status=200, json=AsyncMock(return_value={"id": user_id}))
+
+
+def create_store(tracker: Tracker, *options: Any) -> Any:
+    session = Mock(request=AsyncMock(side_effect=tracker.request))
+
+    class Store(Client):
+        def __init__(self) -> None:
+            super().__init__(session)
+
+        @endpoint("/api/v1/users/{user_id}", *options)
+        async def get_user(self, user_id: int) -> dict[str, Any]: ...
+
+    return Store()
+
+
+@pytest.mark.asyncio()
+async def test_map_preserves_order_and_limits_concurrency() -> None:
+    # GIVEN
+    tracker = Tracker({1: 0.03, 2: 0.01, 3: 0.02})
+    api = create_store(tracker)
+
+    # WHEN
+    results = [result async for result in api.get_user.map(range(10), concurrency=3)]
+
+    # THEN
+    assert [{"id": user_id} for user_id in range(10)] == results
+    assert 3 == tracker.max_running
+
+
+@pytest.mark.asyncio()
+async def test_map_yields_results_as_completed() -> None:
+    # GIVEN
+    tracker = Tracker({1: 0.05})
+    api = create_store(tracker)
+
+    # WHEN
+    results = [result["id"] async for result in api.get_user.map([1, 2, 3], concurrency=3, ordered=False)]
+
+    # THEN
+    assert 1 == results[-1]
+    assert {1, 2, 3} == set(results)
+
+
+@pytest.mark.asyncio()
+async def test_map_cancels_pending_calls_on_first_error() -> None:
+    # GIVEN
+    tracker = Tracker({1: 1.0})
+    api = create_store(tracker)
+
+    # WHEN
+    with pytest.raises(MeatieError) as exc_info:
+        async for _ in api.get_user.map([1, -2, 3], concurrency=2):
+            pass
+
+    # THEN
+    assert isinstance(exc_info.value.__cause__, RuntimeError)
+    assert ("user -2",) == exc_info.value.__cause__.args
+    assert [1] == tracker.cancelled
+    assert 3 not in tracker.started
+
+
+@pytest.mark.asyncio()
+async def test_map_returns_exceptions() -> None:
+    # GIVEN
+    tracker = Tracker({})
+    api = create_store(tracker)
+
+    # WHEN
+    results = [result async for result in api.get_user.map([1, -2, 3], return_exceptions=True)]
+
+    # THEN
+    assert {"id": 1} == results[0]
+    assert isinstance(results[1], Exception)
+    assert {"id": 3} == results[2]
+
+
+class InterruptedTracker(Tracker):
+    async def request(self, method: str, path: str, **kwargs: Any) -> Any:
+        try:
+            return await super().request(method, path, **kwargs)
+        except asyncio.CancelledError:
+            raise RuntimeError("the connection was closed") from None
+
+
+@pytest.mark.asyncio()
+async def test_map_retrieves_exceptions_of_calls_failed_on_cancellation() -> None:
+    # GIVEN the call in progress fails instead of being cancelled
+    tracker = InterruptedTracker({1: 1.0})
+    api = create_store(tracker)
+    errors: list[dict[str, Any]] = []
+    asyncio.get_running_loop().set_exception_handler(lambda loop, context: errors.append(context))
+
+    # WHEN
+    with pytest.raises(MeatieError):
+        async for _ in api.get_user.map([1, -2], concurrency=2):
+            pass
+    gc.collect()
+
+    # THEN
+    assert [1] == tracker.cancelled
+    assert [] == errors
+
+
+@pytest.mark.asyncio()
+async def test_map_applies_backpressure() -> None:
+    # GIVEN
+    tracker = Tracker({})
+    api = create_store(tracker)
+
+    # WHEN
+    results = api.get_user.map(range(100), concurrency=2)
+    first_result = await results.__anext__()
+    await results.aclose()
+
+    # THEN
+    assert {"id": 0} == first_result
+    assert len(tracker.started) <= 3
+
+
+@pytest.mark.asyncio()
+async def test_map_uses_operators() -> None:
+    # GIVEN
+    tracker = Tracker({})
+    api = create_store(tracker, cache(ttl=INF))
+
+    # WHEN
+    results = [result async for result in api.get_user.map([1, 2, 1, 2], concurrency=1)]
+
+    # THEN
+    assert [{"id": 1}, {"id": 2}, {"id": 1}, {"id": 2}] == results
+    assert [1, 2] == tracker.started
+
+
+@pytest.mark.asyncio()
+async def test_map_rejects_invalid_concurrency() -> None:
+    # GIVEN
+    api = create_store(Tracker({}))
+
+    # WHEN
+    with pytest.raises(ValueError) as exc_info:
+        await api.get_user.map([1], concurrency=0).__anext__()
+
+    # THEN
+    assert ("'concurrency' must be greater than 0",) == exc_info.value.args
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize("return_exceptions", [False, True])
+async def test_map_waits_for_next_call_in_order_without_busy_waiting(return_exceptions: bool) -> None:
+    # GIVEN the first call is slow and the following calls complete quickly
+    tracker = Tracker({0: 0.3})
+    api = create_store(tracker)
+    started = time.process_time()
+
+    # WHEN
+    results = [
+        result async for result in api.get_user.map(range(4), concurrency=4, return_exceptions=return_exceptions)
+    ]
+
+    # THEN
+    assert [{"id": user_id} for user_id in range(4)] == results
+    assert time.process_time() - started < 0.1
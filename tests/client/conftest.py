@@ -13,6 +13,8 @@ from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 from cryptography.x509.oid import NameOID
 from http_test import HTTPSTestServer, HTTPTestServer
 
+from meatie import JsonCodec, MsgspecJsonCodec, OrjsonCodec, StdJsonCodec
+
 
 @pytest.fixture(name="event_loop")
 def event_loop_fixture() -> Generator[asyncio.AbstractEventLoop, None, None]:
@@ -99,3 +101,14 @@ def untrusted_https_server_fixture(
 ) -> Generator[HTTPSTestServer, None, None]:
     with HTTPSTestServer(untrusted_context) as server:
         yield server
+
+
+@pytest.fixture(name="json_codec", params=["std", "orjson", "msgspec"])
+def json_codec_fixture(request: pytest.FixtureRequest) -> JsonCodec:
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+        return OrjsonCodec()
+    if request.param == "msgspec":
+        pytest.importorskip("msgspec")
+        return MsgspecJsonCodec()
+    return StdJsonCodec()
@@ -0,0 +1,107 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler
+from typing import AsyncIterator, Iterator
+
+import httpx
+import pytest
+from http_test import HTTPTestServer
+from http_test.handlers import service_unavailable
+
+from meatie import Request, endpoint
+from meatie_httpx import AsyncClient, Client
+
+SAMPLE_BYTES = bytes(range(256)) * 1024
+
+
+def stream_handler(request: BaseHTTPRequestHandler) -> None:
+    request.send_response(HTTPStatus.OK)
+    request.send_header("Content-Length", str(len(SAMPLE_BYTES)))
+    request.end_headers()
+    request.wfile.write(SAMPLE_BYTES)
+
+
+def test_can_stream_bytes(http_server: HTTPTestServer) -> None:
+    # GIVEN
+    http_server.handler = stream_handler
+
+    class TestClient(Client):
+        @endpoint("/")
+        def get_response(self) -> Iterator[bytes]: ...
+
+    # WHEN
+    with TestClient(httpx.Client(base_url=http_server.base_url)) as client:
+        chunks = list(client.get_response())
+
+    # THEN
+    assert SAMPLE_BYTES == b"".join(chunks)
+    assert len(chunks) > 1
+
+
+def test_closing_stream_releases_connection(http_server: HTTPTestServer) -> None:
+    # GIVEN
+    http_server.handler = stream_handler
+    request = Request("GET", "/", params={}, headers={}, stream=True)
+
+    with Client(httpx.Client(base_url=http_server.base_url)) as client:
+        response = client.send(request)
+
+        # WHEN
+        stream = response.iter_bytes()
+        next(stream)
+        stream.close()
+
+    # THEN
+    assert response.response.is_closed
+
+
+def test_error_response_body_is_read(http_server: HTTPTestServer) -> None:
+    # GIVEN
+    http_server.handler = service_unavailable
+
+    request = Request("GET", "/", params={}, headers={}, stream=True)
+
+    # WHEN
+    with Client(httpx.Client(base_url=http_server.base_url)) as client:
+        response = client.send(request)
+
+    # THEN error handlers can read the body of streamed error responses
+    assert HTTPStatus.SERVICE_UNAVAILABLE == response.status
+    assert response.text()
+
+
+@pytest.mark.asyncio()
+async def test_can_stream_bytes_async(http_server: HTTPTestServer) -> None:
+    # GIVEN
+    http_server.handler = stream_handler
+
+    class TestClient(AsyncClient):
+        @endpoint("/")
+        async def get_response(self) -> AsyncIterator[bytes]: ...
+
+    # WHEN
+    async with TestClient(httpx.AsyncClient(base_url=http_server.base_url)) as client:
+        chunks = [chunk async for chunk in await client.get_response()]
+
+    # THEN
+    assert SAMPLE_BYTES == b"".join(chunks)
+    assert len(chunks) > 1
+
+
+@pytest.mark.asyncio()
+async def test_closing_stream_releases_connection_async(http_server: HTTPTestServer) -> None:
+    # GIVEN
+    http_server.handler = stream_handler
+    request = Request("GET", "/", params={}, headers={}, stream=True)
+
+    async with AsyncClient(httpx.AsyncClient(base_url=http_server.base_url)) as client:
+        response = await client.send(request)
+
+        # WHEN
+        stream = response.iter_bytes()
+        await stream.__anext__()
+        await stream.aclose()
+
+    # THEN
+    assert response.response.is_closed
@@ -8,6 +8,7 @@ import pytest
 from http_test import ClientAdapter
 from suite.client import DefaultSuite
 
+from meatie import JsonCodec
 from meatie_httpx import AsyncClient
 
 
@@ -19,3 +20,14 @@ class TestAsyncHttpxDefaultSuite(DefaultSuite):
     ) -> Generator[ClientAdapter, None, None]:
         with ClientAdapter(event_loop, AsyncClient(httpx.AsyncClient())) as client:
             yield client
+
+
+class TestAsyncHttpxJsonCodecSuite(DefaultSuite):
+    @pytest.fixture(name="client")
+    def client_fixture(
+        self,
+        event_loop: asyncio.AbstractEventLoop,
+        json_codec: JsonCodec,
+    ) -> Generator[ClientAdapter, None, None]:
+        with ClientAdapter(event_loop, AsyncClient(httpx.AsyncClient(), json_codec=json_codec)) as client:
+            yield client
@@ -6,6 +6,7 @@ import httpx
 import pytest
 from suite.client import DefaultSuite
 
+from meatie import JsonCodec
 from meatie_httpx import Client
 
 
@@ -14,3 +15,10 @@ class TestHttpxDefaultSuite(DefaultSuite):
     def client_fixture(self) -> Generator[Client, None, None]:
         with Client(httpx.Client()) as client:
             yield client
+
+
+class TestHttpxJsonCodecSuite(DefaultSuite):
+    @pytest.fixture(name="client")
+    def client_fixture(self, json_codec: JsonCodec) -> Generator[Client, None, None]:
+        with Client(httpx.Client(), json_codec=json_codec) as client:
+            yield client
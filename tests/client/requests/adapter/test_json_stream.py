@@ -0,0 +1,62 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+import json
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler
+from typing import Any, Iterator
+
+import requests
+from http_test import HTTPTestServer
+
+from meatie import endpoint
+from meatie_requests import Client
+
+RECORDS = [{"id": index, "name": f"record {index}"} for index in range(10_000)]
+
+
+def test_can_stream_json_lines(http_server: HTTPTestServer) -> None:
+    # GIVEN
+    def handler(request: BaseHTTPRequestHandler) -> None:
+        content = b"".join(json.dumps(record).encode() + b"\n" for record in RECORDS)
+        request.send_response(HTTPStatus.OK)
+        request.send_header("Content-Type", "application/x-ndjson")
+        request.send_header("Content-Length", str(len(content)))
+        request.end_headers()
+        request.wfile.write(content)
+
+    http_server.handler = handler
+
+    class TestClient(Client):
+        @endpoint(http_server.base_url + "/")
+        def get_records(self) -> Iterator[dict[str, Any]]: ...
+
+    # WHEN
+    with TestClient(requests.Session()) as client:
+        records = list(client.get_records())
+
+    # THEN
+    assert RECORDS == records
+
+
+def test_can_stream_json_array(http_server: HTTPTestServer) -> None:
+    # GIVEN
+    def handler(request: BaseHTTPRequestHandler) -> None:
+        content = json.dumps(RECORDS).encode()
+        request.send_response(HTTPStatus.OK)
+        request.send_header("Content-Type", "application/json")
+        request.send_header("Content-Length", str(len(content)))
+        request.end_headers()
+        request.wfile.write(content)
+
+    http_server.handler = handler
+
+    class TestClient(Client):
+        @endpoint(http_server.base_url + "/")
+        def get_records(self) -> Iterator[dict[str, Any]]: ...
+
+    # WHEN
+    with TestClient(requests.Session()) as client:
+        records = list(client.get_records())
+
+    # THEN
+    assert RECORDS == records
@@ -0,0 +1,55 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+from typing import Annotated
+
+import pytest
+from http_test import HTTPTestServer
+from http_test.handlers import echo_json_handler, status_ok_as_text
+from requests import Session
+
+from meatie import ParseResponseError, api_ref, endpoint
+from meatie_requests import Client
+
+pytest.importorskip("msgspec")
+import msgspec  # noqa: E402
+
+
+class Todo(msgspec.Struct, rename="camel"):
+    user_id: int
+    id: int
+    title: str
+    completed: bool
+
+
+class TodoClient(Client):
+    @endpoint("/todos")
+    def post_todos(self, todos: Annotated[list[Todo], api_ref("body")]) -> list[Todo]: ...
+
+    @endpoint("/todos")
+    def get_todo(self) -> Todo: ...
+
+
+def test_post_request_body(http_server: HTTPTestServer) -> None:
+    # GIVEN
+    http_server.handler = echo_json_handler
+    todos = [Todo(user_id=123, id=index, title="abc", completed=True) for index in range(3)]
+
+    # WHEN
+    with TodoClient(Session(), prefix=http_server.base_url) as client:
+        result = client.post_todos(todos)
+
+    # THEN
+    assert todos == result
+
+
+def test_invalid_json_raises_parse_error(http_server: HTTPTestServer) -> None:
+    # GIVEN
+    http_server.handler = status_ok_as_text
+
+    # WHEN
+    with TodoClient(Session(), prefix=http_server.base_url) as client:
+        with pytest.raises(ParseResponseError) as exc_info:
+            client.get_todo()
+
+    # THEN
+    assert "{'status': 'ok'}" == exc_info.value.text
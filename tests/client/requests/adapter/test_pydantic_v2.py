@@ -1,16 +1,17 @@
 #  Copyright 2024 The Meatie Authors. All rights reserved.
 #  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
-from typing import Annotated
+from typing import Annotated, Any
 
 import pytest
 from http_test import HTTPTestServer
-from http_test.handlers import echo_json_handler
-from requests import Session
+from http_test.handlers import echo_json_handler, status_ok_as_text
+from requests import Response, Session
 
-from meatie import api_ref, endpoint
+from meatie import Lazy, ParseResponseError, api_ref, body, endpoint, projection, trusted
 from meatie_requests import Client
 
-pydantic = pytest.importorskip("pydantic", minversion="2.0.0")
+pytest.importorskip("pydantic", minversion="2.0.0")
+import pydantic  # noqa: E402
 
 
 class Todo(pydantic.BaseModel):
@@ -46,3 +47,108 @@ def test_post_request_body_with_fmt_as_dict(http_server: HTTPTestServer) -> None
 
     # THEN
     assert todo.user_id == 123
+
+
+def test_post_request_body_as_bytes(http_server: HTTPTestServer) -> None:
+    # GIVEN
+    http_server.handler = echo_json_handler
+
+    class TestClient(Client):
+        @endpoint("/todos")
+        def post_todos(self, todos: Annotated[list[Todo], api_ref("body")]) -> list[Todo]: ...
+
+    todos = [Todo(userId=123, id=index, title="abc", completed=True) for index in range(3)]
+
+    # WHEN
+    with TestClient(Session(), prefix=http_server.base_url) as client:
+        result = client.post_todos(todos)
+
+    # THEN
+    assert todos == result
+
+
+def test_custom_json_decoder_is_used(http_server: HTTPTestServer) -> None:
+    # GIVEN
+    http_server.handler = echo_json_handler
+
+    def get_json(response: Response) -> dict[str, Any]:
+        return {**response.json(), "title": "custom"}
+
+    class TestClient(Client):
+        @endpoint("/todos", body(json=get_json))
+        def post_todo(self, todo: Annotated[Todo, api_ref("body")]) -> Todo: ...
+
+    # WHEN
+    with TestClient(Session(), prefix=http_server.base_url) as client:
+        todo = client.post_todo(Todo(userId=123, id=456, title="abc", completed=True))
+
+    # THEN
+    assert "custom" == todo.title
+
+
+def test_invalid_json_raises_parse_error(http_server: HTTPTestServer) -> None:
+    # GIVEN
+    http_server.handler = status_ok_as_text
+
+    class TestClient(Client):
+        @endpoint("/todos")
+        def get_todo(self) -> Todo: ...
+
+    # WHEN
+    with TestClient(Session(), prefix=http_server.base_url) as client:
+        with pytest.raises(ParseResponseError) as exc_info:
+            client.get_todo()
+
+    # THEN
+    assert "{'status': 'ok'}" == exc_info.value.text
+
+
+def test_trusted_endpoint_validates_pydantic_v2_models(http_server: HTTPTestServer) -> None:
+    # GIVEN
+    http_server.handler = echo_json_handler
+
+    class TestClient(Client):
+        @endpoint("/todos", trusted())
+        def post_todos(self, todos: Annotated[list[dict[str, Any]], api_ref("body")]) -> list[Todo]: ...
+
+    # WHEN
+    with TestClient(Session(), prefix=http_server.base_url) as client:
+        with pytest.raises(ParseResponseError):
+            client.post_todos([{"userId": "unknown", "id": 1, "title": "abc", "completed": True}])
+
+
+def test_lazy_endpoint_validates_accessed_fields(http_server: HTTPTestServer) -> None:
+    # GIVEN
+    http_server.handler = echo_json_handler
+    todo = Todo(userId=123, id=1, title="abc", completed=True)
+
+    class TestClient(Client):
+        @endpoint("/todos")
+        def post_todo(self, todo: Annotated[Todo, api_ref("body")]) -> Lazy[Todo]: ...
+
+    # WHEN
+    with TestClient(Session(), prefix=http_server.base_url) as client:
+        result = client.post_todo(todo)
+
+    # THEN
+    assert 123 == result.user_id
+    assert todo == result.materialize()
+
+
+def test_projected_endpoint_decodes_fields_of_model(http_server: HTTPTestServer) -> None:
+    # GIVEN
+    http_server.handler = echo_json_handler
+
+    class TodoTitle(pydantic.BaseModel):
+        title: str
+
+    class TestClient(Client):
+        @endpoint("/todos")
+        def post_todo(self, todo: Annotated[dict[str, Any], api_ref("body")]) -> Annotated[TodoTitle, projection()]: ...
+
+    # WHEN
+    with TestClient(Session(), prefix=http_server.base_url) as client:
+        result = client.post_todo({"userId": 123, "id": 1, "title": "abc", "completed": True})
+
+    # THEN
+    assert TodoTitle(title="abc") == result
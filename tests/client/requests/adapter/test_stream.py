@@ -0,0 +1,61 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler
+from typing import Generator, Iterator, cast
+from unittest.mock import ANY, Mock
+
+import requests
+from http_test import HTTPTestServer
+
+from meatie import endpoint
+from meatie_requests import Client
+
+SAMPLE_BYTES = bytes(range(256)) * 1024
+
+
+def test_can_stream_bytes(http_server: HTTPTestServer) -> None:
+    # GIVEN
+    def handler(request: BaseHTTPRequestHandler) -> None:
+        request.send_response(HTTPStatus.OK)
+        request.send_header("Content-Length", str(len(SAMPLE_BYTES)))
+        request.end_headers()
+        request.wfile.write(SAMPLE_BYTES)
+
+    http_server.handler = handler
+
+    class TestClient(Client):
+        @endpoint(http_server.base_url + "/")
+        def get_response(self) -> Iterator[bytes]: ...
+
+    # WHEN
+    with TestClient(requests.Session()) as client:
+        chunks = list(client.get_response())
+
+    # THEN
+    assert SAMPLE_BYTES == b"".join(chunks)
+    assert len(chunks) > 1
+
+
+def test_closing_stream_releases_connection() -> None:
+    # GIVEN
+    response = Mock(spec=requests.Response, status_code=200, iter_content=Mock(return_value=iter([b"a", b"b"])))
+    session = Mock(spec=requests.Session, request=Mock(return_value=response))
+
+    class TestClient(Client):
+        @endpoint("/")
+        def get_response(self) -> Iterator[bytes]: ...
+
+    client = TestClient(session)
+
+    # WHEN
+    # the iterator returned for the endpoint is a generator
+    stream = cast(Generator[bytes, None, None], client.get_response())
+    first_chunk = next(stream)
+    stream.close()
+
+    # THEN
+    assert b"a" == first_chunk
+    session.request.assert_called_once_with("GET", "/", stream=True)
+    response.iter_content.assert_called_once_with(chunk_size=ANY)
+    response.close.assert_called_once()
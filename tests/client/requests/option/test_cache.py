@@ -1,11 +1,17 @@
 #  Copyright 2024 The Meatie Authors. All rights reserved.
 #  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
 
-from typing import Any, cast
+import time
+from http import HTTPStatus
+from typing import Any, Callable, cast
 
+import pytest
+import requests.exceptions
+from mock_tools.requests import MockTools
 from requests import Session
+from typing_extensions import override
 
-from meatie import INF, cache, endpoint
+from meatie import INF, Cache, CacheStats, ServerError, cache, endpoint
 from meatie_requests import Client
 
 PRODUCTS = [{"name": "pencil"}, {"name": "headphones"}]
@@ -67,3 +73,193 @@ def test_global_cache_is_shared(mock_tools) -> None:
     # THEN
     assert PRODUCTS == second_result
     session.request.assert_not_called()
+
+
+class TimedCache(Cache):
+    def __init__(self) -> None:
+        super().__init__()
+        self.current_time = 0.0
+
+    @override
+    def _now(self) -> float:
+        return self.current_time
+
+
+def wait_for(condition: Callable[[], bool]) -> None:
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline, "the condition was not met in time"
+        time.sleep(0.001)
+
+
+def test_stale_while_revalidate_returns_stale_value_and_refreshes_it(mock_tools: MockTools) -> None:
+    # GIVEN
+    storage = TimedCache()
+    session = mock_tools.session_with_json_response(json=PRODUCTS)
+
+    class Store(Client):
+        @endpoint("/api/v1/products", cache(ttl=10, stale_while_revalidate=10))
+        def get_products(self) -> list[Any]: ...
+
+    with Store(session, local_cache=storage) as api:
+        api.get_products()
+        new_products = [{"name": "pen"}]
+        session.request.return_value = mock_tools.json_response(json=new_products)
+        storage.current_time = 15
+
+        # WHEN
+        stale_result = api.get_products()
+        wait_for(lambda: storage.load("/api/v1/products") == new_products)
+        fresh_result = api.get_products()
+
+    # THEN
+    assert PRODUCTS == stale_result
+    assert new_products == fresh_result
+    assert 2 == session.request.call_count
+
+
+def test_stale_if_error_returns_stale_value_on_error(mock_tools: MockTools) -> None:
+    # GIVEN
+    storage = TimedCache()
+    session = mock_tools.session_with_json_response(json=PRODUCTS)
+
+    class Store(Client):
+        @endpoint("/api/v1/products", cache(ttl=10, stale_if_error=10))
+        def get_products(self) -> list[Any]: ...
+
+    with Store(session, local_cache=storage) as api:
+        api.get_products()
+        session.request.side_effect = requests.exceptions.ConnectionError("connection refused")
+
+        # WHEN
+        storage.current_time = 15
+        stale_result = api.get_products()
+
+        # THEN
+        assert PRODUCTS == stale_result
+        assert 2 == session.request.call_count
+
+        # WHEN
+        storage.current_time = 21
+        with pytest.raises(ServerError):
+            api.get_products()
+
+
+def test_http_cache_revalidates_expired_response(mock_tools: MockTools) -> None:
+    # GIVEN
+    storage = TimedCache()
+    response = mock_tools.json_response(json=PRODUCTS, headers={"Cache-Control": "max-age=10", "ETag": '"v1"'})
+    session = mock_tools.session_wrap_response(response)
+
+    class Store(Client):
+        @endpoint("/api/v1/products", cache(ttl=INF, http=True))
+        def get_products(self) -> list[Any]: ...
+
+    with Store(session, local_cache=storage) as api:
+        api.get_products()
+        not_modified = mock_tools.json_response(
+            json=None, status=HTTPStatus.NOT_MODIFIED, headers={"Cache-Control": "max-age=10"}
+        )
+        session.request.return_value = not_modified
+        storage.current_time = 15
+
+        # WHEN
+        revalidated_result = api.get_products()
+        storage.current_time = 20
+        cached_result = api.get_products()
+
+    # THEN
+    assert PRODUCTS == revalidated_result
+    assert PRODUCTS == cached_result
+    assert 2 == session.request.call_count
+    assert {"If-None-Match": '"v1"'} == session.request.call_args.kwargs["headers"]
+    not_modified.json.assert_not_called()
+
+
+def test_http_cache_replaces_modified_response(mock_tools: MockTools) -> None:
+    # GIVEN
+    storage = TimedCache()
+    response = mock_tools.json_response(json=PRODUCTS, headers={"Last-Modified": "Mon, 01 Sep 2025 10:00:00 GMT"})
+    session = mock_tools.session_wrap_response(response)
+
+    class Store(Client):
+        @endpoint("/api/v1/products", cache(ttl=10, http=True))
+        def get_products(self) -> list[Any]: ...
+
+    with Store(session, local_cache=storage) as api:
+        api.get_products()
+        new_products = [{"name": "pen"}]
+        session.request.return_value = mock_tools.json_response(json=new_products)
+        storage.current_time = 15
+
+        # WHEN
+        result = api.get_products()
+
+    # THEN
+    assert new_products == result
+    assert {"If-Modified-Since": "Mon, 01 Sep 2025 10:00:00 GMT"} == session.request.call_args.kwargs["headers"]
+
+
+def test_http_cache_does_not_store_response_with_no_store_directive(mock_tools: MockTools) -> None:
+    # GIVEN
+    response = mock_tools.json_response(json=PRODUCTS, headers={"Cache-Control": "no-store"})
+    session = mock_tools.session_wrap_response(response)
+
+    class Store(Client):
+        @endpoint("/api/v1/products", cache(ttl=INF, http=True))
+        def get_products(self) -> list[Any]: ...
+
+    # WHEN
+    with Store(session) as api:
+        api.get_products()
+        api.get_products()
+
+    # THEN
+    assert 2 == session.request.call_count
+
+
+def test_cache_charges_content_length_against_byte_budget(mock_tools: MockTools) -> None:
+    # GIVEN
+    storage = Cache(max_size=None, max_bytes=1000)
+    response = mock_tools.json_response(json=PRODUCTS, headers={"Content-Length": "600"})
+    session = mock_tools.session_wrap_response(response)
+
+    class Store(Client):
+        @endpoint("/api/v1/products", cache(ttl=INF))
+        def get_products(self, category: str) -> list[Any]: ...
+
+    # WHEN
+    with Store(session, local_cache=storage) as api:
+        api.get_products("pens")
+        api.get_products("pencils")
+
+    # THEN
+    assert CacheStats(entries=1, bytes=600, evictions=1) == storage.stats()
+
+
+def test_http_cache_keeps_size_of_revalidated_response(mock_tools: MockTools) -> None:
+    # GIVEN
+    storage = TimedCache()
+    storage.max_bytes = 1000
+    response = mock_tools.json_response(
+        json=PRODUCTS, headers={"Cache-Control": "max-age=10", "ETag": '"v1"', "Content-Length": "600"}
+    )
+    session = mock_tools.session_wrap_response(response)
+
+    class Store(Client):
+        @endpoint("/api/v1/products", cache(ttl=INF, http=True))
+        def get_products(self) -> list[Any]: ...
+
+    with Store(session, local_cache=storage) as api:
+        api.get_products()
+        session.request.return_value = mock_tools.json_response(
+            json=None, status=HTTPStatus.NOT_MODIFIED, headers={"Cache-Control": "max-age=10", "Content-Length": "0"}
+        )
+        storage.current_time = 15
+
+        # WHEN
+        api.get_products()
+
+    # THEN
+    assert 2 == session.request.call_count
+    assert CacheStats(entries=1, bytes=600, evictions=0) == storage.stats()
@@ -0,0 +1,145 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+from unittest.mock import Mock
+
+from mock_tools.requests import MockTools
+
+from meatie import INF, Cache, cache, coalesce, endpoint
+from meatie_requests import Client
+
+PRODUCTS = [{"name": "pencil"}, {"name": "headphones"}]
+
+
+def slow_session(
+    mock_tools: MockTools,
+    json: Any,
+    started: threading.Event,
+    release: threading.Event,
+    headers: Optional[dict[str, str]] = None,
+) -> Any:
+    response = mock_tools.json_response(json=json, headers=headers)
+    session = mock_tools.session_wrap_response(response)
+
+    def request(*args: Any, **kwargs: Any) -> Any:
+        started.set()
+        release.wait()
+        return response
+
+    session.request = Mock(side_effect=request)
+    return session
+
+
+def test_concurrent_calls_share_request(mock_tools: MockTools) -> None:
+    # GIVEN
+    started = threading.Event()
+    release = threading.Event()
+    session = slow_session(mock_tools, PRODUCTS, started, release)
+
+    class Store(Client):
+        def __init__(self) -> None:
+            super().__init__(session)
+
+        @endpoint("/api/v1/products", coalesce())
+        def get_products(self) -> list[Any]: ...
+
+    # WHEN
+    with Store() as api, ThreadPoolExecutor(max_workers=4) as executor:
+        leader = executor.submit(api.get_products)
+        started.wait()
+        followers = [executor.submit(api.get_products) for _ in range(3)]
+        time.sleep(0.1)  # let the followers reach the in-flight call
+        release.set()
+        results = [leader.result()] + [follower.result() for follower in followers]
+
+    # THEN
+    assert [PRODUCTS] * 4 == results
+    session.request.assert_called_once()
+
+
+def test_error_is_shared(mock_tools: MockTools) -> None:
+    # GIVEN
+    started = threading.Event()
+    release = threading.Event()
+    session = mock_tools.session_with_json_response(json=PRODUCTS)
+
+    def request(*args: Any, **kwargs: Any) -> Any:
+        started.set()
+        release.wait()
+        raise RuntimeError("upstream")
+
+    session.request = Mock(side_effect=request)
+
+    class Store(Client):
+        def __init__(self) -> None:
+            super().__init__(session)
+
+        @endpoint("/api/v1/products", coalesce())
+        def get_products(self) -> list[Any]: ...
+
+    # WHEN
+    with Store() as api, ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(api.get_products)
+        started.wait()
+        follower = executor.submit(api.get_products)
+        time.sleep(0.1)  # let the follower reach the in-flight call
+        release.set()
+
+        # THEN
+        assert isinstance(leader.exception(), Exception)
+        assert isinstance(follower.exception(), Exception)
+    session.request.assert_called_once()
+
+
+def test_cache_with_coalesce(mock_tools: MockTools) -> None:
+    # GIVEN
+    started = threading.Event()
+    release = threading.Event()
+    release.set()
+    session = slow_session(mock_tools, PRODUCTS, started, release)
+
+    class Store(Client):
+        def __init__(self) -> None:
+            super().__init__(session)
+
+        @endpoint("/api/v1/products", cache(ttl=INF, coalesce=True))
+        def get_products(self) -> list[Any]: ...
+
+    # WHEN
+    with Store() as api:
+        first_result = api.get_products()
+        second_result = api.get_products()
+
+    # THEN
+    assert PRODUCTS == first_result
+    assert PRODUCTS == second_result
+    session.request.assert_called_once()
+
+
+def test_http_cache_with_coalesce_follows_headers_of_shared_response(mock_tools: MockTools) -> None:
+    # GIVEN
+    started = threading.Event()
+    release = threading.Event()
+    session = slow_session(mock_tools, PRODUCTS, started, release, headers={"Cache-Control": "no-store"})
+    storage = Cache()
+
+    class Store(Client):
+        @endpoint("/api/v1/products", cache(ttl=60, http=True, coalesce=True))
+        def get_products(self) -> list[Any]: ...
+
+    # WHEN
+    with Store(session, local_cache=storage) as api, ThreadPoolExecutor(max_workers=3) as executor:
+        leader = executor.submit(api.get_products)
+        started.wait()
+        followers = [executor.submit(api.get_products) for _ in range(2)]
+        time.sleep(0.1)  # let the followers reach the in-flight call
+        release.set()
+        results = [leader.result()] + [follower.result() for follower in followers]
+
+    # THEN
+    assert [PRODUCTS] * 3 == results
+    assert storage.load("/api/v1/products") is None
+    session.request.assert_called_once()
@@ -1,9 +1,13 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
 from http import HTTPStatus
+from typing import Any
 
 from http_test import Handler, HTTPTestServer
+from http_test.handlers import echo_json_handler
 from requests import Session
 
-from meatie import endpoint
+from meatie import StdJsonCodec, body, endpoint
 from meatie_requests import Client
 
 
@@ -28,3 +32,40 @@ def test_use_prefix(http_server: HTTPTestServer) -> None:
 
     # THEN
     assert status == "ok"
+
+
+class RecordingCodec(StdJsonCodec):
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def loads(self, data: bytes) -> Any:
+        self.calls.append("loads")
+        return super().loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        self.calls.append("dumps")
+        return super().dumps(value)
+
+
+def test_use_json_codec(http_server: HTTPTestServer) -> None:
+    # GIVEN
+    http_server.handler = echo_json_handler
+
+    class EchoClient(Client):
+        @endpoint("/echo")
+        def post_echo(self, body: dict[str, Any]) -> dict[str, Any]: ...
+
+        @endpoint("/echo", body(json=lambda response: {"custom": True}))
+        def post_echo_custom(self, body: dict[str, Any]) -> dict[str, Any]: ...
+
+    codec = RecordingCodec()
+
+    # WHEN
+    with EchoClient(Session(), prefix=http_server.base_url, json_codec=codec) as client:
+        result = client.post_echo({"key": "value"})
+        custom_result = client.post_echo_custom({"key": "value"})
+
+    # THEN
+    assert {"key": "value"} == result
+    assert {"custom": True} == custom_result
+    assert ["dumps", "loads", "dumps"] == codec.calls
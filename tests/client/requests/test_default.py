@@ -6,6 +6,7 @@ import pytest
 import requests
 from suite.client import DefaultSuite
 
+from meatie import JsonCodec
 from meatie_requests.client import Client
 
 
@@ -14,3 +15,10 @@ class TestRequestsDefaultSuite(DefaultSuite):
     def client_fixture(self) -> Generator[Client, None, None]:
         with Client(requests.Session()) as client:
             yield client
+
+
+class TestRequestsJsonCodecSuite(DefaultSuite):
+    @pytest.fixture(name="client")
+    def client_fixture(self, json_codec: JsonCodec) -> Generator[Client, None, None]:
+        with Client(requests.Session(), json_codec=json_codec) as client:
+            yield client
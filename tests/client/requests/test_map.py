@@ -0,0 +1,244 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+import threading
+import time
+from typing import Any, Optional, Union
+from unittest.mock import Mock
+
+import pytest
+from requests import Session
+
+from meatie import INF, cache, endpoint, limit
+from meatie_requests import Client
+
+
+class Tracker:
+    def __init__(self, delay_by_id: dict[int, float]) -> None:
+        self.delay_by_id = delay_by_id
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+        self.started: list[int] = []
+
+    def request(self, method: str, path: str, **kwargs: Any) -> Any:
+        user_id = int(path.rsplit("/", 1)[-1])
+        with self.lock:
+            self.started.append(user_id)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            time.sleep(self.delay_by_id.get(user_id, 0.0))
+        finally:
+            with self.lock:
+                self.running -= 1
+
+        if user_id < 0:
+            raise RuntimeError(f"user {user_id}")
+        return Mock(status_code=200, json=Mock(return_value={"id": user_id}))
+
+
+def create_store(
+    tracker: Tracker, *options: Any, session_factory: Optional[Any] = None, share_session: bool = True
+) -> Any:
+    session = Mock(spec=Session, request=Mock(side_effect=tracker.request))
+
+    class Store(Client):
+        def __init__(self) -> None:
+            super().__init__(session, session_factory=session_factory, share_session=share_session)
+
+        @endpoint("/api/v1/users/{user_id}", *options)
+        def get_user(self, user_id: int) -> dict[str, Any]: ...
+
+    return Store()
+
+
+def test_map_preserves_order_and_limits_concurrency() -> None:
+    # GIVEN
+    tracker = Tracker({1: 0.03, 2: 0.01, 3: 0.02})
+    api = create_store(tracker)
+
+    # WHEN
+    results = list(api.get_user.map(range(10), concurrency=3))
+
+    # THEN
+    assert [{"id": user_id} for user_id in range(10)] == results
+    assert 1 < tracker.max_running <= 3
+
+
+def test_map_yields_results_as_completed() -> None:
+    # GIVEN
+    tracker = Tracker({1: 0.1})
+    api = create_store(tracker)
+
+    # WHEN
+    results = [result["id"] for result in api.get_user.map([1, 2, 3], concurrency=3, ordered=False)]
+
+    # THEN
+    assert 1 == results[-1]
+    assert {1, 2, 3} == set(results)
+
+
+def test_map_skips_pending_calls_on_first_error() -> None:
+    # GIVEN
+    tracker = Tracker({1: 0.1})
+    api = create_store(tracker)
+
+    # WHEN
+    with pytest.raises(RuntimeError) as exc_info:
+        for _ in api.get_user.map([1, -2, 3], concurrency=2):
+            pass
+
+    # THEN
+    assert ("user -2",) == exc_info.value.args
+    assert 3 not in tracker.started
+
+
+def test_map_returns_exceptions() -> None:
+    # GIVEN
+    tracker = Tracker({})
+    api = create_store(tracker)
+
+    # WHEN
+    results = list(api.get_user.map([1, -2, 3], return_exceptions=True))
+
+    # THEN
+    assert {"id": 1} == results[0]
+    assert isinstance(results[1], RuntimeError)
+    assert {"id": 3} == results[2]
+
+
+def test_map_applies_backpressure() -> None:
+    # GIVEN
+    tracker = Tracker({})
+    api = create_store(tracker)
+
+    # WHEN
+    results = api.get_user.map(range(100), concurrency=2)
+    first_result = next(results)
+    results.close()
+
+    # THEN
+    assert {"id": 0} == first_result
+    assert len(tracker.started) <= 3
+
+
+def test_map_uses_operators() -> None:
+    # GIVEN
+    tracker = Tracker({})
+    api = create_store(tracker, cache(ttl=INF), limit(tokens=1))
+
+    # WHEN
+    results = list(api.get_user.map([1, 2, 1, 2], concurrency=1))
+
+    # THEN
+    assert [{"id": 1}, {"id": 2}, {"id": 1}, {"id": 2}] == results
+    assert [1, 2] == tracker.started
+
+
+def test_map_uses_session_per_thread() -> None:
+    # GIVEN
+    tracker = Tracker({user_id: 0.01 for user_id in range(8)})
+    sessions: list[Mock] = []
+
+    def session_factory() -> Mock:
+        session = Mock(spec=Session, request=Mock(side_effect=tracker.request))
+        sessions.append(session)
+        return session
+
+    api = create_store(tracker, session_factory=session_factory, share_session=False)
+
+    # WHEN
+    results = list(api.get_user.map(range(8), concurrency=2))
+    api.get_user(8)
+
+    # THEN the sessions of the worker threads should be closed once the batch completes
+    assert [{"id": user_id} for user_id in range(8)] == results
+    assert 1 <= len(sessions) <= 2
+    assert 8 == sum(session.request.call_count for session in sessions)
+    assert 1 == api.session.request.call_count
+    for session in sessions:
+        session.close.assert_called_once()
+
+    # WHEN
+    api.close()
+
+    # THEN
+    for session in sessions:
+        session.close.assert_called_once()
+
+
+def test_map_copies_session_per_thread_by_default() -> None:
+    # GIVEN
+    tracker = Tracker({user_id: 0.05 for user_id in range(4)})
+    sessions: list[Session] = []
+
+    class RecordingSession(Session):
+        def request(self, method: Union[str, bytes], url: Union[str, bytes], *args: Any, **kwargs: Any) -> Any:
+            sessions.append(self)
+            return tracker.request(str(method), str(url), **kwargs)
+
+    class Store(Client):
+        @endpoint("/api/v1/users/{user_id}")
+        def get_user(self, user_id: int) -> dict[str, Any]: ...
+
+    session = RecordingSession()
+    session.headers["Authorization"] = "Bearer token"
+    api: Any = Store(session)
+
+    # WHEN
+    results = list(api.get_user.map(range(4), concurrency=2))
+
+    # THEN
+    assert [{"id": user_id} for user_id in range(4)] == results
+    assert 2 == len({id(thread_session) for thread_session in sessions})
+    assert all(thread_session is not session for thread_session in sessions)
+    assert all("Bearer token" == thread_session.headers["Authorization"] for thread_session in sessions)
+
+
+def test_map_does_not_keep_sessions_of_previous_batches() -> None:
+    # GIVEN
+    tracker = Tracker({user_id: 0.01 for user_id in range(4)})
+    sessions: list[Mock] = []
+
+    def session_factory() -> Mock:
+        session = Mock(spec=Session, request=Mock(side_effect=tracker.request))
+        sessions.append(session)
+        return session
+
+    api = create_store(tracker, session_factory=session_factory, share_session=False)
+
+    # WHEN
+    for _ in range(3):
+        list(api.get_user.map(range(4), concurrency=2))
+
+    # THEN
+    assert 3 <= len(sessions)
+    for session in sessions:
+        session.close.assert_called_once()
+
+
+def test_map_rejects_invalid_concurrency() -> None:
+    # GIVEN
+    api = create_store(Tracker({}))
+
+    # WHEN
+    with pytest.raises(ValueError) as exc_info:
+        next(api.get_user.map([1], concurrency=0))
+
+    # THEN
+    assert ("'concurrency' must be greater than 0",) == exc_info.value.args
+
+
+@pytest.mark.parametrize("return_exceptions", [False, True])
+def test_map_waits_for_next_call_in_order_without_busy_waiting(return_exceptions: bool) -> None:
+    # GIVEN the first call is slow and the following calls complete quickly
+    tracker = Tracker({0: 0.3})
+    api = create_store(tracker)
+    started = time.thread_time()
+
+    # WHEN
+    results = list(api.get_user.map(range(4), concurrency=4, return_exceptions=return_exceptions))
+
+    # THEN the calling thread should not use the CPU while waiting for the first call
+    assert [{"id": user_id} for user_id in range(4)] == results
+    assert time.thread_time() - started < 0.1
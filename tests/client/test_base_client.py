@@ -4,7 +4,7 @@ from typing import Any
 
 from typing_extensions import override
 
-from meatie import BaseClient, Request
+from meatie import BaseClient, Request, TinyLfuCache
 
 
 def test_can_influence_cache_size() -> None:
@@ -21,3 +21,43 @@ def test_can_influence_cache_size() -> None:
 
     # THEN
     assert client.shared_cache.max_size == 10
+
+
+def test_can_limit_cache_bytes() -> None:
+    # GIVEN
+    class CustomClient(BaseClient):
+        SHARED_CACHE_MAX_SIZE = None
+        SHARED_CACHE_MAX_BYTES = 1024
+
+        @override
+        def send(self, request: Request) -> Any:
+            pass
+
+    # WHEN
+    client = CustomClient()
+
+    # THEN
+    assert client.shared_cache.max_size is None
+    assert client.shared_cache.max_bytes == 1024
+
+
+def test_can_replace_shared_cache() -> None:
+    # GIVEN
+    class CustomClient(BaseClient):
+        shared_cache = TinyLfuCache(max_size=10)
+
+        @override
+        def send(self, request: Request) -> Any:
+            pass
+
+    class OtherClient(BaseClient):
+        @override
+        def send(self, request: Request) -> Any:
+            pass
+
+    # WHEN
+    client = CustomClient()
+
+    # THEN
+    assert isinstance(client.shared_cache, TinyLfuCache)
+    assert not isinstance(OtherClient.shared_cache, TinyLfuCache)
@@ -0,0 +1,149 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+
+from typing import Annotated, Any, Iterator, Optional, Union
+from unittest.mock import Mock
+
+import pytest
+
+from meatie import ParseResponseError, Response
+from meatie.internal.adapter import (
+    ChunkedJsonAdapter,
+    JsonEncoder,
+    JsonStreamAdapter,
+    TypeAdapter,
+    chunk_adapter,
+    get_adapter,
+)
+
+pytest.importorskip("msgspec")
+import msgspec  # noqa: E402
+
+from meatie.internal.adapter.msgspec_ import MsgspecTypeAdapter, MsgspecTypeAdapterFactory  # noqa: E402
+
+
+class Product(msgspec.Struct):
+    name: str
+    price: float = 0.0
+
+
+class Order(msgspec.Struct):
+    id: int
+    products: list[Product]
+
+
+class Pickup(msgspec.Struct, tag=True):
+    store: str
+
+
+class Delivery(msgspec.Struct, tag=True):
+    address: str
+
+
+@pytest.mark.parametrize(
+    "value_type",
+    [
+        Product,
+        Optional[Product],
+        Union[Pickup, Delivery],
+        Annotated[Product, "meta"],
+        list[Product],
+        dict[str, Order],
+    ],
+)
+def test_is_model_type(value_type: type) -> None:
+    # WHEN
+    adapter: TypeAdapter[Any] = get_adapter(value_type)
+
+    # THEN
+    assert MsgspecTypeAdapterFactory.is_model_type(value_type)
+    assert isinstance(adapter, MsgspecTypeAdapter)
+
+
+@pytest.mark.parametrize("value_type", [int, list[int], dict[Product, int], Union[Product, int]])
+def test_is_not_model_type(value_type: type) -> None:
+    # WHEN
+    result = MsgspecTypeAdapterFactory.is_model_type(value_type)
+
+    # THEN
+    assert not result
+
+
+def test_struct_from_bytes() -> None:
+    # GIVEN
+    response = Mock(spec=Response, read=Mock(return_value=b'{"id":1,"products":[{"name":"glasses","price":1.5}]}'))
+    adapter: TypeAdapter[Order] = get_adapter(Order)
+
+    # WHEN
+    result = adapter.from_response(response)
+
+    # THEN
+    assert Order(id=1, products=[Product(name="glasses", price=1.5)]) == result
+    response.json.assert_not_called()
+
+
+def test_struct_from_custom_json() -> None:
+    # GIVEN
+    response = Mock(spec=Response, json=Mock(return_value=[{"name": "glasses"}]))
+    response.get_json = Mock()
+    adapter: TypeAdapter[list[Product]] = get_adapter(list[Product])
+
+    # WHEN
+    result = adapter.from_response(response)
+
+    # THEN
+    assert [Product(name="glasses")] == result
+    response.read.assert_not_called()
+
+
+def test_invalid_struct_raises_parse_error() -> None:
+    # GIVEN
+    response = Mock(spec=Response, read=Mock(return_value=b'{"price":1.5}'), text=Mock(return_value='{"price":1.5}'))
+    adapter: TypeAdapter[Product] = get_adapter(Product)
+
+    # WHEN
+    with pytest.raises(ParseResponseError) as exc_info:
+        adapter.from_response(response)
+
+    # THEN
+    assert '{"price":1.5}' == exc_info.value.text
+    assert isinstance(exc_info.value.__cause__, msgspec.ValidationError)
+
+
+def test_struct_to_json() -> None:
+    # GIVEN
+    adapter = get_adapter(list[Product])
+
+    # WHEN
+    content = adapter.to_content([Product(name="glasses")])
+
+    # THEN
+    assert isinstance(adapter, JsonEncoder)
+    assert b'[{"name":"glasses","price":0.0}]' == adapter.to_json([Product(name="glasses")])
+    assert [{"name": "glasses", "price": 0.0}] == content
+
+
+def test_struct_stream() -> None:
+    # GIVEN
+    chunks = (chunk for chunk in [b'{"name":"glasses"}\n{"na', b'me":"pencil","price":2.0}\n'])
+    response = Mock(spec=Response, headers={}, iter_bytes=Mock(return_value=chunks))
+    adapter: TypeAdapter[Any] = get_adapter(Iterator[Product])
+
+    # WHEN
+    result = list(adapter.from_response(response))
+
+    # THEN
+    assert isinstance(adapter, JsonStreamAdapter)
+    assert [Product(name="glasses"), Product(name="pencil", price=2.0)] == result
+
+
+def test_chunk_adapter_keeps_adapter_of_constrained_list() -> None:
+    # GIVEN
+    adapter = get_adapter(Annotated[list[Product], msgspec.Meta(max_length=5)])
+
+    # WHEN
+    result = chunk_adapter(adapter, threshold=0, chunk_size=16)
+
+    # THEN
+    assert adapter is result
+    assert isinstance(chunk_adapter(get_adapter(list[Product]), threshold=0, chunk_size=16), ChunkedJsonAdapter)
@@ -1,12 +1,12 @@
 #  Copyright 2024 The Meatie Authors. All rights reserved.
 #  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
 
-from typing import Any, Callable
+from typing import Annotated, Any, Callable, Iterator, Union
 from unittest.mock import Mock
 
 import pytest
 
-from meatie import Response
+from meatie import ParseResponseError, Response
 from meatie.internal.adapter import TypeAdapter, get_adapter
 
 pydantic = pytest.importorskip("pydantic")
@@ -59,3 +59,119 @@ def test_pydantic_model_dict(dump_model: Callable[[Any], Any]) -> None:
 
     # THEN
     assert {"key": value} == result
+
+
+def test_pydantic_model_json_lines() -> None:
+    # GIVEN
+    class Product(BaseModel):
+        name: str
+
+    chunks = [b'{"name": "glasses"}\n{"na', b'me": "hat"}\n']
+    response = Mock(spec=Response, headers={}, iter_bytes=Mock(return_value=(chunk for chunk in chunks)))
+    adapter: TypeAdapter[Iterator[Product]] = get_adapter(Iterator[Product])
+
+    # WHEN
+    result = list(adapter.from_response(response))
+
+    # THEN
+    assert [Product(name="glasses"), Product(name="hat")] == result
+
+
+def test_pydantic_model_json_lines_validation_error() -> None:
+    # GIVEN
+    class Product(BaseModel):
+        name: str
+
+    chunks = [b'{"name": "glasses"}\n{"title": "hat"}\n']
+    response = Mock(spec=Response, headers={}, iter_bytes=Mock(return_value=(chunk for chunk in chunks)))
+    adapter: TypeAdapter[Iterator[Product]] = get_adapter(Iterator[Product])
+
+    # WHEN
+    with pytest.raises(ParseResponseError) as exc_info:
+        list(adapter.from_response(response))
+
+    # THEN
+    assert '{"title": "hat"}' == exc_info.value.text
+
+
+def test_pydantic_model_json_array() -> None:
+    # GIVEN
+    class Product(BaseModel):
+        name: str
+
+    chunks = [b'[{"name": "glasses"}, {"na', b'me": "hat"}]']
+    response = Mock(spec=Response, headers={}, iter_bytes=Mock(return_value=(chunk for chunk in chunks)))
+    adapter: TypeAdapter[Iterator[Product]] = get_adapter(Iterator[Product])
+
+    # WHEN
+    result = list(adapter.from_response(response))
+
+    # THEN
+    assert [Product(name="glasses"), Product(name="hat")] == result
+
+
+def test_unions_with_different_order_of_members_use_different_adapters() -> None:
+    # GIVEN
+    class Cat(BaseModel):
+        name: str
+
+    class Dog(BaseModel):
+        name: str
+
+    response = Mock(spec=Response, json=Mock(return_value={"name": "Rex"}))
+
+    # WHEN
+    cat_first = get_adapter(Union[Cat, Dog])
+    dog_first = get_adapter(Union[Dog, Cat])
+
+    # THEN
+    assert cat_first is get_adapter(Union[Cat, Dog])
+    assert cat_first is not dog_first
+    assert isinstance(dog_first.from_response(response), Dog)
+
+
+def test_pydantic_model_sequence_from_bytes() -> None:
+    # GIVEN
+    class ListElement(BaseModel):
+        name: str
+
+    response = Mock(spec=Response, read=Mock(return_value=b'[{"name":"123"}]'))
+    adapter: TypeAdapter[list[ListElement]] = get_adapter(list[ListElement])
+
+    # WHEN
+    result = adapter.from_response(response)
+
+    # THEN
+    assert [ListElement(name="123")] == result
+    response.json.assert_not_called()
+
+
+def test_pydantic_model_sequence_from_invalid_bytes() -> None:
+    # GIVEN
+    class ListElement(BaseModel):
+        name: str
+
+    response = Mock(spec=Response, read=Mock(return_value=b'[{"name":'), text=Mock(return_value='[{"name":'))
+    adapter: TypeAdapter[list[ListElement]] = get_adapter(list[ListElement])
+
+    # WHEN
+    with pytest.raises(ParseResponseError) as exc_info:
+        adapter.from_response(response)
+
+    # THEN
+    assert exc_info.value.text == '[{"name":'
+
+
+def test_pydantic_model_annotated_with_unhashable_metadata() -> None:
+    # GIVEN
+    class ListElement(BaseModel):
+        name: str
+
+    response = Mock(spec=Response, read=Mock(return_value=b'[{"name":"123"}]'))
+    adapter: TypeAdapter[list[ListElement]] = get_adapter(Annotated[list[ListElement], {"description": "elements"}])
+
+    # WHEN
+    result = adapter.from_response(response)
+
+    # THEN
+    assert [ListElement(name="123")] == result
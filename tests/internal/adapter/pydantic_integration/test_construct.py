@@ -0,0 +1,121 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional
+from unittest.mock import Mock
+
+import pytest
+from typing_extensions import TypedDict
+
+from meatie import ParseResponseError, Response
+from meatie.internal.adapter import ConstructTypeAdapter, TrustedTypeAdapter, get_adapter, trust_adapter
+
+pydantic = pytest.importorskip("pydantic")
+if not pydantic.VERSION.startswith("1."):
+    pytest.skip("models are constructed without validation only with pydantic 1.x", allow_module_level=True)
+BaseModel: type = pydantic.BaseModel
+
+
+class Owner(BaseModel):
+    id: int
+    created: datetime
+
+
+@dataclass
+class Tag:
+    name: str
+
+
+class Node(BaseModel):
+    name: str = pydantic.Field(alias="nodeName")
+    owner: Optional[Owner] = None
+    tags: list[Tag] = []
+    children: list["Node"] = []
+
+
+class Page(TypedDict):
+    items: list[Node]
+
+
+Node.update_forward_refs()
+
+
+def test_construct_does_not_validate_values() -> None:
+    # GIVEN
+    adapter = get_adapter(Owner)
+    assert isinstance(adapter, ConstructTypeAdapter)
+
+    # WHEN
+    owner: Any = adapter.construct({"id": "not a number", "created": "2025-01-01T00:00:00"})
+
+    # THEN
+    assert "not a number" == owner.id
+    assert datetime(2025, 1, 1) == owner.created
+    assert isinstance(owner, Owner)
+
+
+def test_construct_nested_types() -> None:
+    # GIVEN
+    adapter = get_adapter(Page)
+    assert isinstance(adapter, ConstructTypeAdapter)
+    value = {
+        "items": [
+            {
+                "nodeName": "root",
+                "owner": {"id": 1, "created": "2025-01-01T00:00:00"},
+                "tags": [{"name": "tag"}],
+                "children": [{"nodeName": "child"}],
+            }
+        ]
+    }
+
+    # WHEN
+    page = adapter.construct(value)
+
+    # THEN
+    node = page["items"][0]
+    assert "root" == node.name
+    assert Owner(id=1, created=datetime(2025, 1, 1)) == node.owner
+    assert [Tag(name="tag")] == node.tags
+    assert "child" == node.children[0].name
+    assert [] == node.children[0].children
+
+
+def test_trusted_adapter_wraps_parse_errors() -> None:
+    # GIVEN
+    response = Mock(spec=Response, json=Mock(return_value=[1, 2]), text=Mock(return_value="[1, 2]"))
+    adapter = trust_adapter(get_adapter(Owner), validation_ratio=0.0)
+
+    # WHEN
+    with pytest.raises(ParseResponseError) as exc_info:
+        adapter.from_response(response)
+
+    # THEN
+    assert "[1, 2]" == exc_info.value.text
+
+
+def test_trusted_adapter_validates_sample() -> None:
+    # GIVEN
+    response = Mock(spec=Response, json=Mock(return_value={"id": "not a number", "created": "2025-01-01T00:00:00"}))
+    adapter = get_adapter(Owner)
+    assert isinstance(adapter, ConstructTypeAdapter)
+
+    # WHEN
+    with pytest.raises(ParseResponseError):
+        TrustedTypeAdapter(adapter, validation_ratio=1.0).from_response(response)
+    owner = TrustedTypeAdapter(adapter, validation_ratio=0.0).from_response(response)
+
+    # THEN
+    assert "not a number" == owner.id
+
+
+def test_adapter_is_not_wrapped_if_all_responses_are_validated() -> None:
+    # GIVEN
+    adapter = get_adapter(Owner)
+
+    # WHEN
+    result = trust_adapter(adapter, validation_ratio=1.0)
+
+    # THEN
+    assert result is adapter
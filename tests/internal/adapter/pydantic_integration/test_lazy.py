@@ -0,0 +1,177 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+import json
+from typing import Any, Optional
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from meatie import AsyncResponse, Lazy, ParseResponseError, Response
+from meatie.internal.adapter import get_adapter
+
+pydantic = pytest.importorskip("pydantic")
+BaseModel: type = pydantic.BaseModel
+
+
+class Owner(BaseModel):
+    id: int
+    email: str
+
+
+class Item(BaseModel):
+    item_id: int = pydantic.Field(alias="itemId")
+    name: str
+    tags: list[str] = pydantic.Field(default_factory=list)
+    owner: Optional[Owner] = None
+
+
+def create_response(value: Any) -> Mock:
+    content = json.dumps(value).encode()
+    return Mock(spec=Response, read=Mock(return_value=content), text=Mock(return_value=content.decode()))
+
+
+def test_validates_fields_on_access() -> None:
+    # GIVEN
+    response = create_response({"itemId": "1", "name": "glasses", "owner": {"id": 2, "email": "a@b.c"}})
+    adapter = get_adapter(Lazy[Item])
+
+    # WHEN
+    result = adapter.from_response(response)
+
+    # THEN
+    assert 1 == result.item_id
+    assert "glasses" == result.name
+    assert Owner(id=2, email="a@b.c") == result.owner
+    assert result.owner is result.owner
+
+
+def test_returns_defaults_of_missing_fields() -> None:
+    # GIVEN
+    response = create_response({"itemId": 1, "name": "glasses"})
+    adapter = get_adapter(Lazy[Item])
+
+    # WHEN
+    result = adapter.from_response(response)
+
+    # THEN
+    assert [] == result.tags
+    assert result.owner is None
+
+
+def test_does_not_validate_fields_that_are_not_accessed() -> None:
+    # GIVEN
+    response = create_response({"itemId": 1, "name": "glasses", "owner": {"id": "unknown"}})
+    adapter = get_adapter(Lazy[Item])
+
+    # WHEN
+    result = adapter.from_response(response)
+
+    # THEN
+    assert "glasses" == result.name
+
+
+def test_invalid_field_raises_parse_error() -> None:
+    # GIVEN
+    response = create_response({"itemId": 1, "name": "glasses", "owner": {"id": "unknown"}})
+    adapter = get_adapter(Lazy[Item])
+    result = adapter.from_response(response)
+
+    # WHEN
+    with pytest.raises(ParseResponseError) as exc_info:
+        _ = result.owner
+
+    # THEN
+    assert response is exc_info.value.response
+
+
+def test_missing_required_field_raises_parse_error() -> None:
+    # GIVEN
+    response = create_response({"itemId": 1})
+    adapter = get_adapter(Lazy[Item])
+    result = adapter.from_response(response)
+
+    # WHEN
+    with pytest.raises(ParseResponseError):
+        _ = result.name
+
+
+def test_unknown_field_raises_attribute_error() -> None:
+    # GIVEN
+    response = create_response({"itemId": 1, "name": "glasses", "color": "red"})
+    adapter = get_adapter(Lazy[Item])
+    result = adapter.from_response(response)
+
+    # WHEN
+    with pytest.raises(AttributeError):
+        _ = result.color
+
+
+def test_materializes_model() -> None:
+    # GIVEN
+    response = create_response({"itemId": 1, "name": "glasses", "owner": {"id": 2, "email": "a@b.c"}})
+    adapter = get_adapter(Lazy[Item])
+    result = adapter.from_response(response)
+
+    # WHEN
+    model = result.materialize()
+
+    # THEN
+    assert Item(itemId=1, name="glasses", owner=Owner(id=2, email="a@b.c")) == model
+    assert model is result.materialize()
+
+
+def test_materialize_invalid_model_raises_parse_error() -> None:
+    # GIVEN
+    response = create_response({"itemId": 1, "owner": {"id": "unknown"}})
+    adapter = get_adapter(Lazy[Item])
+    result = adapter.from_response(response)
+
+    # WHEN
+    with pytest.raises(ParseResponseError):
+        result.materialize()
+
+
+def test_response_not_object_raises_parse_error() -> None:
+    # GIVEN
+    response = create_response([{"itemId": 1, "name": "glasses"}])
+    adapter = get_adapter(Lazy[Item])
+
+    # WHEN
+    with pytest.raises(ParseResponseError):
+        adapter.from_response(response)
+
+
+def test_repr_shows_accessed_fields() -> None:
+    # GIVEN
+    response = create_response({"itemId": 1, "name": "glasses"})
+    adapter = get_adapter(Lazy[Item])
+    result = adapter.from_response(response)
+
+    # WHEN
+    _ = result.name
+
+    # THEN
+    assert "Lazy[Item](name='glasses')" == repr(result)
+    assert {"item_id", "name", "tags", "owner", "materialize"} <= set(dir(result))
+
+
+async def test_from_async_response() -> None:
+    # GIVEN
+    content = json.dumps({"itemId": 1, "name": "glasses"}).encode()
+    response = Mock(spec=AsyncResponse, read=AsyncMock(return_value=content))
+    adapter = get_adapter(Lazy[Item])
+
+    # WHEN
+    result = await adapter.from_async_response(response)
+
+    # THEN
+    assert "glasses" == result.name
+
+
+def test_lazy_requires_model() -> None:
+    # WHEN
+    with pytest.raises(ValueError) as exc_info:
+        get_adapter(Lazy[dict[str, Any]])
+
+    # THEN
+    assert "Lazy requires a pydantic model" in str(exc_info.value)
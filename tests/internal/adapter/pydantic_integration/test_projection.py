@@ -0,0 +1,170 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+import json
+from typing import Annotated, Any, Literal, Optional
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from meatie import AsyncResponse, ParseResponseError, Response, projection
+from meatie.internal.adapter import get_adapter
+
+pytest.importorskip("pydantic")
+pytest.importorskip("msgspec")
+import pydantic  # noqa: E402
+
+from meatie.internal.adapter.projection import ProjectionAdapter  # noqa: E402
+
+BaseModel: type = pydantic.BaseModel
+
+
+class Owner(BaseModel):
+    id: int
+
+
+class Item(BaseModel):
+    item_id: int = pydantic.Field(alias="itemId")
+    owner: Optional[Owner] = None
+    tags: list[str] = pydantic.Field(default_factory=list)
+
+
+def create_response(value: Any) -> Mock:
+    content = json.dumps(value).encode()
+    return Mock(spec=Response, read=Mock(return_value=content), text=Mock(return_value=content.decode()))
+
+
+def test_decodes_fields_of_model() -> None:
+    # GIVEN
+    response = create_response(
+        [
+            {"itemId": 1, "name": "glasses", "owner": {"id": "2", "email": "a@b.c"}, "history": [{"id": 1}]},
+            {"itemId": 2, "tags": ["a", "b"]},
+        ]
+    )
+    adapter = get_adapter(Annotated[list[Item], projection()])
+
+    # WHEN
+    result = adapter.from_response(response)
+
+    # THEN
+    assert isinstance(adapter, ProjectionAdapter)
+    assert [Item(itemId=1, owner=Owner(id=2)), Item(itemId=2, tags=["a", "b"])] == result
+
+
+def test_invalid_value_raises_parse_error() -> None:
+    # GIVEN
+    response = create_response({"itemId": "unknown"})
+    adapter = get_adapter(Annotated[Item, projection()])
+
+    # WHEN
+    with pytest.raises(ParseResponseError) as exc_info:
+        adapter.from_response(response)
+
+    # THEN
+    assert response is exc_info.value.response
+    assert '{"itemId": "unknown"}' == exc_info.value.text
+
+
+def test_value_that_does_not_match_structure_raises_parse_error() -> None:
+    # GIVEN
+    response = create_response({"itemId": 1, "owner": [1, 2]})
+    adapter = get_adapter(Annotated[Item, projection()])
+
+    # WHEN
+    with pytest.raises(ParseResponseError):
+        adapter.from_response(response)
+
+
+def test_invalid_json_raises_parse_error() -> None:
+    # GIVEN
+    response = Mock(spec=Response, read=Mock(return_value=b"{'itemId': 1}"), text=Mock(return_value="{'itemId': 1}"))
+    adapter = get_adapter(Annotated[Item, projection()])
+
+    # WHEN
+    with pytest.raises(ParseResponseError):
+        adapter.from_response(response)
+
+
+async def test_from_async_response() -> None:
+    # GIVEN
+    content = json.dumps({"itemId": 1, "name": "glasses"}).encode()
+    response = Mock(spec=AsyncResponse, read=AsyncMock(return_value=content))
+    adapter = get_adapter(Annotated[Item, projection()])
+
+    # WHEN
+    result = await adapter.from_async_response(response)
+
+    # THEN
+    assert Item(itemId=1) == result
+
+
+def test_recursive_model() -> None:
+    # GIVEN
+    class Node(BaseModel):
+        id: int
+        children: list["Node"] = []
+
+    response = create_response({"id": 1, "name": "a", "children": [{"id": 2, "children": [{"id": 3}]}]})
+    adapter = get_adapter(Annotated[Node, projection()])
+
+    # WHEN
+    result = adapter.from_response(response)
+
+    # THEN
+    assert Node(id=1, children=[Node(id=2, children=[Node(id=3)])]) == result
+
+
+@pytest.mark.parametrize("extra", ["allow", "forbid"])
+def test_model_that_does_not_ignore_extra_fields_is_not_projected(extra: Literal["allow", "forbid"]) -> None:
+    # GIVEN
+    class Product(pydantic.BaseModel, extra=extra):
+        name: str
+
+    # WHEN
+    adapter = get_adapter(Annotated[Product, projection()])
+
+    # THEN
+    assert not isinstance(adapter, ProjectionAdapter)
+
+
+def test_model_with_before_validator_is_not_projected() -> None:
+    # GIVEN
+    if pydantic.VERSION.startswith("1."):
+
+        class Product(BaseModel):
+            name: str
+
+            @pydantic.root_validator(pre=True)
+            def rename(cls, values: dict[str, Any]) -> dict[str, Any]:
+                return {"name": values.get("title")}
+
+    else:
+
+        class Product(BaseModel):  # type: ignore[no-redef]
+            name: str
+
+            @pydantic.model_validator(mode="before")
+            @classmethod
+            def rename(cls, values: dict[str, Any]) -> dict[str, Any]:
+                return {"name": values.get("title")}
+
+    response = create_response({"title": "glasses"})
+    adapter = get_adapter(Annotated[Product, projection()])
+
+    # WHEN
+    result = adapter.from_response(response)
+
+    # THEN
+    assert "glasses" == result.name
+
+
+def test_projection_of_dict_has_no_effect() -> None:
+    # GIVEN
+    response = Mock(spec=Response, json=Mock(return_value={"key": "value"}))
+    adapter = get_adapter(Annotated[dict[str, Any], projection()])
+
+    # WHEN
+    result = adapter.from_response(response)
+
+    # THEN
+    assert {"key": "value"} == result
@@ -1,10 +1,14 @@
 #  Copyright 2024 The Meatie Authors. All rights reserved.
 #  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
 
+from collections.abc import AsyncIterator, Iterator
+from typing import Annotated, Any
 from unittest.mock import Mock
 
+import pytest
+
 from meatie import Response
-from meatie.internal.adapter import TypeAdapter, get_adapter
+from meatie.internal.adapter import JsonAdapter, JsonStreamAdapter, StreamAdapter, TypeAdapter, get_adapter
 
 
 def test_bytes_decoder() -> None:
@@ -45,6 +49,37 @@ def test_response_decoder() -> None:
     assert result is response
 
 
+def test_stream_decoder() -> None:
+    # GIVEN
+    chunks = iter([b"1", b"23"])
+    response = Mock(spec=Response, iter_bytes=Mock(return_value=chunks))
+    adapter = get_adapter(Iterator[bytes])
+
+    # WHEN
+    result = adapter.from_response(response)
+
+    # THEN
+    assert result is chunks
+
+
+@pytest.mark.parametrize("value_type", [Iterator[bytes], AsyncIterator[bytes]])
+def test_stream_types_use_stream_adapter(value_type: Any) -> None:
+    # WHEN
+    adapter = get_adapter(value_type)
+
+    # THEN
+    assert adapter is StreamAdapter
+
+
+def test_iterator_of_json_uses_json_stream_adapter() -> None:
+    # WHEN
+    adapter: TypeAdapter[Any] = get_adapter(Iterator[dict[str, Any]])
+
+    # THEN
+    assert isinstance(adapter, JsonStreamAdapter)
+    assert adapter.item_adapter is JsonAdapter
+
+
 def test_json_decoder() -> None:
     # GIVEN
     value = {"key": "123"}
@@ -56,3 +91,24 @@ def test_json_decoder() -> None:
 
     # THEN
     assert value == result
+
+
+def test_identical_types_share_adapter() -> None:
+    # WHEN
+    adapter = get_adapter(Iterator[dict[str, Any]])
+    other_adapter = get_adapter(Iterator[dict[str, Any]])
+
+    # THEN
+    assert adapter is other_adapter
+
+
+def test_annotated_type_with_unhashable_metadata() -> None:
+    # GIVEN
+    value = {"key": "123"}
+    response = Mock(spec=Response, json=Mock(return_value=value))
+
+    # WHEN
+    adapter = get_adapter(Annotated[dict[str, Any], {"description": "unhashable"}])
+
+    # THEN
+    assert adapter.from_response(response) == value
@@ -0,0 +1,400 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+import asyncio
+import json
+from http import HTTPStatus
+from typing import Any, AsyncGenerator, AsyncIterator, Generator, Iterator, Optional, cast
+from unittest.mock import Mock
+
+import pytest
+
+from meatie import JsonCodec, ParseResponseError, StdJsonCodec
+from meatie.internal.adapter import ChunkedJsonAdapter, JsonAdapter, get_adapter
+
+JSON_ARRAY = b""" [{"id": 1, "tags": ["a,b", "]"]}, {"name": "quote \\" and \\\\", "nested": [[1], {"x": {}}]},
+  "text", -12.5e3, true, null, [] ] """
+JSON_ARRAY_ITEMS = [
+    {"id": 1, "tags": ["a,b", "]"]},
+    {"name": 'quote " and \\', "nested": [[1], {"x": {}}]},
+    "text",
+    -12.5e3,
+    True,
+    None,
+    [],
+]
+
+
+class CountingCodec(StdJsonCodec):
+    def __init__(self) -> None:
+        self.loads_count = 0
+
+    def loads(self, data: bytes) -> Any:
+        self.loads_count += 1
+        return super().loads(data)
+
+
+CHUNKS = [b'{"id": 1}\n{"id"', b": 2}\n", b"\n", b'{"id": ', b"3", b"}\r\n", b'{"id": 4}']
+
+
+class FakeResponse:
+    def __init__(
+        self, chunks: list[bytes], headers: Optional[dict[str, str]] = None, json_codec: Optional[JsonCodec] = None
+    ) -> None:
+        self.chunks = chunks
+        self.status = HTTPStatus.OK
+        self.headers = headers or {}
+        self.json_codec = json_codec
+        self.consumed = 0
+        self.closed = False
+
+    def read(self) -> bytes:
+        return b"".join(self.chunks)
+
+    def text(self) -> str:
+        return self.read().decode()
+
+    def json(self) -> Any:
+        return json.loads(self.read())
+
+    def iter_bytes(self) -> Generator[bytes, None, None]:
+        try:
+            for chunk in self.chunks:
+                self.consumed += 1
+                yield chunk
+        finally:
+            self.closed = True
+
+
+class FakeAsyncResponse:
+    def __init__(self, chunks: list[bytes], headers: Optional[dict[str, str]] = None) -> None:
+        self.chunks = chunks
+        self.status = HTTPStatus.OK
+        self.headers = headers or {}
+        self.closed = False
+
+    async def read(self) -> bytes:
+        return b"".join(self.chunks)
+
+    async def text(self) -> str:
+        return (await self.read()).decode()
+
+    async def json(self) -> Any:
+        return json.loads(await self.read())
+
+    async def iter_bytes(self) -> AsyncGenerator[bytes, None]:
+        try:
+            for chunk in self.chunks:
+                yield chunk
+        finally:
+            self.closed = True
+
+
+def test_decodes_records_split_across_chunks() -> None:
+    # GIVEN
+    response = FakeResponse(CHUNKS)
+    adapter = get_adapter(Iterator[dict[str, Any]])
+
+    # WHEN
+    records = list(adapter.from_response(response))
+
+    # THEN
+    assert [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}] == records
+    assert response.closed
+
+
+def test_first_record_is_available_after_first_chunk() -> None:
+    # GIVEN
+    response = FakeResponse(CHUNKS)
+    adapter = get_adapter(Iterator[dict[str, Any]])
+
+    # WHEN
+    records = cast(Generator[dict[str, Any], None, None], adapter.from_response(response))
+    first_record = next(records)
+    records.close()
+
+    # THEN
+    assert {"id": 1} == first_record
+    assert 1 == response.consumed
+    assert response.closed
+
+
+def test_invalid_line_raises_parse_error() -> None:
+    # GIVEN
+    response = FakeResponse([b'{"id": 1}\n', b"{not json}\n"])
+    adapter = get_adapter(Iterator[dict[str, Any]])
+
+    # WHEN
+    records = adapter.from_response(response)
+    next(records)
+    with pytest.raises(ParseResponseError) as exc_info:
+        next(records)
+
+    # THEN
+    assert "{not json}" == exc_info.value.text
+    assert response.closed
+
+
+@pytest.mark.asyncio()
+async def test_decodes_records_from_async_response() -> None:
+    # GIVEN
+    response = FakeAsyncResponse(CHUNKS)
+    adapter = get_adapter(AsyncIterator[dict[str, Any]])
+
+    # WHEN
+    records = [record async for record in await adapter.from_async_response(response)]
+
+    # THEN
+    assert [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}] == records
+    assert response.closed
+
+
+@pytest.mark.parametrize(
+    "content_type", ["application/x-ndjson", "application/jsonl", "application/json-seq", "Application/X-NDJSON"]
+)
+def test_decodes_arrays_one_per_line_given_json_lines_content_type(content_type: str) -> None:
+    # GIVEN
+    response = FakeResponse([b"[1,2]\n[3]\n"], headers={"Content-Type": content_type})
+    adapter = get_adapter(Iterator[list[int]])
+
+    # WHEN
+    records = list(adapter.from_response(response))
+
+    # THEN
+    assert [[1, 2], [3]] == records
+
+
+@pytest.mark.asyncio()
+async def test_decodes_arrays_one_per_line_from_async_response_given_json_lines_content_type() -> None:
+    # GIVEN
+    response = FakeAsyncResponse(
+        [b"[1,", b"2]\n[3]\n"], headers={"Content-Type": "application/x-ndjson; charset=utf-8"}
+    )
+    adapter = get_adapter(AsyncIterator[list[int]])
+
+    # WHEN
+    records = [record async for record in await adapter.from_async_response(response)]
+
+    # THEN
+    assert [[1, 2], [3]] == records
+
+
+def test_decodes_json_text_sequence() -> None:
+    # GIVEN
+    response = FakeResponse([b'\x1e{"id": 1}\n\x1e{"id"', b": 2}\n"], headers={"Content-Type": "application/json-seq"})
+    adapter = get_adapter(Iterator[dict[str, Any]])
+
+    # WHEN
+    records = list(adapter.from_response(response))
+
+    # THEN
+    assert [{"id": 1}, {"id": 2}] == records
+
+
+def test_decodes_records_using_json_codec() -> None:
+    # GIVEN
+    codec = CountingCodec()
+    response = FakeResponse(CHUNKS, json_codec=codec)
+    adapter = get_adapter(Iterator[dict[str, Any]])
+
+    # WHEN
+    records = list(adapter.from_response(response))
+
+    # THEN
+    assert [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}] == records
+    assert 4 == codec.loads_count
+
+
+def test_request_body_is_not_supported() -> None:
+    # GIVEN
+    adapter = get_adapter(Iterator[dict[str, Any]])
+
+    # WHEN
+    with pytest.raises(RuntimeError) as exc_info:
+        adapter.to_content(iter([]))
+
+    # THEN
+    assert ("Streaming request body is not supported",) == exc_info.value.args
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1024])
+def test_decodes_json_array_split_across_chunks(chunk_size: int) -> None:
+    # GIVEN
+    chunks = [JSON_ARRAY[start : start + chunk_size] for start in range(0, len(JSON_ARRAY), chunk_size)]
+    response = FakeResponse(chunks)
+    adapter = get_adapter(Iterator[Any])
+
+    # WHEN
+    records = list(adapter.from_response(response))
+
+    # THEN
+    assert JSON_ARRAY_ITEMS == records
+    assert response.closed
+
+
+@pytest.mark.parametrize("content", [b"[]", b" [ ]\n", b"\n"])
+def test_decodes_empty_json_array(content: bytes) -> None:
+    # GIVEN
+    response = FakeResponse([content])
+    adapter = get_adapter(Iterator[Any])
+
+    # WHEN
+    records = list(adapter.from_response(response))
+
+    # THEN
+    assert [] == records
+
+
+def test_first_item_of_json_array_is_available_after_first_chunk() -> None:
+    # GIVEN
+    response = FakeResponse([b'[{"id": 1}, {"id"', b": 2}]"])
+    adapter = get_adapter(Iterator[dict[str, Any]])
+
+    # WHEN
+    records = adapter.from_response(response)
+    first_record = next(records)
+
+    # THEN
+    assert {"id": 1} == first_record
+    assert 1 == response.consumed
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b'[{"id": 1}',
+        b'[{"id": 1},]',
+        b'[,{"id": 1}]',
+        b'[{"id": 1}] {}',
+        b'[{"id": 1} {"id": 2}]',
+        b'[{"id": "1]',
+    ],
+)
+def test_invalid_json_array_raises_parse_error(content: bytes) -> None:
+    # GIVEN
+    response = FakeResponse([content])
+    adapter = get_adapter(Iterator[dict[str, Any]])
+
+    # WHEN
+    with pytest.raises(ParseResponseError):
+        list(adapter.from_response(response))
+
+    # THEN
+    assert response.closed
+
+
+@pytest.mark.asyncio()
+async def test_decodes_json_array_from_async_response() -> None:
+    # GIVEN
+    response = FakeAsyncResponse([JSON_ARRAY[:10], JSON_ARRAY[10:]])
+    adapter = get_adapter(AsyncIterator[Any])
+
+    # WHEN
+    records = [record async for record in await adapter.from_async_response(response)]
+
+    # THEN
+    assert JSON_ARRAY_ITEMS == records
+    assert response.closed
+
+
+class FakeBodyAsyncResponse:
+    def __init__(self, content: bytes, json_codec: Optional[JsonCodec] = None) -> None:
+        self.content = content
+        self.status = HTTPStatus.OK
+        self.headers: dict[str, str] = {}
+        self.json_codec = json_codec
+
+    async def read(self) -> bytes:
+        return self.content
+
+    async def text(self) -> str:
+        return self.content.decode()
+
+    async def json(self) -> Any:
+        return json.loads(self.content)
+
+    async def iter_bytes(self) -> AsyncGenerator[bytes, None]:
+        yield self.content
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize("chunk_size", [1, 7, 1024])
+async def test_chunked_adapter_decodes_json_array(chunk_size: int) -> None:
+    # GIVEN
+    response = FakeBodyAsyncResponse(JSON_ARRAY)
+    adapter: ChunkedJsonAdapter[list[Any]] = ChunkedJsonAdapter(JsonAdapter, threshold=0, chunk_size=chunk_size)
+
+    # WHEN
+    records = await adapter.from_async_response(response)
+
+    # THEN
+    assert JSON_ARRAY_ITEMS == records
+
+
+@pytest.mark.asyncio()
+async def test_chunked_adapter_decodes_json_array_using_json_codec() -> None:
+    # GIVEN
+    codec = CountingCodec()
+    response = FakeBodyAsyncResponse(JSON_ARRAY, json_codec=codec)
+    adapter: ChunkedJsonAdapter[list[Any]] = ChunkedJsonAdapter(JsonAdapter, threshold=0, chunk_size=16)
+
+    # WHEN
+    records = await adapter.from_async_response(response)
+
+    # THEN
+    assert JSON_ARRAY_ITEMS == records
+    assert 1 < codec.loads_count
+
+
+@pytest.mark.asyncio()
+async def test_chunked_adapter_yields_to_event_loop() -> None:
+    # GIVEN
+    response = FakeBodyAsyncResponse(JSON_ARRAY)
+    adapter: ChunkedJsonAdapter[list[Any]] = ChunkedJsonAdapter(JsonAdapter, threshold=0, chunk_size=8)
+    ticks = 0
+
+    async def tick() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    ticker = asyncio.ensure_future(tick())
+    await asyncio.sleep(0)
+
+    # WHEN
+    start = ticks
+    await adapter.from_async_response(response)
+    ticker.cancel()
+
+    # THEN
+    assert ticks - start > 1
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(("content", "threshold"), [(b'{"id": 1}', 0), (b'[{"id": 1}]', 1024)])
+async def test_chunked_adapter_decodes_small_body_or_object_in_single_call(content: bytes, threshold: int) -> None:
+    # GIVEN
+    response = FakeBodyAsyncResponse(content)
+    item_adapter = Mock(wraps=get_adapter(Any))
+    adapter = ChunkedJsonAdapter(item_adapter, threshold=threshold, chunk_size=1)
+
+    # WHEN
+    result = await adapter.from_async_response(response)
+
+    # THEN
+    assert json.loads(content) == result
+    item_adapter.from_json.assert_not_called()
+
+
+@pytest.mark.asyncio()
+async def test_chunked_adapter_reports_invalid_json_array() -> None:
+    # GIVEN
+    response = FakeBodyAsyncResponse(b'[{"id": 1}, {"id"')
+    adapter: ChunkedJsonAdapter[list[Any]] = ChunkedJsonAdapter(JsonAdapter, threshold=0, chunk_size=4)
+
+    # WHEN
+    with pytest.raises(ParseResponseError) as exc_info:
+        await adapter.from_async_response(response)
+
+    # THEN
+    assert '[{"id": 1}, {"id"' == exc_info.value.text
@@ -0,0 +1,97 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+from typing import Callable
+
+import pytest
+
+from meatie.internal.adapter.lazy_ import JsonObjectIndex, ObjectIndex
+
+
+def create_raw_object_index(content: bytes) -> ObjectIndex:
+    msgspec_ = pytest.importorskip("meatie.internal.adapter.msgspec_")
+    return msgspec_.create_object_index(content)
+
+
+@pytest.fixture(name="create_index", params=[JsonObjectIndex, create_raw_object_index], ids=["scan", "msgspec"])
+def create_index_fixture(request: pytest.FixtureRequest) -> Callable[[bytes], ObjectIndex]:
+    return request.param
+
+
+def test_finds_members(create_index: Callable[[bytes], ObjectIndex]) -> None:
+    # GIVEN
+    index = create_index(b' { "id" : 1, "name": "abc", "tags": ["a", "b"], "owner": {"id": 2}, "active": null } ')
+
+    # WHEN
+    members = [index.get(key) for key in ("owner", "id", "name", "tags", "active", "missing")]
+
+    # THEN
+    assert [b'{"id": 2}', b"1", b'"abc"', b'["a", "b"]', b"null", None] == members
+
+
+def test_skips_brackets_and_quotes_in_strings(create_index: Callable[[bytes], ObjectIndex]) -> None:
+    # GIVEN
+    index = create_index(b'{"a": {"text": "}]\\"{["}, "b": "\\"quoted\\"", "c": [{"d": "]"}], "e": true}')
+
+    # WHEN
+    members = [index.get(key) for key in ("e", "a", "b", "c")]
+
+    # THEN
+    assert [b"true", b'{"text": "}]\\"{["}', b'"\\"quoted\\""', b'[{"d": "]"}]'] == members
+
+
+def test_decodes_escaped_keys(create_index: Callable[[bytes], ObjectIndex]) -> None:
+    # GIVEN
+    index = create_index(b'{"caf\\u00e9": 1, "a\\"b": 2}')
+
+    # WHEN
+    members = [index.get("café"), index.get('a"b')]
+
+    # THEN
+    assert [b"1", b"2"] == members
+
+
+def test_scans_only_up_to_the_member() -> None:
+    # GIVEN
+    index = JsonObjectIndex(b'{"a": 1, "b": this is not json')
+
+    # WHEN
+    member = index.get("a")
+
+    # THEN
+    assert b"1" == member
+
+
+def test_empty_object(create_index: Callable[[bytes], ObjectIndex]) -> None:
+    # GIVEN
+    index = create_index(b"{}")
+
+    # WHEN
+    member = index.get("a")
+
+    # THEN
+    assert member is None
+
+
+@pytest.mark.parametrize("content", [b"", b"[1, 2]", b'"abc"', b"null"])
+def test_not_object_raises_value_error(create_index: Callable[[bytes], ObjectIndex], content: bytes) -> None:
+    # WHEN
+    with pytest.raises(ValueError):
+        create_index(content)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b'{"a": 1',
+        b'{"a": 1 "b": 2}',
+        b'{"a" 1}',
+        b"{a: 1}",
+        b'{"a": [1, 2}',
+        b'{"a": "abc}',
+        b'{"a": 1} []',
+    ],
+)
+def test_malformed_object_raises_value_error(create_index: Callable[[bytes], ObjectIndex], content: bytes) -> None:
+    # WHEN
+    with pytest.raises(ValueError):
+        create_index(content).get("missing")
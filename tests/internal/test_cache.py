@@ -1,13 +1,18 @@
 #  Copyright 2023 The Meatie Authors. All rights reserved.
 #  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+import time
+from typing import Any, Optional
+
+import pytest
 from typing_extensions import override
 
-from meatie.internal.cache import Cache
+from meatie import INF, CacheStats, TinyLfuCache
+from meatie.internal.cache import Cache, FrequencySketch, estimate_size, get_ttl
 
 
 class TimedCache(Cache):
-    def __init__(self, max_size: int) -> None:
-        super().__init__(max_size)
+    def __init__(self, max_size: Optional[int], **kwargs: Any) -> None:
+        super().__init__(max_size, **kwargs)
         self.current_time = 0.0
 
     @override
@@ -98,3 +103,295 @@ def test_cleanup_expired_before_old() -> None:
     assert cache.load("valid1") == "value2"
     assert cache.load("valid2") == "value3"
     assert cache.load("valid3") == "value4"
+
+
+def test_load_stale_returns_fresh_value() -> None:
+    # GIVEN a cache with a value that expires at 10
+    cache = TimedCache(max_size=1)
+    cache.store("key1", "value1", ttl=10, stale_ttl=5)
+
+    # WHEN the value is loaded at 4
+    cache.current_time = 4
+    entry = cache.load_stale("key1")
+
+    # THEN the value should be returned with negative staleness
+    assert ("value1", -6) == entry
+
+
+def test_load_stale_returns_expired_value_within_stale_period() -> None:
+    # GIVEN a cache with a value that expires at 10 and is stale until 15
+    cache = TimedCache(max_size=1)
+    cache.store("key1", "value1", ttl=10, stale_ttl=5)
+
+    # WHEN the value is loaded at 13
+    cache.current_time = 13
+
+    # THEN load should not return the expired value, but load_stale should
+    assert cache.load("key1") is None
+    assert ("value1", 3) == cache.load_stale("key1")
+
+
+def test_load_stale_deletes_value_after_stale_period() -> None:
+    # GIVEN a cache with a value that expires at 10 and is stale until 15
+    cache = TimedCache(max_size=1)
+    cache.store("key1", "value1", ttl=10, stale_ttl=5)
+
+    # WHEN the value is loaded at 16
+    cache.current_time = 16
+
+    # THEN the value should no longer be available
+    assert cache.load_stale("key1") is None
+    assert cache.load("key1") is None
+
+
+def test_cleanup_keeps_stale_values() -> None:
+    # GIVEN a cache with a max size of 2 with a value that is stale until 15
+    cache = TimedCache(max_size=2)
+    cache.store("stale", "value1", ttl=10, stale_ttl=5)
+    cache.store("expired", "value2", ttl=10)
+
+    # WHEN another item is added to the cache at 12
+    cache.current_time = 12
+    cache.store("valid", "value3", ttl=10)
+
+    # THEN the expired value should be removed, and the stale value should remain
+    assert ("value1", 2) == cache.load_stale("stale")
+    assert cache.load_stale("expired") is None
+    assert cache.load("valid") == "value3"
+
+
+@pytest.mark.parametrize(
+    "headers,expected",
+    [
+        ({}, 60),
+        ({"Cache-Control": "public, max-age=10"}, 10),
+        ({"Cache-Control": 'max-age="10"', "Age": "4"}, 6),
+        ({"Cache-Control": "max-age=10", "Age": "20"}, 0),
+        ({"Cache-Control": "max-age=10", "Expires": "Mon, 01 Sep 2025 10:00:00 GMT"}, 10),
+        ({"Cache-Control": "no-cache"}, 0),
+        ({"Cache-Control": "private, no-store"}, None),
+        ({"Expires": "Mon, 01 Sep 2025 10:00:30 GMT", "Date": "Mon, 01 Sep 2025 10:00:00 GMT"}, 30),
+        ({"Expires": "0"}, 0),
+    ],
+)
+def test_get_ttl(headers: dict[str, str], expected: Optional[float]) -> None:
+    # WHEN
+    ttl = get_ttl(headers, default=60)
+
+    # THEN
+    assert expected == ttl
+
+
+def test_evicts_least_recently_used_items_over_byte_budget() -> None:
+    # GIVEN a cache with a budget of 100 bytes
+    cache = TimedCache(max_size=None, max_bytes=100)
+    cache.store("key1", "value1", ttl=10, size=40)
+    cache.store("key2", "value2", ttl=10, size=40)
+    cache.load("key1")
+
+    # WHEN an item that exceeds the budget is added
+    cache.store("key3", "value3", ttl=10, size=30)
+
+    # THEN the least recently used item should be evicted
+    assert cache.load("key1") == "value1"
+    assert cache.load("key2") is None
+    assert cache.load("key3") == "value3"
+    assert CacheStats(entries=2, bytes=70, evictions=1) == cache.stats()
+
+
+def test_does_not_store_item_larger_than_byte_budget() -> None:
+    # GIVEN
+    cache = TimedCache(max_size=None, max_bytes=100)
+    cache.store("key1", "value1", ttl=10, size=40)
+
+    # WHEN
+    cache.store("key1", "value2", ttl=10, size=101)
+
+    # THEN
+    assert cache.load("key1") is None
+    assert CacheStats(entries=0, bytes=0, evictions=0) == cache.stats()
+
+
+def test_charges_size_returned_by_sizer() -> None:
+    # GIVEN
+    cache = TimedCache(max_size=None, max_bytes=100, sizer=len)
+    cache.store("key1", "a" * 30, ttl=10)
+
+    # WHEN the item is replaced
+    cache.store("key1", "a" * 50, ttl=10)
+
+    # THEN only the size of the new item should be charged
+    assert CacheStats(entries=1, bytes=50, evictions=0) == cache.stats()
+
+
+def test_delete_releases_bytes() -> None:
+    # GIVEN
+    cache = TimedCache(max_size=None, max_bytes=100)
+    cache.store("key1", "value1", ttl=10, size=40)
+
+    # WHEN
+    cache.delete("key1")
+
+    # THEN
+    assert CacheStats(entries=0, bytes=0, evictions=0) == cache.stats()
+
+
+def test_estimate_size_includes_referenced_objects() -> None:
+    # GIVEN
+    value = {"items": [{"name": "a" * 1000}, {"name": "b" * 1000}]}
+
+    # WHEN
+    size = estimate_size(value)
+
+    # THEN
+    assert 2000 < size
+
+
+def test_sweep_removes_expired_items() -> None:
+    # GIVEN
+    cache = TimedCache(max_size=10)
+    cache.store("expired1", "value1", ttl=5)
+    cache.store("stale", "value2", ttl=5, stale_ttl=10)
+    cache.store("expired2", "value3", ttl=8)
+    cache.store("valid", "value4", ttl=20)
+
+    # WHEN
+    cache.current_time = 10
+    removed = cache.sweep()
+
+    # THEN
+    assert 2 == removed
+    assert CacheStats(entries=2, bytes=0, evictions=0) == cache.stats()
+    assert ("value2", 5) == cache.load_stale("stale")
+    assert "value4" == cache.load("valid")
+
+
+def test_sweep_keeps_replaced_item() -> None:
+    # GIVEN an item that expires at 5 and is replaced by an item that expires at 20
+    cache = TimedCache(max_size=10)
+    cache.store("key1", "value1", ttl=5)
+    cache.store("key1", "value2", ttl=20)
+
+    # WHEN
+    cache.current_time = 10
+    removed = cache.sweep()
+
+    # THEN
+    assert 0 == removed
+    assert "value2" == cache.load("key1")
+
+
+def test_expiry_index_does_not_grow_with_replaced_items() -> None:
+    # GIVEN
+    cache = TimedCache(max_size=10)
+
+    # WHEN
+    for index in range(1000):
+        cache.store("key1", index, ttl=10)
+
+    # THEN
+    assert len(cache._expiry) <= 100
+
+
+def test_background_sweeper_removes_expired_items() -> None:
+    # GIVEN
+    cache = Cache(sweep_interval=0.001)
+
+    # WHEN
+    cache.store("key1", "value1", ttl=0)
+
+    # THEN
+    deadline = time.monotonic() + 5
+    while cache.stats().entries:
+        assert time.monotonic() < deadline, "the expired item was not removed in time"
+        time.sleep(0.001)
+
+
+def lookup(cache: Cache, key: str) -> bool:
+    if cache.load(key) is not None:
+        return True
+    cache.store(key, key, ttl=INF)
+    return False
+
+
+def count_hot_hits(cache: Cache) -> int:
+    # 50 items are looked up in every round, each round also looks up 100 items only once
+    hits = 0
+    for round_ in range(20):
+        hits = sum(lookup(cache, f"hot{index}") for index in range(50))
+        for index in range(100):
+            lookup(cache, f"scan{round_}-{index}")
+    return hits
+
+
+def test_tiny_lfu_cache_keeps_frequent_items_during_scan() -> None:
+    # GIVEN
+    lru_cache = Cache(max_size=100)
+    tiny_lfu_cache = TinyLfuCache(max_size=100)
+
+    # WHEN
+    lru_hits = count_hot_hits(lru_cache)
+    tiny_lfu_hits = count_hot_hits(tiny_lfu_cache)
+
+    # THEN the frequent items should be flushed from the lru cache, but not from the tiny lfu cache
+    assert 0 == lru_hits
+    assert 45 <= tiny_lfu_hits
+    assert tiny_lfu_cache.stats().entries <= 100
+
+
+def test_tiny_lfu_cache_admits_new_frequent_item() -> None:
+    # GIVEN a full cache
+    cache = TinyLfuCache(max_size=10)
+    for index in range(10):
+        lookup(cache, f"old{index}")
+
+    # WHEN a new item is looked up more often than the old items
+    for _ in range(5):
+        lookup(cache, "new")
+        lookup(cache, "other")
+
+    # THEN
+    assert "new" == cache.load("new")
+    assert 10 == cache.stats().entries
+
+
+def test_tiny_lfu_cache_evicts_items_over_byte_budget() -> None:
+    # GIVEN
+    cache = TinyLfuCache(max_size=10, max_bytes=100)
+
+    # WHEN
+    for index in range(5):
+        cache.store(f"key{index}", index, ttl=INF, size=40)
+
+    # THEN
+    assert CacheStats(entries=2, bytes=80, evictions=3) == cache.stats()
+
+
+def test_tiny_lfu_cache_with_non_positive_size_raises_value_error() -> None:
+    # WHEN
+    with pytest.raises(ValueError) as exc_info:
+        TinyLfuCache(max_size=0)
+
+    # THEN
+    assert "max_size" in str(exc_info.value)
+
+
+def test_frequency_sketch_counts_and_ages_lookups() -> None:
+    # GIVEN
+    sketch = FrequencySketch(16)
+
+    # WHEN
+    for _ in range(20):
+        sketch.increment("key1")
+    sketch.increment("key2")
+
+    # THEN the counters should saturate at 15
+    assert 15 == sketch.frequency("key1")
+    assert 1 <= sketch.frequency("key2")
+
+    # WHEN the sample size is reached
+    for index in range(sketch.sample_size):
+        sketch.increment(f"other{index}")
+
+    # THEN the counters should be halved
+    assert sketch.frequency("key1") <= 8
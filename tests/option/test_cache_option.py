@@ -0,0 +1,20 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+from typing import Any
+
+import pytest
+
+from meatie import cache
+
+
+@pytest.mark.parametrize("parameter", ["stale_while_revalidate", "stale_if_error"])
+def test_negative_stale_period_raises_value_error(parameter: str) -> None:
+    # GIVEN
+    options: dict[str, Any] = {parameter: -1}
+
+    # WHEN
+    with pytest.raises(ValueError) as exc_info:
+        cache(ttl=10, **options)
+
+    # THEN
+    assert parameter in str(exc_info.value)
@@ -0,0 +1,27 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from meatie import AsyncEndpointDescriptor, chunked
+
+
+def test_option_sets_threshold_and_chunk_size() -> None:
+    # GIVEN
+    descriptor: AsyncEndpointDescriptor[Any, Any] = AsyncEndpointDescriptor(Mock(), Mock())
+
+    # WHEN
+    chunked(threshold=1024, chunk_size=128)(descriptor)
+
+    # THEN
+    assert 1024 == descriptor.chunk_threshold
+    assert 128 == descriptor.chunk_size
+
+
+@pytest.mark.parametrize(("threshold", "chunk_size"), [(-1, 1), (0, 0)])
+def test_invalid_arguments(threshold: int, chunk_size: int) -> None:
+    # WHEN
+    with pytest.raises(ValueError):
+        chunked(threshold=threshold, chunk_size=chunk_size)
@@ -0,0 +1,50 @@
+#  Copyright 2025 The Meatie Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from meatie import EndpointDescriptor, trusted
+from meatie.internal.adapter import ConstructTypeAdapter, TrustedTypeAdapter, trust_adapter
+
+
+def test_option_sets_validation_ratio() -> None:
+    # GIVEN
+    descriptor: EndpointDescriptor[Any, Any] = EndpointDescriptor(Mock(), Mock())
+
+    # WHEN
+    trusted(validation_ratio=0.25)(descriptor)
+
+    # THEN
+    assert 0.25 == descriptor.validation_ratio
+
+
+@pytest.mark.parametrize("validation_ratio", [-0.1, 1.1])
+def test_validation_ratio_out_of_range(validation_ratio: float) -> None:
+    # WHEN
+    with pytest.raises(ValueError):
+        trusted(validation_ratio=validation_ratio)
+
+
+def test_adapter_without_construct_is_not_wrapped() -> None:
+    # GIVEN
+    adapter = Mock(spec=["from_response", "from_async_response", "to_content"])
+
+    # WHEN
+    result = trust_adapter(adapter, validation_ratio=0.0)
+
+    # THEN
+    assert result is adapter
+
+
+def test_adapter_with_construct_is_wrapped() -> None:
+    # GIVEN
+    adapter = Mock(spec=ConstructTypeAdapter)
+
+    # WHEN
+    result = trust_adapter(adapter, validation_ratio=0.0)
+
+    # THEN
+    assert isinstance(result, TrustedTypeAdapter)
+    assert result.adapter is adapter
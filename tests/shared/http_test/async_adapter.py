@@ -1,7 +1,7 @@
 #  Copyright 2024 The Meatie Authors. All rights reserved.
 #  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
 from asyncio import AbstractEventLoop
-from typing import Any, Optional
+from typing import Any, Generator, Mapping, Optional
 
 from typing_extensions import Self
 
@@ -18,6 +18,10 @@ class ResponseAdapter:
     def status(self) -> int:
         return self.response.status
 
+    @property
+    def headers(self) -> Mapping[str, str]:
+        return self.response.headers
+
     def read(self) -> bytes:
         return self.loop.run_until_complete(self.response.read())
 
@@ -27,6 +31,17 @@ class ResponseAdapter:
     def json(self) -> dict[str, Any]:
         return self.loop.run_until_complete(self.response.json())
 
+    def iter_bytes(self) -> Generator[bytes, None, None]:
+        chunks = self.response.iter_bytes()
+        try:
+            while True:
+                try:
+                    yield self.loop.run_until_complete(chunks.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            self.loop.run_until_complete(chunks.aclose())
+
 
 class ClientAdapter(Client):
     def __init__(self, loop: AbstractEventLoop, client: AsyncClient) -> None:
@@ -1,22 +1,33 @@
 #  Copyright 2024 The Meatie Authors. All rights reserved.
 #  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
 
+import json as jsonlib
 from http import HTTPStatus
-from typing import Any
+from typing import Any, Optional
 from unittest.mock import AsyncMock, Mock
 
 from aiohttp import ClientResponse, ClientResponseError, ClientSession, RequestInfo
+from multidict import CIMultiDict, CIMultiDictProxy
 
 
 class MockTools:
     @staticmethod
-    def json_response(json: Any, status: int = HTTPStatus.OK) -> Mock:
-        return Mock(spec=ClientResponse, status=status, json=AsyncMock(return_value=json))
+    def json_response(json: Any, status: int = HTTPStatus.OK, headers: Optional[dict[str, str]] = None) -> Mock:
+        read = AsyncMock(return_value=jsonlib.dumps(json).encode())
+        return Mock(
+            spec=ClientResponse,
+            status=status,
+            json=AsyncMock(return_value=json),
+            read=read,
+            headers=CIMultiDictProxy(CIMultiDict(headers or {})),
+        )
 
     @staticmethod
     def json_client_response_error(status: int) -> Mock:
-        json = AsyncMock(side_effect=ClientResponseError(Mock(spec=RequestInfo), (), status=status))
-        return Mock(spec=ClientResponse, status=status, json=json)
+        error = ClientResponseError(Mock(spec=RequestInfo), (), status=status)
+        return Mock(
+            spec=ClientResponse, status=status, json=AsyncMock(side_effect=error), read=AsyncMock(side_effect=error)
+        )
 
     @staticmethod
     def session_with_json_response(json: Any, status: int = HTTPStatus.OK) -> Mock:
@@ -2,17 +2,20 @@
 #  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
 
 from http import HTTPStatus
-from typing import Any
+from typing import Any, Optional
 from unittest.mock import Mock
 
 from requests import Response, Session
 from requests.exceptions import JSONDecodeError
+from requests.structures import CaseInsensitiveDict
 
 
 class MockTools:
     @staticmethod
-    def json_response(json: Any, status: int = HTTPStatus.OK) -> Mock:
-        return Mock(spec=Response, status_code=status, json=Mock(return_value=json))
+    def json_response(json: Any, status: int = HTTPStatus.OK, headers: Optional[dict[str, str]] = None) -> Mock:
+        return Mock(
+            spec=Response, status_code=status, json=Mock(return_value=json), headers=CaseInsensitiveDict(headers)
+        )
 
     @staticmethod
     def json_client_response_error(status: int) -> Mock:
@@ -1,14 +1,13 @@
 #  Copyright 2024 The Meatie Authors. All rights reserved.
 #  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
 from http import HTTPStatus
-from json import JSONDecodeError
 
 import pytest
 from http_test import (
     HTTPSTestServer,
     HTTPTestServer,
 )
-from http_test.handlers import Handler, StatusHandler, diagnostic_handler, echo_handler
+from http_test.handlers import Handler, StatusHandler, diagnostic_handler, echo_handler, echo_json_handler
 
 from meatie import (
     ParseResponseError,
@@ -102,6 +101,19 @@ class DefaultSuite:
         assert HTTPStatus.OK == response.status
         assert {"key": "123"} == response.json()
 
+    @staticmethod
+    def test_can_send_post_json_request_with_content_type(http_server: HTTPTestServer, client: Client) -> None:
+        # GIVEN
+        http_server.handler = echo_json_handler
+        request = Request("POST", http_server.base_url, params={}, headers={}, json=[{"key": "123"}, None])
+
+        # WHEN
+        response = client.send(request)
+
+        # THEN
+        assert HTTPStatus.OK == response.status
+        assert [{"key": "123"}, None] == response.json()
+
     @staticmethod
     def test_can_receive_4xx_status(http_server: HTTPTestServer, client: Client) -> None:
         # GIVEN
@@ -170,7 +182,8 @@ class DefaultSuite:
         assert exc.response is not None
         assert "{invalid-json}" == exc.text
         assert HTTPStatus.OK == exc.response.status
-        assert isinstance(exc.__cause__, JSONDecodeError)
+        # JSON codecs report invalid documents by raising ValueError, e.g., JSONDecodeError or msgspec.DecodeError
+        assert isinstance(exc.__cause__, ValueError)
 
     @staticmethod
     def test_can_handle_connection_reset(http_server: HTTPTestServer, client: Client) -> None:
@@ -2,7 +2,8 @@
 #  Use of this source code is governed by a BSD-style license that can be found in the LICENSE file.
 
 import inspect
-from typing import Annotated, Any, Optional
+import json
+from typing import Annotated, Any, Iterator, Optional
 from unittest.mock import Mock
 
 import pytest
@@ -165,6 +166,60 @@ def test_create_template_from_signature_with_parameter_with_default_value() -> N
     assert [Parameter(Kind.QUERY, "limit", "limit", 100)] == request.params
 
 
+@pytest.mark.parametrize("compiled", [True, False])
+def test_create_template_for_streaming_response(compiled: bool) -> None:
+    # GIVEN
+    path_template = PathTemplate.from_string("/api/v1/exports/{export_id}")
+
+    def get_export(export_id: int) -> Iterator[bytes]: ...
+
+    template: RequestTemplate[None] = RequestTemplate.from_callable(get_export, path_template, "GET")
+    if not compiled:
+        template = RequestTemplate(template.template, template.params, JsonAdapter, "GET", compiled=False, stream=True)
+
+    # WHEN
+    request = template.build_request(1)
+
+    # THEN
+    assert template.stream
+    assert request.stream
+
+
+class BytesEncoder:
+    @staticmethod
+    def from_response(response: Any) -> Any: ...
+
+    @staticmethod
+    async def from_async_response(response: Any) -> Any: ...
+
+    @staticmethod
+    def to_content(value: Any) -> Any:
+        return value
+
+    @staticmethod
+    def to_json(value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":")).encode()
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+def test_build_request_with_body_encoded_to_bytes(compiled: bool) -> None:
+    # GIVEN
+    path_template = PathTemplate.from_string("/api/v1/order")
+    params = [Parameter(Kind.BODY, "body", "body")]
+    template: RequestTemplate[Any] = RequestTemplate(path_template, params, BytesEncoder(), "POST", compiled=compiled)
+
+    # WHEN
+    request = template.build_request([{"name": "Pencil"}])
+    empty_request = template.build_request(None)
+
+    # THEN
+    assert b'[{"name":"Pencil"}]' == request.data
+    assert request.json is None
+    assert {"Content-Type": "application/json"} == request.headers
+    assert empty_request.data is None
+    assert {} == empty_request.headers
+
+
 def test_create_template_from_signature_with_optional_parameter() -> None:
     # GIVEN
     path_template = PathTemplate.from_string("/api/v1/orders")
@@ -179,3 +234,97 @@ def test_create_template_from_signature_with_optional_parameter() -> None:
     assert "GET" == request.method
     assert path_template == request.template
     assert [Parameter(Kind.QUERY, "offset", "offset", None)] == request.params
+
+
+class Filter:
+    def __init__(self, **kwargs: Any) -> None:
+        self.kwargs = kwargs
+
+    def unwrap(self) -> dict[str, Any]:
+        return self.kwargs
+
+
+@pytest.mark.parametrize(
+    ("args", "kwargs"),
+    [
+        ((7,), {}),
+        ((7, "price"), {}),
+        ((), {"type": 7, "sort_by": "price"}),
+        ((7,), {"limit": None, "flt": Filter(status="open", page=2)}),
+        ((7, None, 10), {"body": {"name": "Pencil"}}),
+    ],
+)
+def test_compiled_builder_matches_generic_implementation(args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+    # GIVEN
+    path_template = PathTemplate.from_string("/api/v1/order/{order_id}/position")
+
+    def post_position(
+        type: Annotated[int, api_ref("order_id")],
+        sort_by: Annotated[Optional[str], api_ref("orderBy")] = None,
+        limit: int = 100,
+        flt: Optional[Filter] = None,
+        body: Optional[dict[str, Any]] = None,
+    ) -> None:
+        return None
+
+    template: RequestTemplate[Any] = RequestTemplate.from_callable(post_position, path_template, "POST")
+
+    # WHEN
+    compiled_request = template.build_request(*args, **kwargs)
+    generic_request = template.build_generic_request(*args, **kwargs)
+
+    # THEN
+    assert generic_request == compiled_request
+
+
+def test_compiled_builder_reports_unknown_parameter() -> None:
+    # GIVEN
+    template = RequestTemplate(
+        PathTemplate.from_string("/api/v1/orders"),
+        [Parameter(Kind.QUERY, "limit", "limit", 100)],
+        NoneAdapter,
+        "GET",
+    )
+
+    # WHEN
+    with pytest.raises(ValueError) as exc_info:
+        template.build_request(offset=10)
+
+    # THEN
+    assert "Parameter 'offset' is not mentioned in the endpoint definition." == str(exc_info.value)
+
+
+def test_compiled_builder_allows_keyword_to_override_positional_argument() -> None:
+    # GIVEN
+    template = RequestTemplate(
+        PathTemplate.from_string("/api/v1/orders"),
+        [Parameter(Kind.QUERY, "limit", "limit", 100)],
+        NoneAdapter,
+        "GET",
+    )
+
+    # WHEN
+    request = template.build_request(10, limit=20)
+
+    # THEN
+    assert {"limit": 20} == request.params
+
+
+def test_compiled_builder_propagates_formatter_type_error() -> None:
+    # GIVEN
+    def fail(_: Any) -> Any:
+        raise TypeError("formatter")
+
+    template = RequestTemplate(
+        PathTemplate.from_string("/api/v1/orders"),
+        [Parameter(Kind.QUERY, "since", "since", formatter=fail)],
+        NoneAdapter,
+        "GET",
+    )
+
+    # WHEN
+    with pytest.raises(TypeError) as exc_info:
+        template.build_request(since=1)
+
+    # THEN
+    assert ("formatter",) == exc_info.value.args